@@ -1,6 +1,4 @@
 import streamlit as st
-import json
-import os
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
@@ -13,8 +11,6 @@ logger = setup_logger("streamlit_dashboard")
 logger.info("Starting Streamlit Dashboard")
 
 # Constants
-UPDATES_FILE = os.path.join('data', 'recovery_updates.json')
-CAMPAIGNS_FILE = os.path.join('data', 'campaigns.json')
 CACHE_REFRESH_SECONDS = 900  # 15 minutes
 
 def _convert_to_float(value: Any) -> Optional[float]:
@@ -74,41 +70,36 @@ class DashboardManager:
         self._load_campaigns()
 
     def _load_updates(self) -> None:
-        """Load updates from file"""
+        """Load updates from the bot's state storage"""
         try:
-            if not os.path.exists(UPDATES_FILE):
-                logger.warning(f"Updates file not found: {UPDATES_FILE}")
+            update_index = self.data_manager.update_index
+            if not update_index.lenders:
+                logger.warning("No cached updates found")
                 return
 
-            with open(UPDATES_FILE, 'r') as f:
-                raw_updates = json.load(f)
-
             self.updates = []
-            for update in raw_updates:
-                if "items" not in update:
-                    continue
-
-                lender_id = update.get('lender_id')
+            for lender_key, records in update_index.by_lender.items():
+                lender_id = update_index.lenders[lender_key].get('lender_id')
                 company_name = self.data_manager.get_company_name(lender_id)
 
-                items = []
-                for year_data in update["items"]:
-                    for item in year_data.get("items", []):
-                        items.append(UpdateItem(
-                            date=item.get('date', ''),
-                            description=item.get('description', ''),
-                            year=year_data.get('year'),
-                            status=item.get('status', year_data.get('status', '')).replace('_', ' ').title(),
-                            substatus=item.get('substatus', year_data.get('substatus', '')),
-                            recovered_amount=_convert_to_float(item.get('recoveredAmount')),
-                            remaining_amount=_convert_to_float(item.get('remainingAmount')),
-                            expected_recovery_from=_convert_to_float(item.get('expectedRecoveryFrom')),
-                            expected_recovery_to=_convert_to_float(item.get('expectedRecoveryTo')),
-                            recovery_year_from=item.get('expectedRecoveryYearFrom'),
-                            recovery_year_to=item.get('expectedRecoveryYearTo'),
-                            is_recovered_amount_increased=item.get('isRecoveredAmountIncreased'),
-                            is_remaining_amount_increased=item.get('isRemainingAmountIncreased')
-                        ))
+                items = [
+                    UpdateItem(
+                        date=record.get('date', ''),
+                        description=record.get('description', ''),
+                        year=record.get('year'),
+                        status=(record.get('status') or '').replace('_', ' ').title(),
+                        substatus=record.get('substatus', ''),
+                        recovered_amount=_convert_to_float(record.get('recoveredAmount')),
+                        remaining_amount=_convert_to_float(record.get('remainingAmount')),
+                        expected_recovery_from=_convert_to_float(record.get('expectedRecoveryFrom')),
+                        expected_recovery_to=_convert_to_float(record.get('expectedRecoveryTo')),
+                        recovery_year_from=record.get('expectedRecoveryYearFrom'),
+                        recovery_year_to=record.get('expectedRecoveryYearTo'),
+                        is_recovered_amount_increased=record.get('isRecoveredAmountIncreased'),
+                        is_remaining_amount_increased=record.get('isRemainingAmountIncreased')
+                    )
+                    for record in records
+                ]
 
                 self.updates.append(CompanyUpdate(
                     company_name=company_name,
@@ -122,15 +113,13 @@ class DashboardManager:
             self.updates = []
             
     def _load_campaigns(self) -> None:
-        """Load campaigns from file"""
+        """Load campaigns from the bot's state storage"""
         try:
-            if not os.path.exists(CAMPAIGNS_FILE):
-                logger.warning(f"Campaigns file not found: {CAMPAIGNS_FILE}")
+            raw_campaigns = self.data_manager.load_previous_campaigns()
+            if not raw_campaigns:
+                logger.warning("No cached campaigns found")
                 return
 
-            with open(CAMPAIGNS_FILE, 'r') as f:
-                raw_campaigns = json.load(f)
-
             self.campaigns = []
             for campaign in raw_campaigns:
                 if not campaign.get('id'):
@@ -3,11 +3,10 @@ Base manager class providing common functionality
 Reduces code duplication across manager classes.
 """
 import os
-import json
 import logging
-from typing import Any, Dict, List, Optional
-from .utils import FileBackupManager
+from typing import Any
 from .constants import DATA_DIR
+from .storage import get_storage
 
 logger = logging.getLogger(__name__)
 
@@ -18,36 +17,35 @@ class BaseManager:
         """Initialize base manager
         
         Args:
-            data_file: Path to the main data file
+            data_file: Path to the main data file; its base name is the storage namespace
             backup_enabled: Whether to enable automatic backups
         """
         self.data_file = data_file
         self.backup_file = f"{data_file}.bak" if backup_enabled else None
+        self.namespace = os.path.splitext(os.path.basename(data_file))[0]
         self.ensure_data_directory()
+        self.storage = get_storage()
     
     def ensure_data_directory(self) -> None:
         """Ensure data directory exists"""
         os.makedirs(DATA_DIR, exist_ok=True)
     
     def load_data(self, default: Any = None) -> Any:
-        """Load data from file with backup fallback"""
-        return FileBackupManager.safe_json_load(self.data_file, default)
+        """Load data from storage"""
+        return self.storage.load_document(self.namespace, default)
     
     def save_data(self, data: Any) -> bool:
-        """Save data to file with backup"""
-        return FileBackupManager.safe_json_save(
-            self.data_file, 
-            data, 
-            create_backup=self.backup_file is not None
+        """Save data to storage with backup"""
+        return self.storage.save_document(
+            self.namespace,
+            data,
+            backup=self.backup_file is not None
         )
     
     def get_file_age(self) -> float:
-        """Get age of data file in seconds"""
+        """Get age of stored data in seconds"""
         try:
-            if os.path.exists(self.data_file):
-                import time
-                return time.time() - os.path.getmtime(self.data_file)
-            return float('inf')
+            return self.storage.document_age(self.namespace)
         except Exception as e:
             logger.error(f"Error getting file age: {e}")
-            return float('inf')
\ No newline at end of file
+            return float('inf')
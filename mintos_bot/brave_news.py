@@ -3,8 +3,6 @@ Brave API News Search Integration
 Uses Brave Search API to find news articles, then processes them with OpenAI
 """
 
-import asyncio
-import aiohttp
 import json
 import os
 from datetime import datetime, timedelta
@@ -14,6 +12,10 @@ from dataclasses import dataclass, asdict
 
 from .logger import setup_logger
 from .config_loader import load_brave_key
+from .config import BRAVE_REQUESTS_PER_SECOND, BRAVE_MAX_RETRIES
+from .http_client import get_http_client
+from .rate_limiter import TokenBucket
+from .search_cache import get_search_cache
 
 logger = setup_logger(__name__)
 
@@ -43,6 +45,8 @@ class BraveNewsReader:
     def __init__(self):
         self.api_key = load_brave_key()
         self.base_url = "https://api.search.brave.com/res/v1/news/search"
+        # Paces every Brave request made through this reader at the plan's limit
+        self.limiter = TokenBucket(BRAVE_REQUESTS_PER_SECOND, capacity=1)
         self.companies = []
         # Mapping for unsupported country codes to closest supported alternatives
         self.country_mapping = {
@@ -167,8 +171,39 @@ class BraveNewsReader:
         logger.debug(f"Mapping unsupported country {country_code} to {mapped_country}")
         return mapped_country
 
-    async def search_company_news(self, company: Dict[str, str], days_back: int) -> List[BraveNewsResult]:
-        """Search for company news using Brave API"""
+    async def _request(self, params: Dict[str, str], headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """Make a Brave API request paced by the shared rate limiter
+
+        Returns:
+            The decoded response, or None if the request failed
+        """
+        session = get_http_client().session()
+        for attempt in range(BRAVE_MAX_RETRIES):
+            await self.limiter.acquire()
+            async with session.get(
+                self.base_url,
+                params=params,
+                headers=headers
+            ) as response:
+                if response.status == 429 and attempt < BRAVE_MAX_RETRIES - 1:
+                    retry_after = float(response.headers.get('Retry-After', 1))
+                    logger.warning(f"Rate limited by Brave API, pausing requests for {retry_after}s")
+                    self.limiter.pause(retry_after)
+                    continue
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Brave API request failed: {response.status} - {error_text}")
+                    return None
+                return await response.json()
+        return None
+
+    async def search_company_news(self, company: Dict[str, str], days_back: int,
+                                  use_cache: bool = True) -> List[BraveNewsResult]:
+        """Search for company news using Brave API
+
+        Results are served from the shared search cache while they are fresh;
+        with use_cache=False the API is always queried and the cache refreshed.
+        """
         if not self.api_key:
             logger.error("Brave API key not configured")
             return []
@@ -195,66 +230,63 @@ class BraveNewsReader:
                 "x-subscription-token": self.api_key
             }
             
+            cache = get_search_cache()
+            cache_key = cache.make_key(search_query, company_country, freshness)
+            if use_cache:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"Using cached Brave results for '{search_query}' (country: {company_country}, freshness: {freshness})")
+                    return [BraveNewsResult.from_dict(item) for item in cached]
+            
             if original_country != company_country:
                 logger.info(f"Searching Brave API for '{search_query}' (country: {original_country} -> {company_country}, freshness: {freshness})")
             else:
                 logger.info(f"Searching Brave API for '{search_query}' (country: {company_country}, freshness: {freshness})")
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                async with session.get(
-                    self.base_url,
-                    params=params,
-                    headers=headers
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Brave API request failed: {response.status} - {error_text}")
-                        return []
-                    
-                    data = await response.json()
-                    
-                    # Extract results from Brave API response
-                    results = data.get('results', [])
-                    brave_results = []
-                    
-                    for item in results:
-                        if item.get('type') == 'news_result':
-                            try:
-                                brave_result = BraveNewsResult(
-                                    title=item.get('title', ''),
-                                    url=item.get('url', ''),
-                                    description=item.get('description', ''),
-                                    age=item.get('age', ''),
-                                    page_age=item.get('page_age', ''),
-                                    meta_url=item.get('meta_url', {}),
-                                    thumbnail=item.get('thumbnail')
-                                )
-                                brave_results.append(brave_result)
-                            except Exception as e:
-                                logger.warning(f"Error parsing Brave result: {e}")
-                                continue
-                    
-                    logger.info(f"Found {len(brave_results)} news results for {company_name}")
-                    return brave_results
-                    
+            data = await self._request(params, headers)
+            if data is None:
+                return []
+                
+            # Extract results from Brave API response
+            results = data.get('results', [])
+            brave_results = []
+                
+            for item in results:
+                if item.get('type') == 'news_result':
+                    try:
+                        brave_result = BraveNewsResult(
+                            title=item.get('title', ''),
+                            url=item.get('url', ''),
+                            description=item.get('description', ''),
+                            age=item.get('age', ''),
+                            page_age=item.get('page_age', ''),
+                            meta_url=item.get('meta_url', {}),
+                            thumbnail=item.get('thumbnail')
+                        )
+                        brave_results.append(brave_result)
+                    except Exception as e:
+                        logger.warning(f"Error parsing Brave result: {e}")
+                        continue
+                
+            logger.info(f"Found {len(brave_results)} news results for {company_name}")
+            cache.set(cache_key, [result.to_dict() for result in brave_results], cache.ttl(days_back))
+            return brave_results
+                
         except Exception as e:
             logger.error(f"Error searching Brave API for {company.get('company_name', 'Unknown')}: {e}")
             return []
 
-    async def fetch_news_by_days(self, days: int) -> Dict[str, List[BraveNewsResult]]:
+    async def fetch_news_by_days(self, days: int, use_cache: bool = True) -> Dict[str, List[BraveNewsResult]]:
         """Fetch news for all companies within specified days"""
         all_results = {}
         
         for company in self.companies:
             try:
                 company_name = company.get('company_name', 'Unknown')
-                company_results = await self.search_company_news(company, days)
+                company_results = await self.search_company_news(company, days, use_cache)
                 if company_results:
                     all_results[company_name] = company_results
                 
-                # Rate limiting for Brave API
-                await asyncio.sleep(0.5)
-                
             except Exception as e:
                 company_name = company.get('company_name', 'Unknown')
                 logger.error(f"Error fetching news for {company_name}: {e}")
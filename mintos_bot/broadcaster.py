@@ -0,0 +1,142 @@
+"""
+Broadcast Engine for the Mintos Telegram Bot
+Paces outgoing Telegram messages with a global token bucket and per-chat
+token buckets, sends broadcasts concurrently and handles flood control
+(RetryAfter) in one place.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+from telegram.error import RetryAfter
+from .config import (
+    TELEGRAM_GLOBAL_MESSAGES_PER_SECOND,
+    TELEGRAM_CHAT_MESSAGES_PER_SECOND,
+    TELEGRAM_GROUP_MESSAGES_PER_MINUTE,
+    TELEGRAM_BROADCAST_CONCURRENCY,
+    TELEGRAM_MAX_RETRY_AFTER
+)
+from .rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class BroadcastResult:
+    """Outcome of a broadcast"""
+    sent: List[Union[int, str]] = field(default_factory=list)
+    failed: Dict[Union[int, str], str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Messages sent per second"""
+        return len(self.sent) / self.elapsed if self.elapsed > 0 else 0.0
+
+def _retry_after_seconds(error: RetryAfter) -> float:
+    """Get the flood-control wait of a RetryAfter error in seconds"""
+    retry_after = error.retry_after
+    if hasattr(retry_after, 'total_seconds'):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+class Broadcaster:
+    """Rate-limit-aware sender for single messages and concurrent broadcasts"""
+
+    def __init__(self, send_func: Callable[..., Awaitable[Any]],
+                 global_rate: float = TELEGRAM_GLOBAL_MESSAGES_PER_SECOND,
+                 chat_rate: float = TELEGRAM_CHAT_MESSAGES_PER_SECOND,
+                 group_rate: float = TELEGRAM_GROUP_MESSAGES_PER_MINUTE / 60,
+                 concurrency: int = TELEGRAM_BROADCAST_CONCURRENCY,
+                 max_retry_after: int = TELEGRAM_MAX_RETRY_AFTER,
+                 on_retry_exhausted: Optional[Callable[..., Any]] = None):
+        """Initialize the broadcaster
+
+        Args:
+            send_func: Coroutine delivering one message, called as send_func(chat_id, text, **kwargs)
+            global_rate: Messages per second across all chats
+            chat_rate: Messages per second to a single private chat
+            group_rate: Messages per second to a single group or channel
+            concurrency: Maximum number of sends in flight during a broadcast
+            max_retry_after: Retries of a message after flood control
+            on_retry_exhausted: Called as on_retry_exhausted(chat_id, text, error, **kwargs)
+                when a message is still flood-controlled after the last retry
+        """
+        self.send_func = send_func
+        self.chat_rate = chat_rate
+        self.group_rate = group_rate
+        self.concurrency = concurrency
+        self.max_retry_after = max_retry_after
+        self.on_retry_exhausted = on_retry_exhausted
+        self.global_bucket = TokenBucket(global_rate)
+        self._chat_buckets: Dict[str, TokenBucket] = {}
+
+    def _chat_bucket(self, chat_id: Union[int, str]) -> TokenBucket:
+        key = str(chat_id)
+        bucket = self._chat_buckets.get(key)
+        if bucket is None:
+            # Groups and channels have negative IDs or @usernames
+            rate = self.group_rate if key.startswith(('-', '@')) else self.chat_rate
+            bucket = self._chat_buckets[key] = TokenBucket(rate, capacity=1)
+        return bucket
+
+    async def send(self, chat_id: Union[int, str], text: str, **kwargs: Any) -> Any:
+        """Send one message once both the chat and the global bucket allow it
+
+        Flood control pauses the affected buckets for the requested time and
+        the message is retried. Once the retries are used up the message is
+        handed to on_retry_exhausted and the RetryAfter is raised. Other errors
+        are raised to the caller.
+        """
+        chat_bucket = self._chat_bucket(chat_id)
+        for attempt in range(self.max_retry_after + 1):
+            await chat_bucket.acquire()
+            await self.global_bucket.acquire()
+            try:
+                return await self.send_func(chat_id, text, **kwargs)
+            except RetryAfter as e:
+                delay = _retry_after_seconds(e) + 1  # Add 1 second buffer
+                if attempt == self.max_retry_after:
+                    logger.error(f"Flood control for chat {chat_id} persisted after {attempt} retries")
+                    if self.on_retry_exhausted:
+                        self.on_retry_exhausted(chat_id, text, e, **kwargs)
+                    raise
+                logger.warning(f"Flood control for chat {chat_id}, pausing sends for {delay:.0f} seconds")
+                # Flood control is usually bot-wide, so hold back every chat
+                self.global_bucket.pause(delay)
+                chat_bucket.pause(delay)
+
+    async def broadcast(self, chat_ids: Iterable[Union[int, str]], text: str,
+                        description: str = "message", **kwargs: Any) -> BroadcastResult:
+        """Send the same message to many chats concurrently
+
+        Args:
+            chat_ids: Recipients
+            text: Message text
+            description: Short label used in throughput logs
+            **kwargs: Passed through to the send function
+        """
+        recipients = list(dict.fromkeys(chat_ids))
+        result = BroadcastResult()
+        if not recipients:
+            return result
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        started = time.monotonic()
+
+        async def deliver(chat_id: Union[int, str]) -> None:
+            async with semaphore:
+                try:
+                    await self.send(chat_id, text, **kwargs)
+                    result.sent.append(chat_id)
+                except Exception as e:
+                    logger.error(f"Failed to send {description} to {chat_id}: {e}")
+                    result.failed[chat_id] = str(e)
+
+        await asyncio.gather(*(deliver(chat_id) for chat_id in recipients))
+        result.elapsed = time.monotonic() - started
+        logger.info(
+            f"Broadcast {description}: {len(result.sent)}/{len(recipients)} sent, "
+            f"{len(result.failed)} failed in {result.elapsed:.1f}s ({result.rate:.1f} msg/s)"
+        )
+        return result
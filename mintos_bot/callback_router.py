@@ -0,0 +1,96 @@
+"""
+Callback Router for the Mintos Telegram Bot
+Dispatches inline-keyboard callback data to handlers through an exact-match
+dict and a prefix trie, and keeps per-route latency statistics.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[..., Awaitable[Any]]
+
+@dataclass
+class RouteStats:
+    """Latency counters for one route"""
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def average_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+class CallbackRouter:
+    """Routes callback data to handlers
+
+    Exact routes are looked up in a dict. Parameterised routes are matched
+    by the longest registered prefix, found by walking a character trie, so
+    dispatch cost depends on the length of the callback data rather than on
+    the number of routes.
+    """
+
+    _HANDLER = object()  # Trie key holding (route name, handler)
+
+    def __init__(self):
+        self._exact: Dict[str, Tuple[str, Handler]] = {}
+        self._trie: Dict[Any, Any] = {}
+        self.stats: Dict[str, RouteStats] = {}
+
+    def exact(self, data: str, handler: Handler) -> None:
+        """Register a handler for one exact callback value"""
+        self._exact[data] = (data, handler)
+
+    def prefix(self, prefix: str, handler: Handler) -> None:
+        """Register a handler for callback values starting with prefix"""
+        node = self._trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[self._HANDLER] = (f"{prefix}*", handler)
+
+    def resolve(self, data: str) -> Optional[Tuple[str, Handler]]:
+        """Find the route for callback data: exact match first, then the longest prefix"""
+        route = self._exact.get(data)
+        if route is not None:
+            return route
+        node = self._trie
+        for char in data:
+            node = node.get(char)
+            if node is None:
+                break
+            route = node.get(self._HANDLER, route)
+        return route
+
+    async def dispatch(self, data: str, *args: Any) -> bool:
+        """Run the handler for callback data, recording its latency
+
+        Returns:
+            False if no route matched
+        """
+        route = self.resolve(data)
+        if route is None:
+            logger.debug(f"No callback route for {data}")
+            return False
+
+        name, handler = route
+        stats = self.stats.setdefault(name, RouteStats())
+        started = time.perf_counter()
+        try:
+            await handler(*args)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            stats.calls += 1
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+            logger.debug(f"Callback route {name} took {elapsed * 1000:.1f}ms")
+        return True
+
+    def slowest_routes(self, limit: int = 10) -> List[Tuple[str, RouteStats]]:
+        """Get the routes with the highest total handling time"""
+        return sorted(self.stats.items(), key=lambda item: item[1].total_seconds, reverse=True)[:limit]
@@ -27,11 +27,68 @@ BACKUP_SENT_DOCUMENTS_FILE = os.path.join(DATA_DIR, "sent_documents.json.bak")
 MINTOS_API_BASE = "https://www.mintos.com/webapp/api/marketplace-api/v1"
 MINTOS_CAMPAIGNS_URL = "https://www.mintos.com/webapp/api/en/webapp-api/user/campaigns"
 REQUEST_DELAY = 0.1  # seconds between requests
+MINTOS_MAX_CONCURRENCY = 8  # parallel workers for the recovery-updates sweep
+MINTOS_REQUESTS_PER_SECOND = 10.0  # global request rate limit for the sweep
+
+# Adaptive Polling Configuration
+POLL_MIN_INTERVAL_HOURS = 1  # hottest lenders are checked at most this often
+POLL_MAX_INTERVAL_HOURS = 7 * 24  # resolved or silent lenders are checked at least weekly
+POLL_CHECKS_PER_UPDATE = 24  # checks per typical gap between a lender's updates
+POLL_DEFAULT_GAP_DAYS = 30  # assumed gap for lenders with a single update
+POLL_REQUEST_BUDGET_PER_HOUR = 30  # sustained lender requests per hour
+POLL_REQUEST_BURST = 60  # maximum lender requests in one polling round
+
+# Telegram Broadcast Configuration
+TELEGRAM_GLOBAL_MESSAGES_PER_SECOND = 30.0  # Telegram's bot-wide broadcast limit
+TELEGRAM_CHAT_MESSAGES_PER_SECOND = 1.0  # Telegram's per-chat limit
+TELEGRAM_GROUP_MESSAGES_PER_MINUTE = 20  # Telegram's limit for groups and channels
+TELEGRAM_BROADCAST_CONCURRENCY = 30  # concurrent sends during a broadcast
+TELEGRAM_MAX_RETRY_AFTER = 3  # flood-control retries per message
+
+# Outbound Message Queue Configuration
+OUTBOUND_MAX_ATTEMPTS = 8  # delivery attempts before a message is dead-lettered
+OUTBOUND_BASE_DELAY_SECONDS = 5  # first retry delay, doubled on every attempt
+OUTBOUND_MAX_DELAY_SECONDS = 3600  # retry delay cap
+OUTBOUND_POLL_SECONDS = 1  # how often the worker looks for due messages
+
+# RSS admin actions share forced feed fetches for this long
+RSS_FORCE_FETCH_CACHE_SECONDS = 300
+
+# Company News Pipeline Configuration
+BRAVE_REQUESTS_PER_SECOND = 1.0  # Brave Search plan rate limit
+BRAVE_MAX_RETRIES = 3  # attempts per search when Brave answers 429
+NEWS_ANALYSIS_CONCURRENCY = 5  # OpenAI analyses running alongside the searches
+PERPLEXITY_REQUESTS_PER_SECOND = 1.0  # Perplexity request rate limit
+PERPLEXITY_CONCURRENCY = 5  # Perplexity requests in flight
+
+# News Search Cache Configuration
+SEARCH_CACHE_TTL_HOURS = {1: 1, 7: 6, 30: 12, 365: 24}  # hours results are kept, by freshness window in days
+SEARCH_CACHE_MAX_ENTRIES = 2000  # cached searches kept before the oldest are evicted
+
+# News Pre-filter Configuration
+NEWS_PREFILTER_TOP_K = 5  # best locally scored results sent to OpenAI per company
+NEWS_ALLOWED_DOMAINS = (  # sources ranked ahead of others with the same name matches
+    'reuters.com', 'bloomberg.com', 'ft.com', 'finextra.com', 'crowdfundinsider.com',
+    'p2pmarketdata.com', 'explorep2p.com', 'mintos.com'
+)
+NEWS_DENIED_DOMAINS = (  # sources never sent to OpenAI
+    'linkedin.com', 'indeed.com', 'glassdoor.com', 'facebook.com', 'instagram.com',
+    'tiktok.com', 'youtube.com'
+)
+
+# OpenAI Batching Configuration
+OPENAI_API_BASE = os.getenv('OPENAI_API_BASE', 'https://api.openai.com/v1')  # point at a local stub server for testing
+NEWS_BATCH_SIZE = 10  # companies classified per OpenAI request; 1 sends one request per company
+NEWS_BATCH_MAX_WAIT_SECONDS = 20  # how long the analysis stage waits to fill a batch
+NEWS_BATCH_TOKENS_PER_COMPANY = 300  # response token budget per company in a batch
+NEWS_BATCH_SUBMIT_HOUR_UTC = 2  # hour the nightly OpenAI batch job is submitted
+NEWS_BATCH_DAYS = 7  # news window classified by the nightly batch job
+NEWS_BATCH_POLL_MINUTES = 15  # how often a pending batch job is checked for results
 
 
 
 # Document Scraper Configuration
-DOCUMENT_SCRAPE_INTERVAL_HOURS = 24  # Scrape documents once a day
+DOCUMENT_SCRAPE_INTERVAL_HOURS = 6  # Unchanged pages are skipped by fingerprint, so scraping is cheap
 DOCUMENT_TYPES = {
     'presentation': 'Presentation',
     'financials': 'Financials',
@@ -14,6 +14,10 @@ ATTACHED_ASSETS_DIR = "attached_assets"
 UPDATES_FILE = os.path.join(DATA_DIR, 'updates_cache.json')
 CAMPAIGNS_FILE = os.path.join(DATA_DIR, 'campaigns_cache.json')
 DOCUMENTS_CACHE_FILE = os.path.join(DATA_DIR, 'documents_cache.json')
+UPDATE_VALIDATORS_FILE = os.path.join(DATA_DIR, 'update_validators.json')
+POLL_SCHEDULE_FILE = os.path.join(DATA_DIR, 'poll_schedule.json')
+PAGE_FINGERPRINTS_FILE = os.path.join(DATA_DIR, 'page_fingerprints.json')
+PDF_FINGERPRINTS_FILE = os.path.join(DATA_DIR, 'pdf_fingerprints.json')
 
 # Backup Files
 SENT_UPDATES_FILE = os.path.join(DATA_DIR, 'sent_updates.json')
@@ -23,6 +27,15 @@ SENT_CAMPAIGNS_BACKUP = os.path.join(DATA_DIR, 'sent_campaigns.json.bak')
 SENT_DOCUMENTS_FILE = os.path.join(DATA_DIR, 'sent_documents.json')
 SENT_DOCUMENTS_BACKUP = os.path.join(DATA_DIR, 'sent_documents.json.bak')
 
+# Append-only sent ledgers (the JSON files above are imported once)
+SENT_UPDATES_LEDGER = os.path.join(DATA_DIR, 'sent_updates.jsonl')
+SENT_CAMPAIGNS_LEDGER = os.path.join(DATA_DIR, 'sent_campaigns.jsonl')
+SENT_DOCUMENTS_LEDGER = os.path.join(DATA_DIR, 'sent_documents.jsonl')
+
+# State Storage ('sqlite' or 'json')
+STORAGE_BACKEND = os.getenv('MINTOS_STORAGE_BACKEND', 'sqlite').lower()
+STATE_DB_FILE = os.path.join(DATA_DIR, 'bot_state.db')
+
 # CSV Files - fallback paths if package data not found
 COMPANY_NAMES_CSV = os.path.join(ATTACHED_ASSETS_DIR, 'lo_names.csv')
 COMPANY_PAGES_CSV = os.path.join(ATTACHED_ASSETS_DIR, 'company_pages.csv')
@@ -42,6 +55,13 @@ HTTP_RETRY_DELAY = 1
 # HTTP Configuration
 MAX_HTTP_RETRIES = 3
 HTTP_CLIENT_TIMEOUT = ClientTimeout(total=HTTP_TIMEOUT)
+HTTP_API_TIMEOUT = ClientTimeout(total=30, connect=HTTP_TIMEOUT)  # default for shared sessions
+HTTP_LLM_TIMEOUT = ClientTimeout(total=120, connect=HTTP_TIMEOUT)  # slow search/LLM completions
+HTTP_DOWNLOAD_TIMEOUT = ClientTimeout(total=None, connect=HTTP_TIMEOUT, sock_read=HTTP_TIMEOUT)  # large bodies, fails only when a read stalls
+HTTP_POOL_LIMIT = 100  # open connections per shared session
+HTTP_POOL_LIMIT_PER_HOST = 10  # open connections per host
+HTTP_DNS_CACHE_TTL = 300  # seconds to cache DNS lookups
+HTTP_KEEPALIVE_TIMEOUT = 30  # seconds to keep idle connections open
 DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 
 # Cache Configuration
@@ -51,6 +71,13 @@ DOCUMENT_CACHE_TTL = 1800  # 30 minutes for documents
 # Document Types
 DOCUMENT_TYPES = ['presentation', 'financials', 'loan_agreement']
 
+# Worker processes parsing company pages (0 parses on the event loop)
+DOCUMENT_PARSE_WORKERS = int(os.getenv('MINTOS_DOCUMENT_PARSE_WORKERS', os.cpu_count() or 1))
+
+# PDF change detection
+PDF_FINGERPRINT_CONCURRENCY = 5  # PDF HEAD/hash requests in flight
+PDF_HASH_CHUNK_SIZE = 64 * 1024  # bytes read per chunk when hashing a PDF
+
 # Logging Configuration
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 LOG_LEVEL = 'INFO'
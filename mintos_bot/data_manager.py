@@ -3,18 +3,20 @@ Data Manager for the Mintos Telegram Bot
 Handles data persistence, caching, and updates management.
 """
 import hashlib
-import json
 import logging
 import os
-import shutil
 import time
 from typing import Dict, List, Optional, Set, Any, Union
 # import pandas as pd  # Temporarily disabled due to system library issues
 from .base_manager import BaseManager
 from .constants import (
     DATA_DIR, UPDATES_FILE, CAMPAIGNS_FILE, COMPANY_NAMES_CSV,
-    SENT_UPDATES_FILE, SENT_CAMPAIGNS_FILE
+    SENT_UPDATES_FILE, SENT_CAMPAIGNS_FILE, SENT_UPDATES_LEDGER, SENT_CAMPAIGNS_LEDGER
 )
+from .sent_ledger import SentLedger
+from .update_diff import diff_updates
+from .update_index import UpdateIndex
+from .update_validators import UpdateValidatorStore
 from .utils import create_unique_id, FileBackupManager
 
 logger = logging.getLogger(__name__)
@@ -26,20 +28,19 @@ class DataManager(BaseManager):
         """Initialize DataManager with necessary data structures"""
         super().__init__(UPDATES_FILE)
         self.company_names: Dict[int, str] = {}
-        self.sent_updates: Set[str] = set()
-        self.sent_campaigns: Set[str] = set()
         self.pending_campaigns: List[Dict[str, Any]] = []
+        self.update_validators = UpdateValidatorStore()
+        self._update_index: Optional[UpdateIndex] = None
         
-        # File paths for tracking sent items
-        self.sent_updates_file = SENT_UPDATES_FILE
-        self.sent_campaigns_file = SENT_CAMPAIGNS_FILE
-        self.pending_campaigns_file = 'data/pending_campaigns.json'
-        self.backup_sent_updates_file = f"{SENT_UPDATES_FILE}.bak"
-        self.backup_sent_campaigns_file = f"{SENT_CAMPAIGNS_FILE}.bak"
+        # Storage namespaces for pending and cached campaigns
+        self.pending_campaigns_namespace = 'pending_campaigns'
+        self.campaigns_namespace = os.path.splitext(os.path.basename(CAMPAIGNS_FILE))[0]
+        
+        # Sent items are indexed in memory and persisted row by row
+        self.sent_updates = SentLedger(SENT_UPDATES_LEDGER, legacy_file=SENT_UPDATES_FILE, storage=self.storage)
+        self.sent_campaigns = SentLedger(SENT_CAMPAIGNS_LEDGER, legacy_file=SENT_CAMPAIGNS_FILE, storage=self.storage)
         
         self._load_company_names()
-        self._load_sent_updates()
-        self._load_sent_campaigns()
         self._load_pending_campaigns()
 
     def _load_company_names(self) -> None:
@@ -111,92 +112,11 @@ class DataManager(BaseManager):
             campaign.get('validTo', '')
         )
 
-    def _load_sent_updates(self) -> None:
-        """Load set of already sent update IDs with verification and backup"""
-        self.sent_updates: Set[str] = set()
-
-        try:
-            if os.path.exists(self.sent_updates_file):
-                with open(self.sent_updates_file, 'r') as f:
-                    data = json.load(f)
-                    # Extract just the IDs from dictionaries if necessary
-                    if data and isinstance(data, list):
-                        if all(isinstance(item, dict) and 'id' in item for item in data):
-                            # Format with IDs and timestamps
-                            self.sent_updates = set(item['id'] for item in data)
-                        else:
-                            # Old format with just IDs
-                            self.sent_updates = set(data)
-                logger.info(f"Loaded {len(self.sent_updates)} sent update IDs")
-
-                # Create backup if needed
-                if not os.path.exists(self.backup_sent_updates_file):
-                    with open(self.backup_sent_updates_file, 'w') as f:
-                        # Use the same format as the main file for consistency
-                        if os.path.exists(self.sent_updates_file):
-                            with open(self.sent_updates_file, 'r') as main_f:
-                                shutil.copyfileobj(main_f, f)
-                        else:
-                            json.dump(list(self.sent_updates), f)
-                    logger.info("Created backup of sent updates")
-            elif os.path.exists(self.backup_sent_updates_file):
-                logger.warning("Main sent updates file not found, loading from backup")
-                with open(self.backup_sent_updates_file, 'r') as f:
-                    data = json.load(f)
-                    # Extract just the IDs from dictionaries if necessary
-                    if data and isinstance(data, list):
-                        if all(isinstance(item, dict) and 'id' in item for item in data):
-                            # Format with IDs and timestamps
-                            self.sent_updates = set(item['id'] for item in data)
-                        else:
-                            # Old format with just IDs
-                            self.sent_updates = set(data)
-                logger.info(f"Loaded {len(self.sent_updates)} sent update IDs from backup")
-
-                # Recreate main file
-                with open(self.sent_updates_file, 'w') as f:
-                    # Use the same format as the backup file for consistency
-                    if os.path.exists(self.backup_sent_updates_file):
-                        with open(self.backup_sent_updates_file, 'r') as backup_f:
-                            shutil.copyfileobj(backup_f, f)
-                    else:
-                        json.dump(list(self.sent_updates), f)
-        except Exception as e:
-            logger.error(f"Error loading sent updates: {e}", exc_info=True)
-
     def save_sent_update(self, update: Dict[str, Any]) -> None:
-        """Mark an update as sent with backup and timestamp"""
+        """Mark an update as sent with timestamp"""
         try:
             update_id = self._create_update_id(update)
-            self.sent_updates.add(update_id)
-            
-            # Load existing data
-            sent_data = []
-            try:
-                with open(self.sent_updates_file, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        sent_data = [entry if isinstance(entry, dict) else {'id': entry} for entry in data]
-            except (FileNotFoundError, json.JSONDecodeError):
-                pass
-                
-            # Add or update entry
-            now = time.time()
-            updated = False
-            for entry in sent_data:
-                if entry.get('id') == update_id:
-                    entry['timestamp'] = now
-                    updated = True
-                    break
-            
-            if not updated:
-                sent_data.append({'id': update_id, 'timestamp': now})
-
-            # Save to both main and backup files
-            for file_path in [self.sent_updates_file, self.backup_sent_updates_file]:
-                with open(file_path, 'w') as f:
-                    json.dump(sent_data, f)
-
+            self.sent_updates.mark(update_id)
             logger.info(f"Saved sent update ID: {update_id}")
         except Exception as e:
             logger.error(f"Error saving sent update: {e}", exc_info=True)
@@ -210,125 +130,36 @@ class DataManager(BaseManager):
             return False
             
         # Check when it was last sent
-        try:
-            with open(self.sent_updates_file, 'r') as f:
-                sent_data = json.load(f)
-                
-            # Get timestamp if available
-            for entry in sent_data:
-                if isinstance(entry, dict) and entry.get('id') == update_id:
-                    last_sent = entry.get('timestamp', 0)
-                    
-                    # Get the date from timestamp
-                    last_sent_date = time.strftime("%Y-%m-%d", time.localtime(last_sent))
-                    current_date = time.strftime("%Y-%m-%d")
-                    
-                    # Don't resend if it was sent today (same calendar day)
-                    if last_sent_date == current_date:
-                        logger.info(f"Update {update_id} already sent today ({current_date}), skipping")
-                        return True
-                    
-                    # Don't resend if same day as in the update
-                    update_date = update.get('date', '')
-                    if update_date and last_sent_date == update_date:
-                        logger.info(f"Update {update_id} already sent on the update date ({update_date}), skipping")
-                        return True
-                    
-                    # If we reach here, it wasn't sent today or on update date
-                    logger.info(f"Update {update_id} was last sent on {last_sent_date}, can send again today")
-                    return False
-                    
+        last_sent = self.sent_updates.get(update_id)
+        if last_sent is None:
             # If no timestamp found but ID is in sent_updates, assume it was sent
             logger.info(f"Update {update_id} is in sent list but has no timestamp, assuming sent")
-            return True  
-        except Exception as e:
-            logger.error(f"Error checking update timestamp: {e}")
             return True
-
-    def _load_sent_campaigns(self) -> None:
-        """Load set of already sent campaign IDs with verification and backup"""
-        try:
-            if os.path.exists(self.sent_campaigns_file):
-                with open(self.sent_campaigns_file, 'r') as f:
-                    data = json.load(f)
-                    # Extract just the IDs from dictionaries if necessary
-                    if data and isinstance(data, list):
-                        if all(isinstance(item, dict) and 'id' in item for item in data):
-                            # Format with IDs and timestamps
-                            self.sent_campaigns = set(item['id'] for item in data)
-                        else:
-                            # Old format with just IDs
-                            self.sent_campaigns = set(data)
-                logger.info(f"Loaded {len(self.sent_campaigns)} sent campaign IDs")
-
-                # Create backup if needed
-                if not os.path.exists(self.backup_sent_campaigns_file):
-                    with open(self.backup_sent_campaigns_file, 'w') as f:
-                        # Use the same format as the main file for consistency
-                        if os.path.exists(self.sent_campaigns_file):
-                            with open(self.sent_campaigns_file, 'r') as main_f:
-                                shutil.copyfileobj(main_f, f)
-                        else:
-                            json.dump(list(self.sent_campaigns), f)
-                    logger.info("Created backup of sent campaigns")
-            elif os.path.exists(self.backup_sent_campaigns_file):
-                logger.warning("Main sent campaigns file not found, loading from backup")
-                with open(self.backup_sent_campaigns_file, 'r') as f:
-                    data = json.load(f)
-                    # Extract just the IDs from dictionaries if necessary
-                    if data and isinstance(data, list):
-                        if all(isinstance(item, dict) and 'id' in item for item in data):
-                            # Format with IDs and timestamps
-                            self.sent_campaigns = set(item['id'] for item in data)
-                        else:
-                            # Old format with just IDs
-                            self.sent_campaigns = set(data)
-                logger.info(f"Loaded {len(self.sent_campaigns)} sent campaign IDs from backup")
-
-                # Recreate main file
-                with open(self.sent_campaigns_file, 'w') as f:
-                    # Use the same format as the backup file for consistency
-                    if os.path.exists(self.backup_sent_campaigns_file):
-                        with open(self.backup_sent_campaigns_file, 'r') as backup_f:
-                            shutil.copyfileobj(backup_f, f)
-                    else:
-                        json.dump(list(self.sent_campaigns), f)
-        except Exception as e:
-            logger.error(f"Error loading sent campaigns: {e}", exc_info=True)
+        
+        # Get the date from timestamp
+        last_sent_date = time.strftime("%Y-%m-%d", time.localtime(last_sent))
+        current_date = time.strftime("%Y-%m-%d")
+        
+        # Don't resend if it was sent today (same calendar day)
+        if last_sent_date == current_date:
+            logger.info(f"Update {update_id} already sent today ({current_date}), skipping")
+            return True
+        
+        # Don't resend if same day as in the update
+        update_date = update.get('date', '')
+        if update_date and last_sent_date == update_date:
+            logger.info(f"Update {update_id} already sent on the update date ({update_date}), skipping")
+            return True
+        
+        # If we reach here, it wasn't sent today or on update date
+        logger.info(f"Update {update_id} was last sent on {last_sent_date}, can send again today")
+        return False
 
     def save_sent_campaign(self, campaign: Dict[str, Any]) -> None:
-        """Mark a campaign as sent with backup and timestamp"""
+        """Mark a campaign as sent with timestamp"""
         try:
             campaign_id = self._create_campaign_id(campaign)
-            self.sent_campaigns.add(campaign_id)
-            
-            # Load existing data
-            sent_data = []
-            try:
-                with open(self.sent_campaigns_file, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        sent_data = [entry if isinstance(entry, dict) else {'id': entry} for entry in data]
-            except (FileNotFoundError, json.JSONDecodeError):
-                pass
-                
-            # Add or update entry
-            now = time.time()
-            updated = False
-            for entry in sent_data:
-                if entry.get('id') == campaign_id:
-                    entry['timestamp'] = now
-                    updated = True
-                    break
-            
-            if not updated:
-                sent_data.append({'id': campaign_id, 'timestamp': now})
-
-            # Save to both main and backup files
-            for file_path in [self.sent_campaigns_file, self.backup_sent_campaigns_file]:
-                with open(file_path, 'w') as f:
-                    json.dump(sent_data, f)
-
+            self.sent_campaigns.mark(campaign_id)
             logger.info(f"Saved sent campaign ID: {campaign_id}")
         except Exception as e:
             logger.error(f"Error saving sent campaign: {e}", exc_info=True)
@@ -348,13 +179,40 @@ class DataManager(BaseManager):
         return updates
 
     def save_updates(self, updates: List[Dict[str, Any]]) -> None:
-        """Save updates to cache file"""
+        """Save updates to cache file and rebuild the update index"""
         if self.save_data(updates):
             logger.info(f"Successfully saved {len(updates)} updates")
+            if self._update_index is None:
+                self._update_index = UpdateIndex(self.get_company_name)
+            self._update_index.rebuild(updates)
         else:
             logger.error("Failed to save updates")
             raise Exception("Failed to save updates")
 
+    def save_lender_update(self, update: Dict[str, Any]) -> None:
+        """Replace a single lender's entry in the cache and re-index only that lender"""
+        lender_id = update.get('lender_id')
+        updates = self.load_previous_updates()
+        for i, cached in enumerate(updates):
+            if cached.get('lender_id') == lender_id:
+                updates[i] = update
+                break
+        else:
+            updates.append(update)
+        if not self.save_data(updates):
+            logger.error(f"Failed to save updates for lender {lender_id}")
+            raise Exception("Failed to save updates")
+        if self._update_index is not None:
+            self._update_index.update_lender(update)
+
+    @property
+    def update_index(self) -> UpdateIndex:
+        """Flattened index of the updates cache, built on first use"""
+        if self._update_index is None:
+            self._update_index = UpdateIndex(self.get_company_name)
+            self._update_index.rebuild(self.load_previous_updates())
+        return self._update_index
+
     def get_company_name(self, lender_id: Any) -> str:
         """Get company name by lender ID, falling back to ID if name not found"""
         try:
@@ -368,55 +226,20 @@ class DataManager(BaseManager):
             logger.warning(f"Invalid lender_id format: {lender_id}")
             return str(lender_id) if lender_id else "Invalid ID"
 
-    def compare_updates(self, new_updates: List[Dict[str, Any]], previous_updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Compare updates to find new ones"""
-        logger.debug(f"Comparing {len(new_updates)} new updates with {len(previous_updates)} previous updates")
-
-        new_updates_dict = {}
-        for update in new_updates:
-            if "items" not in update:
-                continue
-
-            lender_id = update.get('lender_id')
-            for year_data in update["items"]:
-                year = year_data.get('year')
-                status = year_data.get('status')
-                substatus = year_data.get('substatus')
-
-                for item in year_data.get("items", []):
-                    key = (lender_id, year, item.get('date', ''))
-                    new_updates_dict[key] = {
-                        'lender_id': lender_id,
-                        'year': year,
-                        'status': status,
-                        'substatus': substatus,
-                        'company_name': self.get_company_name(lender_id),
-                        **item
-                    }
-
-        prev_updates_dict = {}
-        for update in previous_updates:
-            if "items" in update:
-                lender_id = update.get('lender_id')
-                for year_data in update["items"]:
-                    year = year_data.get('year')
-                    for item in year_data.get("items", []):
-                        key = (lender_id, year, item.get('date', ''))
-                        prev_updates_dict[key] = item
-
-        added_updates = []
-        for key, update in new_updates_dict.items():
-            if key not in prev_updates_dict or not self._updates_match(update, prev_updates_dict[key]):
-                added_updates.append(update)
+    def compare_updates(self, new_updates: List[Dict[str, Any]], previous_updates: List[Dict[str, Any]],
+                        unchanged_lenders: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+        """Compare updates to find new or changed ones
 
+        Lenders are compared by content hash and only changed lenders are
+        expanded. Lenders listed in unchanged_lenders (as strings) were
+        confirmed unchanged by a conditional request and are skipped. Each
+        result carries a ``changes`` list of typed field-level changes.
+        """
+        logger.debug(f"Comparing {len(new_updates)} new updates with {len(previous_updates)} previous updates")
+        added_updates = diff_updates(new_updates, previous_updates, self.get_company_name, unchanged_lenders)
         logger.info(f"Found {len(added_updates)} new updates")
         return added_updates
 
-    def _updates_match(self, update1: Dict[str, Any], update2: Dict[str, Any]) -> bool:
-        """Compare two updates for equality in significant fields"""
-        significant_fields = ['description', 'date', 'recoveredAmount', 'remainingAmount']
-        return all(update1.get(field) == update2.get(field) for field in significant_fields)
-
     def compare_campaigns(self, new_campaigns: List[Dict[str, Any]], previous_campaigns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compare campaigns to find new or updated ones"""
         logger.debug(f"Comparing {len(new_campaigns)} new campaigns with {len(previous_campaigns)} previous campaigns")
@@ -453,28 +276,25 @@ class DataManager(BaseManager):
                   for field in significant_fields)
 
     def _load_pending_campaigns(self) -> None:
-        """Load pending campaigns from file"""
+        """Load pending campaigns from storage"""
         try:
-            if os.path.exists(self.pending_campaigns_file):
-                with open(self.pending_campaigns_file, 'r') as f:
-                    self.pending_campaigns = json.load(f)
+            pending = self.storage.load_document(self.pending_campaigns_namespace)
+            if pending is not None:
+                self.pending_campaigns = pending
                 logger.info(f"Loaded {len(self.pending_campaigns)} pending campaigns")
             else:
                 self.pending_campaigns = []
-                logger.info("No pending campaigns file found, starting fresh")
+                logger.info("No pending campaigns found, starting fresh")
         except Exception as e:
             logger.error(f"Error loading pending campaigns: {e}")
             self.pending_campaigns = []
 
     def save_pending_campaigns(self) -> None:
-        """Save pending campaigns to file"""
-        try:
-            self.ensure_data_directory()
-            with open(self.pending_campaigns_file, 'w') as f:
-                json.dump(self.pending_campaigns, f, indent=2)
+        """Save pending campaigns to storage"""
+        if self.storage.save_document(self.pending_campaigns_namespace, self.pending_campaigns, backup=False):
             logger.debug(f"Saved {len(self.pending_campaigns)} pending campaigns")
-        except Exception as e:
-            logger.error(f"Error saving pending campaigns: {e}")
+        else:
+            logger.error("Error saving pending campaigns")
 
     def add_pending_campaign(self, campaign: Dict[str, Any], admin_notified: bool = False) -> None:
         """Add a campaign to pending notifications with timestamp"""
@@ -516,22 +336,18 @@ class DataManager(BaseManager):
     def get_campaigns_cache_age(self):
         """Get age of campaigns cache in seconds"""
         try:
-            if os.path.exists(CAMPAIGNS_FILE):
-                age = time.time() - os.path.getmtime(CAMPAIGNS_FILE)
-                logger.debug(f"Campaigns cache age: {age:.2f} seconds")
-                return age
-            logger.debug("Campaigns cache file does not exist")
-            return float('inf')
+            age = self.storage.document_age(self.campaigns_namespace)
+            logger.debug(f"Campaigns cache age: {age:.2f} seconds")
+            return age
         except Exception as e:
             logger.error(f"Error checking campaigns cache age: {e}", exc_info=True)
             return float('inf')
     
     def load_previous_campaigns(self):
-        """Load previous campaigns from cache file"""
+        """Load previous campaigns from cache"""
         try:
-            if os.path.exists(CAMPAIGNS_FILE):
-                with open(CAMPAIGNS_FILE, 'r') as f:
-                    campaigns = json.load(f)
+            campaigns = self.storage.load_document(self.campaigns_namespace)
+            if campaigns is not None:
                 logger.info(f"Loaded {len(campaigns)} campaigns from cache")
                 return campaigns
             logger.info("No previous campaigns found")
@@ -541,12 +357,8 @@ class DataManager(BaseManager):
             return []
     
     def save_campaigns(self, campaigns):
-        """Save campaigns to cache file"""
-        try:
-            with open(CAMPAIGNS_FILE, 'w') as f:
-                json.dump(campaigns, f, indent=4)
-            logger.info(f"Successfully saved {len(campaigns)} campaigns")
-            logger.debug(f"Campaigns file size: {os.path.getsize(CAMPAIGNS_FILE)} bytes")
-        except Exception as e:
-            logger.error(f"Error saving campaigns: {e}", exc_info=True)
-            raise
\ No newline at end of file
+        """Save campaigns to cache"""
+        if not self.storage.save_document(self.campaigns_namespace, campaigns, backup=False):
+            logger.error("Error saving campaigns")
+            raise Exception("Failed to save campaigns")
+        logger.info(f"Successfully saved {len(campaigns)} campaigns")
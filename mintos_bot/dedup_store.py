@@ -0,0 +1,117 @@
+"""
+Dedup Store for the Mintos Telegram Bot
+Insertion-ordered, time-bounded set of seen keys, grouped (e.g. per feed),
+with O(1) membership checks, eviction by age and batched persistence.
+"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+class DedupStore:
+    """Seen-key store evicting keys older than their group's TTL
+
+    Keys are kept per group in the order they were added, so eviction only
+    inspects the oldest keys. Changes are persisted in batches to a storage
+    namespace holding ``key -> {'group': ..., 'ts': ...}`` rows.
+    """
+
+    def __init__(self, namespace: str, storage: Any, ttl_seconds: Dict[str, float],
+                 default_ttl: float, flush_every: int = 20):
+        """Initialize the store and load persisted keys
+
+        Args:
+            namespace: Storage namespace holding the keys
+            storage: Storage backend
+            ttl_seconds: Seconds a key is kept, per group
+            default_ttl: Seconds a key is kept for groups without their own TTL
+            flush_every: Unsaved changes that trigger a flush
+        """
+        self.namespace = namespace
+        self.storage = storage
+        self.ttl_seconds = ttl_seconds
+        self.default_ttl = default_ttl
+        self.flush_every = flush_every
+        self._groups: Dict[Optional[str], OrderedDict] = {}
+        self._index: Dict[str, Optional[str]] = {}
+        self._dirty = 0
+
+        try:
+            rows = self.storage.load_namespace(namespace)
+            for key, row in sorted(rows.items(), key=lambda item: item[1].get('ts') or 0):
+                self._insert(key, row.get('group'), row.get('ts') or time.time())
+            logger.info(f"Loaded {len(self._index)} keys from {namespace}")
+        except Exception as e:
+            logger.error(f"Error loading {namespace}: {e}", exc_info=True)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def ttl(self, group: Optional[str]) -> float:
+        """Get the TTL of a group in seconds"""
+        return self.ttl_seconds.get(group, self.default_ttl)
+
+    def _insert(self, key: str, group: Optional[str], timestamp: float) -> None:
+        previous_group = self._index.get(key, group)
+        if key in self._index:
+            del self._groups[previous_group][key]
+        self._groups.setdefault(group, OrderedDict())[key] = timestamp
+        self._index[key] = group
+
+    def add(self, key: str, group: Optional[str] = None, timestamp: Optional[float] = None) -> None:
+        """Record a key as seen, moving it to the newest position"""
+        self._insert(key, group, timestamp if timestamp is not None else time.time())
+        self._dirty += 1
+        self.evict()
+        if self._dirty >= self.flush_every:
+            self.flush()
+
+    def add_many(self, keys: Iterable[str], group: Optional[str] = None) -> None:
+        """Record several keys as seen and persist them"""
+        now = time.time()
+        for key in keys:
+            self._insert(key, group, now)
+            self._dirty += 1
+        self.flush()
+
+    def evict(self, now: Optional[float] = None) -> int:
+        """Drop keys older than their group's TTL
+
+        Returns:
+            Number of keys dropped
+        """
+        now = now or time.time()
+        evicted = 0
+        for group, keys in self._groups.items():
+            cutoff = now - self.ttl(group)
+            while keys:
+                key, timestamp = next(iter(keys.items()))
+                if timestamp >= cutoff:
+                    break
+                keys.popitem(last=False)
+                del self._index[key]
+                evicted += 1
+        if evicted:
+            self._dirty += evicted
+            logger.debug(f"Evicted {evicted} expired keys from {self.namespace}")
+        return evicted
+
+    def flush(self) -> None:
+        """Persist the store if it has unsaved changes"""
+        if not self._dirty:
+            return
+        try:
+            self.storage.replace_namespace(self.namespace, {
+                key: {'group': group, 'ts': timestamp}
+                for group, keys in self._groups.items()
+                for key, timestamp in keys.items()
+            })
+            self._dirty = 0
+            logger.debug(f"Saved {len(self._index)} keys to {self.namespace}")
+        except Exception as e:
+            logger.error(f"Error saving {self.namespace}: {e}", exc_info=True)
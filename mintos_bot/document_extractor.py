@@ -0,0 +1,308 @@
+"""
+Document Extractor for the Mintos Telegram Bot
+Extracts document links and dates from a company page, either straight from
+the page's embedded Nuxt state or with a single parse and a single walk over
+the parsed tree.
+"""
+import importlib.util
+import json
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from bs4 import BeautifulSoup, Tag
+
+logger = logging.getLogger(__name__)
+
+# lxml builds the tree several times faster than the pure-Python parser
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+MINTOS_BASE_URL = 'https://www.mintos.com'
+
+# Elements whose own text labels a date
+DATE_LABEL_RE = re.compile(r'(Last\s+Updated|Updated|Date)', re.I)
+DATE_LABEL_TAGS = {'span', 'div', 'p'}
+
+# Labelled dates, in order of preference
+LABELLED_DATE_PATTERNS = [re.compile(pattern) for pattern in (
+    r'Last Updated:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
+    r'Last Updated:?\s*(\d{4}-\d{1,2}-\d{1,2})',
+    r'Updated:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
+    r'Updated:?\s*(\d{4}-\d{1,2}-\d{1,2})',
+    r'Date:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
+    r'Date:?\s*(\d{4}-\d{1,2}-\d{1,2})'
+)]
+
+# Bare dates anywhere in the page text, used as a last resort
+PAGE_DATE_PATTERNS = [re.compile(pattern) for pattern in (
+    r'(\d{1,2}\.\d{1,2}\.\d{4})',
+    r'(\d{4}-\d{2}-\d{2})',
+    r'(\d{1,2}/\d{1,2}/\d{4})'
+)]
+
+# Embedded Nuxt state: the lender's file list, e.g.
+# files:[{type:2,path:"https:\u002F\u002F...pdf",title:"Presentation",createdAt:{date:"2024-07-10 12:07:44.000000",...}},...]
+EMBEDDED_STATE_MARKER = 'window.__NUXT__'
+EMBEDDED_FILES_RE = re.compile(r'"?files"?\s*:\s*\[(\{.*?)\]', re.S)
+EMBEDDED_FILE_RE = re.compile(
+    r'"?path"?\s*:\s*"(?P<path>(?:[^"\\]|\\.)*)"\s*,\s*'
+    r'"?title"?\s*:\s*"(?P<title>(?:[^"\\]|\\.)*)"'
+    r'(?:\s*,\s*"?createdAt"?\s*:\s*\{\s*"?date"?\s*:\s*"(?P<date>\d{4}-\d{2}-\d{2}))?'
+)
+
+# Dates near a document link
+LINK_DATE_PATTERNS = [re.compile(pattern) for pattern in (
+    r'Last Updated:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
+    r'Updated:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
+    r'Date:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
+    r'(\d{1,2}\.\d{1,2}\.\d{4})',
+    r'(\d{4}-\d{2}-\d{2})'
+)]
+LINK_DATE_LEVELS = 3  # Ancestors searched for a date near a link
+
+# (pattern, strptime formats tried in order)
+DATE_FORMATS = [
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2}'), ('%Y-%m-%d',)),
+    (re.compile(r'\d{1,2}\.\d{1,2}\.\d{4}'), ('%d.%m.%Y',)),
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{4}'), ('%m/%d/%Y', '%d/%m/%Y')),
+    (re.compile(r'\d{1,2}\.\d{1,2}\.\d{2}'), ('%d.%m.%y',)),
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{2}'), ('%m/%d/%y', '%d/%m/%y'))
+]
+
+def normalize_date(date_str: str) -> str:
+    """
+    Normalize various date formats to YYYY-MM-DD format.
+    Handles formats like DD.MM.YYYY, DD/MM/YYYY, MM/DD/YYYY, YYYY-MM-DD, etc.
+    Slash dates are read as MM/DD first, then DD/MM.
+    """
+    try:
+        for pattern, formats in DATE_FORMATS:
+            if not pattern.match(date_str):
+                continue
+            for index, date_format in enumerate(formats):
+                try:
+                    return datetime.strptime(date_str, date_format).strftime('%Y-%m-%d')
+                except ValueError:
+                    if index == len(formats) - 1:
+                        raise
+        logger.warning(f"Unknown date format: {date_str}")
+        return date_str
+    except Exception as e:
+        logger.error(f"Error normalizing date {date_str}: {e}")
+        return date_str  # Return original if parsing fails
+
+def _absolute_url(href: str) -> str:
+    if href.startswith(('http://', 'https://')):
+        return href
+    return f"{MINTOS_BASE_URL}{href}" if href.startswith('/') else f"{MINTOS_BASE_URL}/{href}"
+
+def _js_string(value: str) -> str:
+    """Decode the escapes in a JavaScript string literal body"""
+    try:
+        return json.loads(f'"{value}"')
+    except ValueError:
+        return value
+
+def _first_match(patterns: Sequence[re.Pattern], text: str) -> Optional[str]:
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+class PageScan:
+    """Everything extraction needs from a page, collected in one tree walk
+
+    Attributes:
+        last_updated_cells: ``<td data-label="Last Updated">`` cells
+        date_labels: span/div/p elements whose own text looks like a date label
+        links: ``<a href>`` elements with their outermost enclosing ``<div>``
+    """
+
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
+        self.last_updated_cells: List[Tag] = []
+        self.date_labels: List[Tag] = []
+        self.links: List[Tuple[Tag, Optional[Tag]]] = []
+        self._container_text: Dict[int, str] = {}
+
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            name = element.name
+            if name == 'a':
+                if element.get('href') is not None:
+                    self.links.append((element, self._top_div(element)))
+            elif name == 'td':
+                if element.get('data-label') == 'Last Updated':
+                    self.last_updated_cells.append(element)
+            if name in DATE_LABEL_TAGS:
+                own_text = element.string
+                if own_text and DATE_LABEL_RE.search(own_text):
+                    self.date_labels.append(element)
+
+    @staticmethod
+    def _top_div(element: Tag) -> Optional[Tag]:
+        """Get the outermost div enclosing element"""
+        top = None
+        for parent in element.parents:
+            if parent.name == 'div':
+                top = parent
+        return top
+
+    def container_text(self, container: Tag) -> str:
+        """Get the lowercased text of a top-level div, computed once
+
+        Any div whose text mentions several document types lies inside a
+        top-level div that does too, so only top-level divs are checked and
+        each one's text is built once rather than once per nested div.
+        """
+        key = id(container)
+        text = self._container_text.get(key)
+        if text is None:
+            text = self._container_text[key] = container.get_text().lower()
+        return text
+
+    def page_date(self) -> str:
+        """Find the page date, falling back to today"""
+        for cell in self.last_updated_cells:
+            date_text = cell.get_text().strip()
+            if date_text:
+                logger.debug(f"Found 'Last Updated' cell with date: {date_text}")
+                return normalize_date(date_text)
+
+        for element in self.date_labels:
+            date_str = _first_match(LABELLED_DATE_PATTERNS, element.get_text().strip())
+            if date_str:
+                normalized_date = normalize_date(date_str)
+                logger.debug(f"Found date in element text: {date_str} -> {normalized_date}")
+                return normalized_date
+
+        date_str = _first_match(PAGE_DATE_PATTERNS, self.soup.get_text())
+        if date_str:
+            normalized_date = normalize_date(date_str)
+            logger.debug(f"Found date in page text: {date_str} -> {normalized_date}")
+            return normalized_date
+
+        logger.warning("No date found in page, using today's date")
+        return datetime.now().strftime('%Y-%m-%d')
+
+def link_date(link: Tag) -> Optional[str]:
+    """Find a date in the text around a link, looking a few ancestors up"""
+    parent = link.parent
+    for _ in range(LINK_DATE_LEVELS):
+        if parent is None:
+            break
+        date_str = _first_match(LINK_DATE_PATTERNS, parent.get_text())
+        if date_str:
+            return normalize_date(date_str)
+        parent = parent.parent
+    return None
+
+def extract_embedded_documents(html_content: str, company_name: str, page_url: str,
+                               document_types: Sequence[str]) -> Optional[List[Dict[str, Any]]]:
+    """Extract document entries from the page's embedded Nuxt state
+
+    Scans the raw HTML with regular expressions, without building a tree.
+    Files carry their upload date, which is used as the document date.
+
+    Returns:
+        Documents in the same form as extract_documents, or None if the page
+        has no embedded file list
+    """
+    start = html_content.find(EMBEDDED_STATE_MARKER)
+    if start == -1:
+        return None
+
+    files = []
+    for files_match in EMBEDDED_FILES_RE.finditer(html_content, start):
+        for file_match in EMBEDDED_FILE_RE.finditer(files_match.group(1)):
+            path = _js_string(file_match.group('path'))
+            if path.lower().endswith('.pdf'):
+                files.append((_js_string(file_match.group('title')), path, file_match.group('date')))
+    if not files:
+        return None
+
+    # Prefer exact titles, then titles containing the document type
+    documents = []
+    for doc_type in document_types:
+        label = doc_type.replace('_', ' ').lower()
+        match = next((f for f in files if f[0].strip().lower() == label), None)
+        match = match or next((f for f in files if label in f[0].lower()), None)
+        if match:
+            title, path, date = match
+            documents.append({
+                'company_name': company_name,
+                'type': doc_type,
+                'title': title.strip(),
+                'url': _absolute_url(path),
+                'company_page_url': page_url,
+                'date': date or datetime.now().strftime('%Y-%m-%d')
+            })
+    logger.debug(f"Found {len(documents)} documents in embedded state for {company_name}")
+    return documents
+
+def extract_dom_documents(html_content: str, company_name: str, page_url: str,
+                          document_types: Sequence[str]) -> List[Dict[str, Any]]:
+    """Extract document entries from the markup of a company page
+
+    Links whose text is exactly a document type are preferred. Types still
+    missing are then matched loosely against PDF links inside top-level
+    divs that mention at least two document types.
+
+    Returns:
+        Documents with company_name, type, title, url, company_page_url and date
+    """
+    scan = PageScan(BeautifulSoup(html_content, HTML_PARSER))
+    page_date = scan.page_date()
+    logger.debug(f"Page date for {company_name}: {page_date}")
+
+    labels = {doc_type: doc_type.replace('_', ' ').lower() for doc_type in document_types}
+    documents = []
+    missing_types = list(document_types)
+
+    def add(doc_type: str, title: str, href: str, date: Optional[str]) -> None:
+        documents.append({
+            'company_name': company_name,
+            'type': doc_type,
+            'title': title,
+            'url': _absolute_url(href),
+            'company_page_url': page_url,
+            'date': date or page_date
+        })
+        missing_types.remove(doc_type)
+
+    # Exact matches first (most reliable): the first such link per type
+    exact_titles = {label: doc_type for doc_type, label in labels.items()}
+    exact_links = {}
+    for link, _ in scan.links:
+        href = str(link.get('href'))
+        if not href.endswith('.pdf'):
+            continue
+        title = link.get_text(strip=True)
+        doc_type = exact_titles.get(title.lower())
+        if doc_type and doc_type not in exact_links:
+            exact_links[doc_type] = (link, title, href)
+    for doc_type in document_types:
+        if doc_type in exact_links:
+            link, title, href = exact_links[doc_type]
+            logger.debug(f"Found exact match for {doc_type}: {href}")
+            add(doc_type, title, href, link_date(link))
+
+    # Document containers: sections mentioning several document types
+    for link, container in scan.links:
+        if not missing_types:
+            break
+        href = str(link.get('href'))
+        if container is None or not href.lower().endswith('.pdf'):
+            continue
+        container_text = scan.container_text(container)
+        if sum(1 for label in labels.values() if label in container_text) < 2:
+            continue
+        title = link.get_text().strip()
+        for doc_type in missing_types:
+            if labels[doc_type] in title.lower():
+                add(doc_type, title, href, None)  # No specific date, use page date
+                break
+
+    return documents
@@ -0,0 +1,101 @@
+"""
+HTTP Client Service for the Mintos Telegram Bot
+Owns the process-wide pooled aiohttp sessions so that network modules reuse
+connections (keep-alive, DNS cache, compression) instead of opening a new
+session, TCP connection and TLS handshake for every request.
+"""
+import asyncio
+import importlib.util
+import logging
+from typing import Dict, Optional
+import aiohttp
+from .constants import (
+    DEFAULT_USER_AGENT,
+    HTTP_API_TIMEOUT,
+    HTTP_POOL_LIMIT,
+    HTTP_POOL_LIMIT_PER_HOST,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT
+)
+
+logger = logging.getLogger(__name__)
+
+# aiohttp decodes brotli only when a brotli package is installed (aiohttp[speedups])
+BROTLI_AVAILABLE = any(importlib.util.find_spec(name) for name in ('brotli', 'brotlicffi'))
+ACCEPT_ENCODING = 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate'
+
+class HTTPClientService:
+    """Process-wide owner of pooled aiohttp sessions
+
+    Sessions are created lazily by name inside the running event loop and
+    share the same pooling settings. The ``default`` session serves API and
+    feed requests; callers may pass a per-request timeout where needed.
+    """
+
+    def __init__(self, limit: int = HTTP_POOL_LIMIT, limit_per_host: int = HTTP_POOL_LIMIT_PER_HOST,
+                 dns_cache_ttl: int = HTTP_DNS_CACHE_TTL, keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT,
+                 timeout: aiohttp.ClientTimeout = HTTP_API_TIMEOUT):
+        """Initialize the service without opening any connections
+
+        Args:
+            limit: Maximum open connections per session
+            limit_per_host: Maximum open connections per host
+            dns_cache_ttl: Seconds to cache DNS lookups
+            keepalive_timeout: Seconds to keep idle connections alive
+            timeout: Default timeout for requests
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._loops: Dict[str, asyncio.AbstractEventLoop] = {}
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.timeout,
+            headers={'User-Agent': DEFAULT_USER_AGENT, 'Accept-Encoding': ACCEPT_ENCODING}
+        )
+
+    def session(self, name: str = 'default') -> aiohttp.ClientSession:
+        """Get a pooled session, creating it on first use in the running loop"""
+        session = self._sessions.get(name)
+        loop = asyncio.get_running_loop()
+        if session is None or session.closed or self._loops.get(name) is not loop:
+            # Sessions are bound to the loop they were created in
+            session = self._sessions[name] = self._create_session()
+            self._loops[name] = loop
+            logger.info(f"Opened pooled HTTP session '{name}'")
+        return session
+
+    async def start(self) -> None:
+        """Open the default session"""
+        self.session()
+
+    async def close(self) -> None:
+        """Close all sessions and their connection pools"""
+        sessions, self._sessions, self._loops = self._sessions, {}, {}
+        for name, session in sessions.items():
+            if not session.closed:
+                try:
+                    await session.close()
+                    logger.info(f"Closed pooled HTTP session '{name}'")
+                except Exception as e:
+                    logger.error(f"Error closing HTTP session '{name}': {e}")
+
+_http_client: Optional[HTTPClientService] = None
+
+def get_http_client() -> HTTPClientService:
+    """Get the process-wide HTTP client service"""
+    global _http_client
+    if _http_client is None:
+        _http_client = HTTPClientService()
+    return _http_client
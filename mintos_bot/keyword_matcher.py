@@ -0,0 +1,75 @@
+"""
+Keyword Matcher for the Mintos Telegram Bot
+Aho-Corasick automaton that finds every occurrence of a set of keywords in a
+text in a single pass, independent of the number of keywords.
+"""
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+class KeywordMatcher:
+    """Multi-keyword substring matcher
+
+    Matching is case-sensitive; callers pass lowercased keywords and text.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """Compile keywords into the automaton"""
+        self.keywords = sorted({keyword for keyword in keywords if keyword})
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+
+        for keyword in self.keywords:
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(keyword)
+
+        # Breadth-first pass linking each state to its longest proper suffix state
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find_all(self, text: str) -> List[Tuple[int, str]]:
+        """Find all keyword occurrences, including overlapping ones
+
+        Returns:
+            (start position, keyword) pairs ordered by end position
+        """
+        matches = []
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword in output[state]:
+                matches.append((position - len(keyword) + 1, keyword))
+        return matches
+
+    def first(self, text: str) -> Optional[str]:
+        """Get the leftmost keyword in text, preferring the longest at that position"""
+        matches = self.find_all(text)
+        if not matches:
+            return None
+        return min(matches, key=lambda match: (match[0], -len(match[1])))[1]
@@ -2,14 +2,21 @@
 Mintos API Client
 Handles communication with the Mintos marketplace API.
 """
+import asyncio
+import json
+import aiohttp
 import requests
 import time
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from .logger import setup_logger
+from .http_client import get_http_client
+from .rate_limiter import TokenBucket
+from .update_validators import UpdateValidatorStore
 from .config import (
     MINTOS_API_BASE,
     MINTOS_CAMPAIGNS_URL,
-    REQUEST_DELAY,
+    MINTOS_MAX_CONCURRENCY,
+    MINTOS_REQUESTS_PER_SECOND,
     MAX_RETRIES,
     RETRY_DELAY,
     REQUEST_TIMEOUT
@@ -20,15 +27,24 @@ logger = setup_logger(__name__)
 class MintosClient:
     """Client for interacting with Mintos API"""
 
-    def __init__(self):
-        """Initialize client with session"""
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (compatible; Mintos Monitor Bot/1.0)',
-            'Accept': 'application/json'
-        })
-        
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (compatible; Mintos Monitor Bot/1.0)',
+        'Accept': 'application/json'
+    }
+
+    def __init__(self, max_concurrency: int = MINTOS_MAX_CONCURRENCY,
+                 requests_per_second: float = MINTOS_REQUESTS_PER_SECOND):
+        """Initialize client with session
 
+        Args:
+            max_concurrency: Number of parallel workers used by fetch_all_updates
+            requests_per_second: Global request rate limit used by fetch_all_updates
+        """
+        self.session = requests.Session()
+        self.session.headers.update(self.HEADERS)
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests_per_second = requests_per_second
+        self.timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
 
     def _make_request(self, url: str, method: str = 'GET', **kwargs) -> Optional[Dict[str, Any]]:
         """Make an HTTP request with retries and error handling"""
@@ -74,27 +90,113 @@ class MintosClient:
         logger.error(f"Failed to get updates for lender {lender_id} after {MAX_RETRIES} attempts")
         return None
 
-    def fetch_all_updates(self, lender_ids: List[Union[int, str]]) -> List[Dict[str, Any]]:
-        """Fetch updates for multiple lenders
-
-        Args:
-            lender_ids: List of lender IDs to fetch updates for
+    async def _request_async(self, session: aiohttp.ClientSession, url: str, limiter: TokenBucket,
+                             headers: Optional[Dict[str, str]] = None) -> Optional[Tuple[int, Any, bytes]]:
+        """Make a rate-limited async GET request with retries and error handling
 
         Returns:
-            List of updates for all lenders
+            Tuple of (status, response headers, body) for 2xx/304 responses, or None if all attempts fail
         """
-        updates = []
-        for lender_id in lender_ids:
+        for attempt in range(MAX_RETRIES):
+            await limiter.acquire()
             try:
-                recovery_data = self.get_recovery_updates(lender_id)
-                if recovery_data:
-                    updates.append({"lender_id": lender_id, **recovery_data})
-                time.sleep(REQUEST_DELAY)
+                async with session.get(url, headers={**self.HEADERS, **(headers or {})}, timeout=self.timeout) as response:
+                    if response.status == 429:
+                        retry_after = float(response.headers.get('Retry-After', RETRY_DELAY * (attempt + 1)))
+                        logger.warning(f"Rate limited by API, pausing requests for {retry_after}s")
+                        limiter.pause(retry_after)
+                        continue
+                    if response.status == 304:
+                        return response.status, response.headers, b''
+                    response.raise_for_status()
+                    return response.status, response.headers, await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"API request failed, attempt {attempt + 1}/{MAX_RETRIES}: {str(e)}")
             except Exception as e:
-                logger.error(f"Error fetching updates for lender {lender_id}: {str(e)}")
-                continue
+                logger.error(f"Unexpected error in API request: {str(e)}")
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(RETRY_DELAY * (attempt + 1))  # Exponential backoff
+        return None
+
+    async def _fetch_lender_updates(self, session: aiohttp.ClientSession, lender_id: Union[int, str],
+                                    limiter: TokenBucket,
+                                    validators: Optional[UpdateValidatorStore]) -> Optional[Dict[str, Any]]:
+        """Fetch one lender's recovery updates, reusing the cached entry when unchanged"""
+        url = f"{MINTOS_API_BASE}/lender-companies/{lender_id}/recovery-updates"
+        headers = validators.request_headers(lender_id) if validators else None
+        result = await self._request_async(session, url, limiter, headers=headers)
+        if result is None:
+            return None
+
+        status, response_headers, body = result
+        if validators:
+            if status == 304:
+                logger.debug(f"Lender {lender_id} not modified (304), reusing cached entry")
+                validators.mark_unchanged(lender_id)
+                return validators.cached_entry(lender_id)
+
+            body_hash = UpdateValidatorStore.body_hash(body)
+            if validators.matches_body(lender_id, body_hash):
+                logger.debug(f"Lender {lender_id} body unchanged, reusing cached entry")
+                validators.mark_unchanged(lender_id)
+                return validators.cached_entry(lender_id)
+            validators.record(
+                lender_id,
+                response_headers.get('ETag'),
+                response_headers.get('Last-Modified'),
+                body_hash
+            )
+
+        return {"lender_id": lender_id, **json.loads(body)}
+
+    async def fetch_all_updates(self, lender_ids: List[Union[int, str]],
+                                validators: Optional[UpdateValidatorStore] = None) -> List[Dict[str, Any]]:
+        """Fetch updates for multiple lenders concurrently
+
+        Lender IDs are consumed by a bounded pool of workers sharing the
+        pooled HTTP session and a global requests-per-second limiter, so the
+        event loop stays free while the sweep runs.
 
-        logger.info(f"Fetched updates for {len(updates)} out of {len(lender_ids)} lenders")
+        Args:
+            lender_ids: List of lender IDs to fetch updates for
+            validators: Optional validator store; when given, conditional requests
+                are sent and unchanged lenders reuse their cached entry
+
+        Returns:
+            List of updates for all lenders, in the order of lender_ids
+        """
+        started = time.monotonic()
+        limiter = TokenBucket(self.requests_per_second)
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, lender_id in enumerate(lender_ids):
+            queue.put_nowait((index, lender_id))
+        results: Dict[int, Dict[str, Any]] = {}
+
+        async def worker(session: aiohttp.ClientSession) -> None:
+            while True:
+                try:
+                    index, lender_id = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    recovery_data = await self._fetch_lender_updates(session, lender_id, limiter, validators)
+                    if recovery_data:
+                        results[index] = recovery_data
+                    else:
+                        logger.error(f"Failed to get updates for lender {lender_id} after {MAX_RETRIES} attempts")
+                except Exception as e:
+                    logger.error(f"Error fetching updates for lender {lender_id}: {str(e)}")
+
+        session = get_http_client().session()
+        workers = min(self.max_concurrency, len(lender_ids))
+        await asyncio.gather(*(worker(session) for _ in range(workers)))
+
+        updates = [results[index] for index in sorted(results)]
+        unchanged = len(validators.unchanged) if validators else 0
+        logger.info(
+            f"Fetched updates for {len(updates)} out of {len(lender_ids)} lenders "
+            f"({unchanged} unchanged) in {time.monotonic() - started:.1f}s"
+        )
         return updates
 
     def get_campaigns(self) -> Optional[List[Dict[str, Any]]]:
@@ -0,0 +1,138 @@
+"""
+News Pre-filter for the Mintos Telegram Bot
+Scores search results locally (company name and alias matches, domain
+allow/deny lists, previously rejected URLs) so that only plausible
+candidates are sent to the LLM for the final selection.
+"""
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+from .keyword_matcher import KeywordMatcher
+
+# Tokens ending the name part of a legal or former name
+NAME_STOP_TOKENS = {
+    'ltd', 'limited', 'llc', 'llp', 'jsc', 'pte', 'pty', 'plc', 'inc', 'gmbh', 'ou', 'as', 'ab', 'ad',
+    'ead', 'eood', 'sa', 'sl', 'slu', 'sas', 'se', 'srl', 'sapi', 'sofom', 'enr', 'cv', 'sp', 'sh', 'z',
+    'oo', 'spolka', 'akcyjna', 'ifn', 'dac', 'shpk', 'doo', 'dooel', 'holding', 'group', 'part',
+    'acquired', 'offers', 'operates', 'provides', 'focuses', 'issues', 'licensed', 'trademark',
+    'entered', 'transitioning', 'brands', 'note', 'legal', 'estonian'
+}
+# Tokens dropped from the start of a legal name
+NAME_PREFIX_TOKENS = {
+    'llc', 'llp', 'uab', 'pt', 'sia', 'as', 'mfo', 'mfc', 'mkk', 'ifn', 'limited', 'liability',
+    'company', 'partnership', 'microfinance', 'organization', 'organisation', 'llmc'
+}
+# Letters that Unicode decomposition does not reduce to ASCII
+FOLD_TRANSLATION = str.maketrans({'ł': 'l', 'ø': 'o', 'đ': 'd', 'ħ': 'h', 'ı': 'i', 'æ': 'ae', 'œ': 'oe'})
+MAX_ALIAS_TOKENS = 4
+MIN_ALIAS_LENGTH = 4
+
+LEGAL_NAME_RE = re.compile(r'Legal name:\s*([^;]+)', re.I)
+FORMER_NAME_RE = re.compile(r'formerly\s+([^,.;()]+)', re.I)
+
+# Score weights
+TITLE_MATCH_SCORE = 3
+DESCRIPTION_MATCH_SCORE = 2
+HIGH_CERTAINTY_SCORE = 1
+ALLOWED_DOMAIN_SCORE = 1
+
+def fold_text(text: str) -> str:
+    """Lowercase text, strip accents and reduce punctuation to single spaces"""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    folded = stripped.casefold().translate(FOLD_TRANSLATION)
+    return ' '.join(re.sub(r'[\W_]+', ' ', folded).split())
+
+def _name_part(text: str) -> str:
+    """Cut a folded legal or former name down to its distinctive words"""
+    tokens = fold_text(text).split()
+    while tokens and tokens[0] in NAME_PREFIX_TOKENS:
+        tokens.pop(0)
+    name = []
+    for index, token in enumerate(tokens):
+        next_token = tokens[index + 1] if index + 1 < len(tokens) else ''
+        if token in NAME_STOP_TOKENS or (len(token) == 1 and len(next_token) == 1):
+            break
+        name.append(token)
+        if len(name) == MAX_ALIAS_TOKENS:
+            break
+    return ' '.join(name)
+
+def company_aliases(company: Dict[str, str]) -> Set[str]:
+    """Get the folded names a company can appear under in news"""
+    company_name = company.get('company_name', '')
+    description = company.get('brief_description', '')
+    aliases = {fold_text(company_name), _name_part(company_name)}
+    for pattern in (LEGAL_NAME_RE, FORMER_NAME_RE):
+        for match in pattern.finditer(description):
+            aliases.add(_name_part(match.group(1)))
+    return {alias for alias in aliases if len(alias) >= MIN_ALIAS_LENGTH}
+
+def result_domain(result: Any) -> str:
+    """Get the hostname of a search result without a www. prefix"""
+    hostname = (getattr(result, 'meta_url', None) or {}).get('hostname') or urlparse(result.url).hostname or ''
+    hostname = hostname.lower()
+    return hostname[4:] if hostname.startswith('www.') else hostname
+
+def _domain_listed(hostname: str, domains: Iterable[str]) -> bool:
+    return any(hostname == domain or hostname.endswith('.' + domain) for domain in domains)
+
+class RelevanceScorer:
+    """Scores one company's search results by how clearly they are about it"""
+
+    def __init__(self, company: Dict[str, str], allowed_domains: Iterable[str] = (),
+                 denied_domains: Iterable[str] = ()):
+        """Build the alias matcher for a company"""
+        self.aliases = company_aliases(company)
+        self.matcher = KeywordMatcher(self.aliases)
+        self.allowed_domains = tuple(allowed_domains)
+        self.denied_domains = tuple(denied_domains)
+
+    def mentions(self, text: str) -> bool:
+        """Check whether folded text names the company as whole words"""
+        folded = fold_text(text)
+        for start, alias in self.matcher.find_all(folded):
+            end = start + len(alias)
+            if (start == 0 or folded[start - 1] == ' ') and (end == len(folded) or folded[end] == ' '):
+                return True
+        return False
+
+    def score(self, result: Any, high_certainty: bool = False,
+              rejected_urls: Optional[Set[str]] = None) -> int:
+        """Score a result, 0 meaning it should not be sent to the LLM"""
+        if rejected_urls and result.url in rejected_urls:
+            return 0
+        hostname = result_domain(result)
+        if _domain_listed(hostname, self.denied_domains):
+            return 0
+        score = 0
+        if self.mentions(result.title):
+            score += TITLE_MATCH_SCORE
+        if self.mentions(result.description):
+            score += DESCRIPTION_MATCH_SCORE
+        if not score:
+            return 0
+        if high_certainty:
+            score += HIGH_CERTAINTY_SCORE
+        if _domain_listed(hostname, self.allowed_domains):
+            score += ALLOWED_DOMAIN_SCORE
+        return score
+
+    def rank(self, results: Iterable[Tuple[Any, bool]], top_k: int,
+             rejected_urls: Optional[Set[str]] = None) -> List[Any]:
+        """Get the top_k passing results of (result, high certainty) pairs, best first
+
+        Ties keep the original order, so quoted results stay ahead of unquoted ones.
+        """
+        scored = []
+        seen_urls = set()
+        for position, (result, high_certainty) in enumerate(results):
+            if result.url in seen_urls:
+                continue
+            seen_urls.add(result.url)
+            score = self.score(result, high_certainty, rejected_urls)
+            if score:
+                scored.append((-score, position, result))
+        scored.sort(key=lambda item: (item[0], item[1]))
+        return [result for _, _, result in scored[:top_k]]
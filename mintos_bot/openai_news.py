@@ -4,22 +4,43 @@ Uses Brave API for search, then OpenAI for selecting most authoritative source
 """
 
 import asyncio
-import aiohttp
 import json
+import re
 import urllib.parse
 import os
 import csv
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 # import pandas as pd  # Temporarily disabled due to system library issues
+import aiohttp
 
 from .logger import setup_logger
 from .brave_news import BraveNewsReader, BraveNewsResult
 from .config_loader import load_openai_key
+from .config import (
+    NEWS_ANALYSIS_CONCURRENCY,
+    NEWS_PREFILTER_TOP_K,
+    NEWS_ALLOWED_DOMAINS,
+    NEWS_DENIED_DOMAINS,
+    NEWS_BATCH_SIZE,
+    NEWS_BATCH_MAX_WAIT_SECONDS,
+    NEWS_BATCH_TOKENS_PER_COMPANY,
+    OPENAI_API_BASE
+)
+from .constants import HTTP_LLM_TIMEOUT
+from .http_client import get_http_client
+from .storage import get_storage
+from .verdict_cache import VerdictCache, candidate_digest
+from .news_prefilter import RelevanceScorer
 
 logger = setup_logger(__name__)
 
+ANALYSIS_MODEL = "gpt-4o"
+# Storage document holding the pending OpenAI Batch API job
+BATCH_JOB_NAMESPACE = 'openai_batch_job'
+
 @dataclass
 class OpenAINewsItem:
     """Represents a news item found by OpenAI"""
@@ -53,31 +74,85 @@ class OpenAINewsReader:
         self.rejected_urls_file = 'data/openai_rejected_urls.json'
         self._ensure_csv_headers()
         self._load_rejected_urls()
-
-    async def _select_best_result_with_openai(self, quoted_results: List[BraveNewsResult], unquoted_results: List[BraveNewsResult], company: Dict[str, str]):
-        """Use OpenAI to analyze both quoted and unquoted Brave results and select the most authoritative/relevant one"""
-        all_results = quoted_results + unquoted_results
-        if not self.openai_api_key or not all_results:
-            return None
-            
-        try:
-            company_name = company.get('company_name', 'Unknown')
-            brief_description = company.get('brief_description', '')
-            
-            # Add certainty tags to results for OpenAI analysis
-            tagged_results = []
-            for result in quoted_results:
-                result.certainty = 'high'
-                tagged_results.append(result)
-            for result in unquoted_results:
-                result.certainty = 'low'
-                tagged_results.append(result)
+        self.verdicts = VerdictCache()
+        self._scorers: Dict[str, RelevanceScorer] = {}
+
+    def _scorer(self, company: Dict[str, str]) -> RelevanceScorer:
+        """Get the local relevance scorer of a company, building it on first use"""
+        company_name = company.get('company_name', 'Unknown')
+        scorer = self._scorers.get(company_name)
+        if scorer is None:
+            scorer = RelevanceScorer(company, NEWS_ALLOWED_DOMAINS, NEWS_DENIED_DOMAINS)
+            self._scorers[company_name] = scorer
+        return scorer
+
+    def _apply_analysis(self, analysis: Dict[str, Any], candidates: List[BraveNewsResult], company: Dict[str, str]):
+        """Turn an OpenAI analysis into its selected news item
+
+        Returns:
+            (analysis, selected item), or the analysis alone if nothing was selected
+        """
+        company_name = company.get('company_name', 'Unknown')
+        brief_description = company.get('brief_description', '')
+        
+        if not analysis.get('is_relevant', False):
+            logger.info(f"OpenAI determined no relevant results for {company_name}")
+            return analysis  # Return analysis for logging
             
-            # Prepare results summary for OpenAI analysis
-            results_summary = []
-            for i, result in enumerate(tagged_results, 1):
-                certainty_tag = "[HIGH CERTAINTY]" if getattr(result, 'certainty', 'low') == 'high' else "[LOWER CERTAINTY]"
-                results_summary.append(f"""
+        selected_index = analysis.get('selected_index', 1) - 1  # Convert to 0-based
+        if 0 <= selected_index < len(candidates):
+            selected_result = candidates[selected_index]
+                
+            # Use OpenAI's content analysis and translation
+            final_content = analysis.get('content_summary', selected_result.description)
+            if analysis.get('translation_needed', False) and analysis.get('translated_summary'):
+                final_content = analysis.get('translated_summary')
+                
+            # Create OpenAI news item from selected Brave result
+            selected_item = OpenAINewsItem(
+                title=analysis.get('title', selected_result.title),
+                url=selected_result.url,
+                date=self._parse_brave_date(selected_result.page_age),
+                content=final_content,
+                company_name=company_name,
+                search_terms=f'"{company_name}",{brief_description}'
+            )
+            return (analysis, selected_item)
+            
+        return analysis  # Return analysis even if no item selected
+
+    def _candidates(self, quoted_results: List[BraveNewsResult], unquoted_results: List[BraveNewsResult],
+                    company: Dict[str, str]) -> List[BraveNewsResult]:
+        """Tag results with their certainty and keep the best locally scored ones"""
+        tagged_results = []
+        for result in quoted_results:
+            result.certainty = 'high'
+            tagged_results.append(result)
+        for result in unquoted_results:
+            result.certainty = 'low'
+            tagged_results.append(result)
+        
+        return self._scorer(company).rank(
+            ((result, result.certainty == 'high') for result in tagged_results),
+            NEWS_PREFILTER_TOP_K, self.rejected_urls
+        )
+
+    @staticmethod
+    def _prefilter_verdict(company_name: str) -> Dict[str, Any]:
+        """Analysis returned when no result passes the local pre-filter"""
+        logger.info(f"No results for {company_name} passed the local pre-filter, skipping OpenAI")
+        return {
+            'is_relevant': False,
+            'reasoning': f'No result mentions {company_name} by name (local pre-filter)'
+        }
+
+    @staticmethod
+    def _results_summary(candidates: List[BraveNewsResult]) -> str:
+        """Describe candidates for an OpenAI prompt, numbered from 1"""
+        results_summary = []
+        for i, result in enumerate(candidates, 1):
+            certainty_tag = "[HIGH CERTAINTY]" if getattr(result, 'certainty', 'low') == 'high' else "[LOWER CERTAINTY]"
+            results_summary.append(f"""
 Result {i} {certainty_tag}:
 Title: {result.title}
 URL: {result.url}
@@ -85,14 +160,19 @@ Description: {result.description}
 Published: {result.age}
 Source Domain: {result.meta_url.get('hostname', 'Unknown')}
 """)
-            
-            # Create prompt for OpenAI to select best result
-            prompt = f"""
+        return chr(10).join(results_summary)
+
+    def _single_prompt(self, company: Dict[str, str], candidates: List[BraveNewsResult]) -> str:
+        """Build the prompt selecting the best result for one company"""
+        company_name = company.get('company_name', 'Unknown')
+        brief_description = company.get('brief_description', '')
+        results_summary = self._results_summary(candidates)
+        return f"""
 You are analyzing news search results for the financial company "{company_name}" ({brief_description}).
 
 Please review these search results and select the SINGLE most authoritative and relevant news article:
 
-{chr(10).join(results_summary)}
+{results_summary}
 
 CRITICAL COMPANY RELEVANCE CRITERIA:
 The article MUST specifically mention "{company_name}" by name in the title OR description.
@@ -138,84 +218,357 @@ For translation: If the content contains non-English text (Spanish, Russian, Ger
 If NO results specifically mention "{company_name}" by name, set "is_relevant": false.
 """
 
-            payload = {
-                "model": "gpt-4o",
-                "messages": [
-                    {"role": "system", "content": "You are a financial news analyst that selects the most credible and relevant news sources."},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.1,
-                "max_tokens": 300
-            }
-            
-            headers = {
-                "Authorization": f"Bearer {self.openai_api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                async with session.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    json=payload,
-                    headers=headers
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"OpenAI API request failed: {response.status} - {error_text}")
-                        return None
-                    
-                    data = await response.json()
-                    content = data.get('choices', [{}])[0].get('message', {}).get('content', '')
-                    
-                    if not content:
-                        logger.warning(f"No content in OpenAI response for {company_name}")
-                        return None
-                    
-                    # Parse OpenAI response
-                    analysis = None
-                    try:
-                        import re
-                        json_match = re.search(r'\{.*\}', content, re.DOTALL)
-                        if json_match:
-                            analysis = json.loads(json_match.group())
-                            
-                            if not analysis.get('is_relevant', False):
-                                logger.info(f"OpenAI determined no relevant results for {company_name}")
-                                return analysis  # Return analysis for logging
-                            
-                            selected_index = analysis.get('selected_index', 1) - 1  # Convert to 0-based
-                            if 0 <= selected_index < len(all_results):
-                                selected_result = all_results[selected_index]
-                                
-                                # Use OpenAI's content analysis and translation
-                                final_content = analysis.get('content_summary', selected_result.description)
-                                if analysis.get('translation_needed', False) and analysis.get('translated_summary'):
-                                    final_content = analysis.get('translated_summary')
-                                
-                                # Create OpenAI news item from selected Brave result
-                                selected_item = OpenAINewsItem(
-                                    title=analysis.get('title', selected_result.title),
-                                    url=selected_result.url,
-                                    date=self._parse_brave_date(selected_result.page_age),
-                                    content=final_content,
-                                    company_name=company_name,
-                                    search_terms=f'"{company_name}",{brief_description}'
-                                )
-                                return (analysis, selected_item)
-                            
-                    except (json.JSONDecodeError, KeyError) as e:
-                        logger.error(f"Error parsing OpenAI analysis response: {e}")
-                        return None
-                    
-                    return analysis  # Return analysis even if no item selected
-                        
-        except Exception as e:
+    def _batch_prompt(self, jobs: List[Tuple[Dict[str, str], List[BraveNewsResult]]]) -> str:
+        """Build one prompt selecting the best result for each of several companies
+
+        The instructions are sent once and each company gets an id (C1, C2, ...)
+        that its verdict is returned under.
+        """
+        sections = []
+        for number, (company, candidates) in enumerate(jobs, 1):
+            sections.append(
+                f"=== Company C{number}: \"{company.get('company_name', 'Unknown')}\" "
+                f"({company.get('brief_description', '')}) ===\n{self._results_summary(candidates)}"
+            )
+        return f"""
+You are analyzing news search results for several financial companies. Each company below has its own numbered search results.
+
+For EACH company, select the SINGLE most authoritative and relevant news article among that company's results.
+
+CRITICAL COMPANY RELEVANCE CRITERIA:
+The article MUST specifically mention the company by name in the title OR description.
+
+REJECT articles that only contain:
+- General industry trends without mentioning the company specifically
+- Competitor news (other companies in the same sector)
+- General market analysis or sector reports
+- Job postings or career-related content
+- Regional economic news without company-specific information
+- Regulatory changes affecting the industry broadly
+
+ACCEPT articles that discuss the company's financial results, business announcements, acquisitions, mergers, partnerships, new products or markets, executive changes, regulatory or legal matters, or quote its representatives.
+
+Selection criteria (in order of priority):
+1. MUST explicitly mention the company by name
+2. Comes from credible financial/business news sources
+3. Contains specific information about the company's business operations or financial performance
+4. Has recent and accurate information
+5. When results have similar quality, prioritize [HIGH CERTAINTY] results over [LOWER CERTAINTY] ones
+
+{chr(10).join(sections)}
+
+Respond ONLY with a JSON object in this exact format, with one entry per company:
+{{
+    "companies": [
+        {{
+            "company_id": "<company id, e.g. C1>",
+            "selected_index": <1-based index of chosen result within that company's results>,
+            "reasoning": "<brief explanation focusing on how the article specifically mentions the company>",
+            "title": "<exact title from chosen result>",
+            "content_summary": "<create a clear 1-2 sentence summary focusing on what this means for the company>",
+            "translation_needed": <true/false - whether the content appears to be in a non-English language>,
+            "translated_summary": "<if translation_needed is true, provide English translation of the summary>",
+            "is_relevant": true/false
+        }}
+    ]
+}}
+
+For translation: If the content contains non-English text (Spanish, Russian, German, etc.), set translation_needed to true and provide an English translation.
+
+If NO results of a company specifically mention it by name, set "is_relevant": false for that company.
+"""
+
+    def _chat_payload(self, prompt: str, max_tokens: int, json_mode: bool = False) -> Dict[str, Any]:
+        """Build a chat completions request body"""
+        payload = {
+            "model": ANALYSIS_MODEL,
+            "messages": [
+                {"role": "system", "content": "You are a financial news analyst that selects the most credible and relevant news sources."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.1,
+            "max_tokens": max_tokens
+        }
+        if json_mode:
+            payload["response_format"] = {"type": "json_object"}
+        return payload
+
+    def _api_headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.openai_api_key}",
+            "Content-Type": "application/json"
+        }
+
+    async def _chat_completion(self, payload: Dict[str, Any], label: str) -> Optional[str]:
+        """Send a chat completions request and return the message content"""
+        session = get_http_client().session()
+        async with session.post(
+            f"{OPENAI_API_BASE}/chat/completions",
+            json=payload,
+            headers=self._api_headers(),
+            timeout=HTTP_LLM_TIMEOUT
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                logger.error(f"OpenAI API request failed: {response.status} - {error_text}")
+                return None
+                
+            data = await response.json()
+            content = data.get('choices', [{}])[0].get('message', {}).get('content', '')
+            if not content:
+                logger.warning(f"No content in OpenAI response for {label}")
+                return None
+            return content
+
+    @staticmethod
+    def _parse_json_object(content: str) -> Optional[Dict[str, Any]]:
+        """Extract the JSON object from a model response"""
+        try:
+            json_match = re.search(r'\{.*\}', content, re.DOTALL)
+            if json_match:
+                return json.loads(json_match.group())
+        except json.JSONDecodeError as e:
+            logger.error(f"Error parsing OpenAI analysis response: {e}")
+        return None
+
+    @staticmethod
+    def _batch_analyses(parsed: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Map company ids to their analysis in a parsed batch response"""
+        entries = parsed.get('companies', []) if isinstance(parsed, dict) else []
+        return {
+            str(entry.get('company_id')): entry
+            for entry in entries if isinstance(entry, dict) and entry.get('company_id')
+        }
+
+    async def _classify_single(self, company: Dict[str, str], candidates: List[BraveNewsResult]) -> Optional[Dict[str, Any]]:
+        """Ask OpenAI to pick the best candidate for one company"""
+        company_name = company.get('company_name', 'Unknown')
+        content = await self._chat_completion(self._chat_payload(self._single_prompt(company, candidates), 300), company_name)
+        return self._parse_json_object(content) if content else None
+
+    async def _classify_batch(self, jobs: List[Tuple[Dict[str, str], List[BraveNewsResult]]]) -> Dict[str, Dict[str, Any]]:
+        """Ask OpenAI to pick the best candidate for several companies in one request
+
+        Returns:
+            Analyses keyed by company id (C1, C2, ... in job order)
+        """
+        payload = self._chat_payload(self._batch_prompt(jobs), NEWS_BATCH_TOKENS_PER_COMPANY * len(jobs), json_mode=True)
+        content = await self._chat_completion(payload, f"batch of {len(jobs)} companies")
+        return self._batch_analyses(self._parse_json_object(content)) if content else {}
+
+    async def _select_best_results(self, jobs: List[Tuple[Dict[str, str], List[BraveNewsResult], List[BraveNewsResult]]]
+                                   ) -> Tuple[List[Any], List[List[BraveNewsResult]]]:
+        """Select the best result for several companies, sharing one OpenAI request between them
+
+        Companies resolved by the local pre-filter or the verdict cache cost no
+        request; the rest are classified together in a single batched request.
+
+        Returns:
+            Per job, the result ((analysis, item), the analysis alone, or None)
+            and the candidates the verdict was made for
+        """
+        results: List[Any] = [None] * len(jobs)
+        sent: List[List[BraveNewsResult]] = [[] for _ in jobs]
+        if not self.openai_api_key:
+            return results, sent
+        
+        pending = []
+        for position, (company, quoted_results, unquoted_results) in enumerate(jobs):
             company_name = company.get('company_name', 'Unknown')
-            logger.error(f"Error in OpenAI analysis for {company_name}: {e}")
+            try:
+                if not quoted_results and not unquoted_results:
+                    continue
+                candidates = self._candidates(quoted_results, unquoted_results, company)
+                if not candidates:
+                    results[position] = self._prefilter_verdict(company_name)
+                    continue
+                sent[position] = candidates
+                # Reuse the previous verdict when the candidates have not changed
+                digest = candidate_digest((result.certainty, result.url, result.title) for result in candidates)
+                cached_analysis = self.verdicts.get(company_name, digest)
+                if cached_analysis is not None:
+                    logger.info(f"Reusing cached OpenAI verdict for {company_name}")
+                    results[position] = self._apply_analysis(cached_analysis, candidates, company)
+                    continue
+                pending.append((position, company, candidates, digest))
+            except Exception as e:
+                logger.error(f"Error in OpenAI analysis for {company_name}: {e}")
+        
+        analyses: Dict[str, Dict[str, Any]] = {}
+        if len(pending) > 1:
+            try:
+                analyses = await self._classify_batch([(company, candidates) for _, company, candidates, _ in pending])
+                logger.info(f"OpenAI returned {len(analyses)} verdicts for a batch of {len(pending)} companies")
+            except Exception as e:
+                logger.error(f"Error in batched OpenAI analysis: {e}")
+        
+        for number, (position, company, candidates, digest) in enumerate(pending, 1):
+            company_name = company.get('company_name', 'Unknown')
+            try:
+                analysis = analyses.get(f"C{number}")
+                if analysis is None:
+                    # Single company, or missing from the batch response
+                    analysis = await self._classify_single(company, candidates)
+                if analysis is not None:
+                    self.verdicts.put(company_name, digest, analysis)
+                    results[position] = self._apply_analysis(analysis, candidates, company)
+            except Exception as e:
+                logger.error(f"Error in OpenAI analysis for {company_name}: {e}")
+        return results, sent
+
+    async def submit_batch_job(self, days: int) -> Optional[str]:
+        """Search all companies and submit their uncached analyses as an OpenAI Batch API job
+
+        Each line of the job packs NEWS_BATCH_SIZE companies. Run collect_batch_job
+        later to load the verdicts into the verdict cache, after which
+        fetch_news_by_days needs no OpenAI requests for those companies.
+
+        Returns:
+            The batch id, or None if nothing was submitted
+        """
+        if not self.openai_api_key:
+            logger.error("OpenAI API key not configured")
+            return None
+        if get_storage().load_document(BATCH_JOB_NAMESPACE):
+            logger.warning("An OpenAI batch job is already pending, collect it before submitting another")
             return None
         
-        return None
-    
+        pending = []
+        for company in self.companies:
+            company_name = company.get('company_name', 'Unknown')
+            try:
+                quoted_results, unquoted_results = await self._search_brave(company, days)
+                candidates = self._candidates(quoted_results, unquoted_results, company)
+                if not candidates:
+                    continue
+                digest = candidate_digest((result.certainty, result.url, result.title) for result in candidates)
+                if self.verdicts.get(company_name, digest) is None:
+                    pending.append((company, candidates, digest))
+            except Exception as e:
+                logger.error(f"Error preparing batch analysis for {company_name}: {e}")
+        
+        if not pending:
+            logger.info("All company verdicts are cached, no OpenAI batch job needed")
+            return None
+        
+        batch_size = max(1, NEWS_BATCH_SIZE)
+        request_lines = []
+        groups = {}
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            custom_id = f"news-{start // batch_size}"
+            payload = self._chat_payload(
+                self._batch_prompt([(company, candidates) for company, candidates, _ in chunk]),
+                NEWS_BATCH_TOKENS_PER_COMPANY * len(chunk), json_mode=True
+            )
+            request_lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": payload
+            }))
+            groups[custom_id] = [[company.get('company_name', 'Unknown'), digest] for company, _, digest in chunk]
+        
+        try:
+            session = get_http_client().session()
+            auth = {"Authorization": f"Bearer {self.openai_api_key}"}
+            form = aiohttp.FormData()
+            form.add_field('purpose', 'batch')
+            form.add_field('file', '\n'.join(request_lines).encode('utf-8'),
+                           filename='company_news.jsonl', content_type='application/jsonl')
+            async with session.post(f"{OPENAI_API_BASE}/files", data=form, headers=auth) as response:
+                if response.status != 200:
+                    logger.error(f"OpenAI batch file upload failed: {response.status} - {await response.text()}")
+                    return None
+                input_file_id = (await response.json()).get('id')
+            
+            async with session.post(
+                f"{OPENAI_API_BASE}/batches",
+                json={
+                    "input_file_id": input_file_id,
+                    "endpoint": "/v1/chat/completions",
+                    "completion_window": "24h"
+                },
+                headers=self._api_headers()
+            ) as response:
+                if response.status != 200:
+                    logger.error(f"OpenAI batch creation failed: {response.status} - {await response.text()}")
+                    return None
+                batch_id = (await response.json()).get('id')
+        except Exception as e:
+            logger.error(f"Error submitting OpenAI batch job: {e}")
+            return None
+        
+        get_storage().save_document(BATCH_JOB_NAMESPACE, {
+            'batch_id': batch_id,
+            'submitted_at': datetime.now().isoformat(),
+            'groups': groups
+        }, backup=False)
+        logger.info(f"Submitted OpenAI batch job {batch_id} for {len(pending)} companies in {len(request_lines)} requests")
+        return batch_id
+
+    async def collect_batch_job(self) -> int:
+        """Load the verdicts of a finished OpenAI batch job into the verdict cache
+
+        Returns:
+            Number of verdicts stored; 0 if no job is pending or it has not finished yet
+        """
+        job = get_storage().load_document(BATCH_JOB_NAMESPACE)
+        if not job:
+            return 0
+        batch_id = job.get('batch_id')
+        
+        try:
+            session = get_http_client().session()
+            async with session.get(f"{OPENAI_API_BASE}/batches/{batch_id}", headers=self._api_headers()) as response:
+                if response.status != 200:
+                    logger.error(f"OpenAI batch status request failed: {response.status} - {await response.text()}")
+                    return 0
+                batch = await response.json()
+            
+            status = batch.get('status')
+            if status in ('failed', 'expired', 'cancelled'):
+                logger.warning(f"OpenAI batch job {batch_id} ended with status {status}, discarding it")
+                get_storage().save_document(BATCH_JOB_NAMESPACE, {}, backup=False)
+                return 0
+            if status != 'completed':
+                logger.info(f"OpenAI batch job {batch_id} is {status}")
+                return 0
+            if not batch.get('output_file_id'):
+                # Completed with every request failed: nothing to collect
+                logger.warning(f"OpenAI batch job {batch_id} completed without output, discarding it")
+                get_storage().save_document(BATCH_JOB_NAMESPACE, {}, backup=False)
+                return 0
+            
+            async with session.get(f"{OPENAI_API_BASE}/files/{batch.get('output_file_id')}/content",
+                                   headers=self._api_headers()) as response:
+                if response.status != 200:
+                    logger.error(f"OpenAI batch output download failed: {response.status} - {await response.text()}")
+                    return 0
+                output = await response.text()
+        except Exception as e:
+            logger.error(f"Error collecting OpenAI batch job {batch_id}: {e}")
+            return 0
+        
+        stored = 0
+        for line in output.splitlines():
+            try:
+                record = json.loads(line)
+                body = (record.get('response') or {}).get('body') or {}
+                content = body.get('choices', [{}])[0].get('message', {}).get('content', '')
+                analyses = self._batch_analyses(self._parse_json_object(content)) if content else {}
+                for number, (company_name, digest) in enumerate(job['groups'].get(record.get('custom_id'), []), 1):
+                    analysis = analyses.get(f"C{number}")
+                    if analysis is not None:
+                        self.verdicts.put(company_name, digest, analysis)
+                        stored += 1
+            except Exception as e:
+                logger.error(f"Error reading OpenAI batch output line: {e}")
+        
+        get_storage().save_document(BATCH_JOB_NAMESPACE, {}, backup=False)
+        logger.info(f"Stored {stored} verdicts from OpenAI batch job {batch_id}")
+        return stored
+
     def _ensure_csv_headers(self):
         """Ensure CSV file exists with proper headers"""
         try:
@@ -353,76 +706,117 @@ If NO results specifically mention "{company_name}" by name, set "is_relevant":
 
 
 
-    async def search_company_news_with_date_filter(self, company: Dict[str, str], days_back: int) -> List[OpenAINewsItem]:
+    async def _search_brave(self, company: Dict[str, str], days_back: int,
+                            use_cache: bool = True) -> Tuple[List[BraveNewsResult], List[BraveNewsResult]]:
+        """Run the quoted and unquoted Brave searches for a company
+
+        Both requests are paced by the Brave reader's rate limiter and served
+        from the search cache when use_cache is set.
+        """
+        company_name = company.get('company_name', 'Unknown Company')
+        
+        # Search Brave API with quoted company name (high certainty)
+        logger.info(f"Searching Brave API for {company_name} (quoted)")
+        quoted_results_raw = await self.brave_reader.search_company_news(company, days_back, use_cache)
+        quoted_results = self._filter_rejected_urls(quoted_results_raw)
+        
+        # Search Brave API without quotes (lower certainty)
+        logger.info(f"Searching Brave API for {company_name} (unquoted)")
+        unquoted_company = company.copy()
+        unquoted_company['use_quotes'] = 'false'
+        unquoted_results_raw = await self.brave_reader.search_company_news(unquoted_company, days_back, use_cache)
+        unquoted_results = self._filter_rejected_urls(unquoted_results_raw)
+        
+        return quoted_results, unquoted_results
+
+    async def _analyze_company(self, company: Dict[str, str], quoted_results: List[BraveNewsResult],
+                               unquoted_results: List[BraveNewsResult], days_back: int) -> List[OpenAINewsItem]:
+        """Use OpenAI to pick the best Brave result for a company"""
+        return (await self._analyze_companies([(company, quoted_results, unquoted_results)], days_back))[0]
+
+    async def _analyze_companies(self, jobs: List[Tuple[Dict[str, str], List[BraveNewsResult], List[BraveNewsResult]]],
+                                 days_back: int) -> List[List[OpenAINewsItem]]:
+        """Use OpenAI to pick the best Brave result for several companies at once"""
+        for company, quoted_results, unquoted_results in jobs:
+            company_name = company.get('company_name', 'Unknown Company')
+            total_results = len(quoted_results) + len(unquoted_results)
+            logger.info(f"Found {len(quoted_results)} quoted + {len(unquoted_results)} unquoted = {total_results} total results for {company_name}")
+        
+        openai_results, sent = await self._select_best_results(jobs)
+        return [
+            self._record_analysis(company, quoted_results, unquoted_results, openai_result, candidates, days_back)
+            for (company, quoted_results, unquoted_results), openai_result, candidates in zip(jobs, openai_results, sent)
+        ]
+
+    def _record_analysis(self, company: Dict[str, str], quoted_results: List[BraveNewsResult],
+                         unquoted_results: List[BraveNewsResult], openai_result: Any,
+                         candidates: List[BraveNewsResult], days_back: int) -> List[OpenAINewsItem]:
+        """Log a company's analysis, track rejected URLs and return its selected item
+
+        Args:
+            candidates: Results the verdict was made for, i.e. the ones sent to OpenAI
+        """
+        company_name = company.get('company_name', 'Unknown Company')
+        if not quoted_results and not unquoted_results:
+            logger.info(f"No Brave results found for {company_name}")
+            # Still log the empty search
+            self._log_to_csv(company, [], [], None, None, days_back)
+            return []
+        
+        analysis = None
+        selected_item = None
+        
+        if isinstance(openai_result, tuple):
+            # Got both analysis and selected item
+            analysis, selected_item = openai_result
+        elif isinstance(openai_result, dict):
+            # Got only analysis (no relevant results)
+            analysis = openai_result
+        
+        # Track rejected URLs if OpenAI marked results as not relevant. Only the
+        # results it saw and those failing the pre-filter are rejected; passing
+        # results ranked below the top k were never judged.
+        if analysis and not analysis.get('is_relevant', False):
+            scorer = self._scorer(company)
+            self._track_rejected_urls(candidates + [
+                result for result in quoted_results + unquoted_results
+                if scorer.score(result) == 0
+            ])
+        
+        # Log to CSV regardless of outcome
+        self._log_to_csv(company, quoted_results, unquoted_results, analysis, selected_item, days_back)
+        
+        if selected_item:
+            logger.info(f"OpenAI selected best result for {company_name}: {selected_item.title}")
+            return [selected_item]
+        else:
+            logger.info(f"OpenAI found no suitable results for {company_name}")
+            return []
+
+    async def search_company_news_with_date_filter(self, company: Dict[str, str], days_back: int,
+                                                   use_cache: bool = True) -> List[OpenAINewsItem]:
         """Search for company news using Brave API + OpenAI analysis"""
         if not self.openai_api_key:
             logger.error("OpenAI API key not configured")
             return []
         
         try:
-            company_name = company.get('company_name', 'Unknown Company')
-            
-            # Step 1: Search Brave API with quoted company name (high certainty)
-            logger.info(f"Searching Brave API for {company_name} (quoted)")
-            quoted_results_raw = await self.brave_reader.search_company_news(company, days_back)
-            quoted_results = self._filter_rejected_urls(quoted_results_raw)
-            
-            # Step 2: Rate limiting between queries (Brave API: 1 request per second)
-            await asyncio.sleep(1.1)
-            
-            # Step 3: Search Brave API without quotes (lower certainty)
-            logger.info(f"Searching Brave API for {company_name} (unquoted)")
-            # Create unquoted version of company data
-            unquoted_company = company.copy()
-            unquoted_company['use_quotes'] = 'false'
-            unquoted_results_raw = await self.brave_reader.search_company_news(unquoted_company, days_back)
-            unquoted_results = self._filter_rejected_urls(unquoted_results_raw)
-            
-            total_results = len(quoted_results) + len(unquoted_results)
-            logger.info(f"Found {len(quoted_results)} quoted + {len(unquoted_results)} unquoted = {total_results} total results for {company_name}")
-            
-            if total_results == 0:
-                logger.info(f"No Brave results found for {company_name}")
-                # Still log the empty search
-                self._log_to_csv(company, [], [], None, None, days_back)
-                return []
-            
-            # Step 4: Use OpenAI to analyze both sets of results
-            openai_result = await self._select_best_result_with_openai(quoted_results, unquoted_results, company)
-            
-            analysis = None
-            selected_item = None
-            
-            if isinstance(openai_result, tuple):
-                # Got both analysis and selected item
-                analysis, selected_item = openai_result
-            elif isinstance(openai_result, dict):
-                # Got only analysis (no relevant results)
-                analysis = openai_result
-            
-            # Track rejected URLs if OpenAI marked results as not relevant
-            if analysis and not analysis.get('is_relevant', False):
-                self._track_rejected_urls(quoted_results + unquoted_results)
-            
-            # Log to CSV regardless of outcome
-            self._log_to_csv(company, quoted_results, unquoted_results, analysis, selected_item, days_back)
-            
-            if selected_item:
-                logger.info(f"OpenAI selected best result for {company_name}: {selected_item.title}")
-                return [selected_item]
-            else:
-                logger.info(f"OpenAI found no suitable results for {company_name}")
-                return []
-                    
+            quoted_results, unquoted_results = await self._search_brave(company, days_back, use_cache)
+            return await self._analyze_company(company, quoted_results, unquoted_results, days_back)
         except Exception as e:
             company_name = company.get('company_name', 'Unknown Company')
             logger.error(f"Error searching news for {company_name}: {e}")
             return []
 
+    async def fetch_news_by_days(self, days: int, use_cache: bool = True) -> List[OpenAINewsItem]:
+        """Fetch news for all companies within specified days using Brave + OpenAI
 
-
-    async def fetch_news_by_days(self, days: int, use_cache: bool = False) -> List[OpenAINewsItem]:
-        """Fetch news for all companies within specified days using Brave + OpenAI"""
+        Brave searches run back to back at the Brave rate limit while up to
+        NEWS_ANALYSIS_CONCURRENCY OpenAI analyses of earlier companies run
+        alongside them. Each analysis covers up to NEWS_BATCH_SIZE companies
+        in one request. Results keep the order of the company list. Brave
+        results are reused from the search cache unless use_cache is False.
+        """
         # Check if companies are loaded, if not reload them
         if not self.companies:
             logger.warning("No companies loaded, attempting to reload...")
@@ -430,23 +824,68 @@ If NO results specifically mention "{company_name}" by name, set "is_relevant":
             self.companies = self.brave_reader.companies
             logger.info(f"Reloaded {len(self.companies)} companies")
         
+        if not self.openai_api_key:
+            logger.error("OpenAI API key not configured")
+            return []
+        
         logger.info(f"Starting news search for {len(self.companies)} companies over {days} days")
-        all_news = []
+        started = time.monotonic()
+        results: List[List[OpenAINewsItem]] = [[] for _ in self.companies]
+        workers_count = max(1, NEWS_ANALYSIS_CONCURRENCY)
+        batch_size = max(1, NEWS_BATCH_SIZE)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(workers_count * 2, batch_size))
+        collecting = asyncio.Lock()
         
-        for company in self.companies:
+        async def search() -> None:
             try:
-                company_news = await self.search_company_news_with_date_filter(company, days)
-                all_news.extend(company_news)
-                
-                # Rate limiting for company iterations (dual queries + OpenAI analysis)
-                await asyncio.sleep(2.5)  # Allow for dual Brave queries + OpenAI processing
-                
-            except Exception as e:
-                company_name = company.get('company_name', 'Unknown')
-                logger.error(f"Error fetching news for {company_name}: {e}")
-                continue
+                for index, company in enumerate(self.companies):
+                    try:
+                        quoted_results, unquoted_results = await self._search_brave(company, days, use_cache)
+                    except Exception as e:
+                        company_name = company.get('company_name', 'Unknown')
+                        logger.error(f"Error fetching news for {company_name}: {e}")
+                        continue
+                    await queue.put((index, company, quoted_results, unquoted_results))
+            finally:
+                for _ in range(workers_count):
+                    await queue.put(None)
+        
+        async def next_batch() -> Tuple[list, bool]:
+            """Take up to batch_size searched companies, waiting a bounded time to fill the batch"""
+            async with collecting:
+                job = await queue.get()
+                if job is None:
+                    return [], True
+                batch = [job]
+                deadline = time.monotonic() + NEWS_BATCH_MAX_WAIT_SECONDS
+                while len(batch) < batch_size:
+                    try:
+                        job = await asyncio.wait_for(queue.get(), max(0, deadline - time.monotonic()))
+                    except asyncio.TimeoutError:
+                        break
+                    if job is None:
+                        return batch, True
+                    batch.append(job)
+                return batch, False
+        
+        async def analyze() -> None:
+            finished = False
+            while not finished:
+                batch, finished = await next_batch()
+                if not batch:
+                    continue
+                try:
+                    company_news = await self._analyze_companies([job[1:] for job in batch], days)
+                    for job, news in zip(batch, company_news):
+                        results[job[0]] = news
+                except Exception as e:
+                    company_names = ', '.join(job[1].get('company_name', 'Unknown') for job in batch)
+                    logger.error(f"Error fetching news for {company_names}: {e}")
+        
+        await asyncio.gather(search(), *(analyze() for _ in range(workers_count)))
         
-        logger.info(f"Fetched total of {len(all_news)} news items from {len(self.companies)} companies")
+        all_news = [item for company_news in results for item in company_news]
+        logger.info(f"Fetched total of {len(all_news)} news items from {len(self.companies)} companies in {time.monotonic() - started:.1f}s")
         return all_news
 
     def get_user_preference(self, user_id: str) -> bool:
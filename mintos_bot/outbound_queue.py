@@ -0,0 +1,147 @@
+"""
+Outbound Message Queue for the Mintos Telegram Bot
+Persists messages that failed to send so they survive restarts, and retries
+them with exponential backoff, dead-lettering messages that keep failing.
+"""
+import logging
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Union
+from .config import (
+    OUTBOUND_MAX_ATTEMPTS,
+    OUTBOUND_BASE_DELAY_SECONDS,
+    OUTBOUND_MAX_DELAY_SECONDS
+)
+from .storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+# Message states
+PENDING = 'pending'
+DEAD = 'dead'
+
+class OutboundQueue:
+    """Durable queue of outgoing messages awaiting (re)delivery
+
+    Each message is stored as its own row with its state, attempt count,
+    next attempt time and last error. Dead-lettered messages are kept apart
+    from the pending ones, so the frequent due checks only scan the latter.
+    """
+
+    def __init__(self, namespace: str = 'outbound_queue',
+                 max_attempts: int = OUTBOUND_MAX_ATTEMPTS,
+                 base_delay: float = OUTBOUND_BASE_DELAY_SECONDS,
+                 max_delay: float = OUTBOUND_MAX_DELAY_SECONDS):
+        """Initialize the queue and load persisted messages
+
+        Args:
+            namespace: Storage namespace holding the queue
+            max_attempts: Delivery attempts before a message is dead-lettered
+            base_delay: Delay before the first retry in seconds
+            max_delay: Maximum retry delay in seconds
+        """
+        self.storage = get_storage()
+        self.namespace = namespace
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.messages: Dict[str, Dict[str, Any]] = {}
+        self.dead: Dict[str, Dict[str, Any]] = {}
+        try:
+            for message_id, message in self.storage.load_namespace(namespace).items():
+                if message.get('state') == DEAD:
+                    self.dead[message_id] = message
+                else:
+                    self.messages[message_id] = message
+        except Exception as e:
+            logger.error(f"Error loading outbound queue: {e}", exc_info=True)
+        logger.info(f"Loaded outbound queue with {len(self.messages)} pending and {len(self.dead)} dead messages")
+
+    def _persist(self, message_id: str) -> None:
+        try:
+            message = self.messages.get(message_id) or self.dead.get(message_id)
+            if message is not None:
+                self.storage.put(self.namespace, message_id, message)
+            else:
+                self.storage.delete(self.namespace, message_id)
+        except Exception as e:
+            logger.error(f"Error persisting outbound message {message_id}: {e}", exc_info=True)
+
+    def _backoff(self, attempts: int) -> float:
+        return min(self.base_delay * (2 ** max(attempts - 1, 0)), self.max_delay)
+
+    def enqueue(self, chat_id: Union[int, str], text: str, reply_markup: Optional[Dict[str, Any]] = None,
+                parse_mode: Optional[str] = None, disable_web_page_preview: bool = False,
+                attempts: int = 1, error: Optional[str] = None) -> str:
+        """Queue a message for redelivery
+
+        Args:
+            chat_id: Recipient chat
+            text: Message text
+            reply_markup: Serialized reply markup (``to_dict()`` form)
+            parse_mode: Telegram parse mode
+            disable_web_page_preview: Whether to disable link previews
+            attempts: Delivery attempts already made
+            error: Last delivery error
+
+        Returns:
+            The queued message ID
+        """
+        message_id = uuid.uuid4().hex
+        now = time.time()
+        self.messages[message_id] = {
+            'chat_id': chat_id,
+            'text': text,
+            'reply_markup': reply_markup,
+            'parse_mode': parse_mode,
+            'disable_web_page_preview': disable_web_page_preview,
+            'state': PENDING,
+            'attempts': attempts,
+            'created_at': now,
+            'next_attempt': now + self._backoff(attempts),
+            'last_error': error
+        }
+        self._persist(message_id)
+        logger.info(f"Queued message {message_id} to {chat_id} for retry")
+        return message_id
+
+    def due(self, now: Optional[float] = None) -> List[str]:
+        """Get IDs of pending messages whose next attempt is due, oldest first"""
+        now = now or time.time()
+        due = [
+            (message['next_attempt'], message_id)
+            for message_id, message in self.messages.items()
+            if message.get('next_attempt', 0) <= now
+        ]
+        return [message_id for _, message_id in sorted(due)]
+
+    def next_attempt_in(self, now: Optional[float] = None) -> Optional[float]:
+        """Get seconds until the next pending message is due, or None if nothing is pending"""
+        now = now or time.time()
+        pending = [m['next_attempt'] for m in self.messages.values()]
+        return max(0.0, min(pending) - now) if pending else None
+
+    def mark_sent(self, message_id: str) -> None:
+        """Remove a delivered message"""
+        if self.messages.pop(message_id, None) is not None:
+            self._persist(message_id)
+
+    def mark_failed(self, message_id: str, error: str, permanent: bool = False) -> None:
+        """Record a failed attempt, rescheduling with backoff or dead-lettering the message"""
+        message = self.messages.get(message_id)
+        if message is None:
+            return
+        message['attempts'] = message.get('attempts', 0) + 1
+        message['last_error'] = error
+        if permanent or message['attempts'] >= self.max_attempts:
+            message['state'] = DEAD
+            self.dead[message_id] = self.messages.pop(message_id)
+            logger.error(f"Dead-lettered message {message_id} to {message['chat_id']} after {message['attempts']} attempts: {error}")
+        else:
+            message['next_attempt'] = time.time() + self._backoff(message['attempts'])
+            logger.warning(f"Message {message_id} to {message['chat_id']} failed (attempt {message['attempts']}), retrying in {self._backoff(message['attempts']):.0f}s")
+        self._persist(message_id)
+
+    def dead_letters(self) -> Dict[str, Dict[str, Any]]:
+        """Get dead-lettered messages"""
+        return dict(self.dead)
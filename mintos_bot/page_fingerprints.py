@@ -0,0 +1,102 @@
+"""
+Page Fingerprint Store for the Mintos Telegram Bot
+Persists per-URL fingerprints of company pages (ETag, Last-Modified and a
+normalized body hash) so that document scrapes can use conditional requests
+and skip parsing pages that have not changed.
+"""
+import hashlib
+import logging
+import re
+import time
+from typing import Any, Dict, List, Optional, Set
+from .base_manager import BaseManager
+from .constants import PAGE_FINGERPRINTS_FILE
+
+logger = logging.getLogger(__name__)
+
+# Tokens that change on every request without the page content changing
+VOLATILE_PATTERNS = [
+    re.compile(r'\snonce="[^"]*"', re.I),
+    re.compile(r'(name="(?:csrf[-_]?token|_token|authenticity_token)"\s+(?:content|value)=)"[^"]*"', re.I),
+    re.compile(r'((?:[?&]|&amp;)(?:v|ver|version|t|ts|cb|_)=)[\w.-]+', re.I),
+    re.compile(r'(data-(?:request-id|nonce|timestamp)=)"[^"]*"', re.I)
+]
+
+def normalized_hash(html_content: str) -> str:
+    """Hash a page body with volatile tokens removed"""
+    for pattern in VOLATILE_PATTERNS:
+        html_content = pattern.sub(lambda match: match.group(1) if match.groups() else '', html_content)
+    return hashlib.sha256(html_content.encode('utf-8')).hexdigest()
+
+class PageFingerprintStore(BaseManager):
+    """Per-URL fingerprint store used for conditional company page requests"""
+
+    def __init__(self, data_file: str = PAGE_FINGERPRINTS_FILE):
+        """Initialize the store and load persisted fingerprints"""
+        super().__init__(data_file, backup_enabled=False)
+        data = self.load_data({})
+        self.fingerprints: Dict[str, Dict[str, Any]] = data if isinstance(data, dict) else {}
+        self.cached_documents: Dict[str, List[Dict[str, Any]]] = {}
+        self.unchanged: Set[str] = set()
+        logger.info(f"Loaded fingerprints for {len(self.fingerprints)} company pages")
+
+    def begin_scrape(self, previous_documents: List[Dict[str, Any]]) -> None:
+        """Group the cached documents by page URL and reset the unchanged set
+
+        Pages can only be skipped when there is a document cache to reuse, so
+        an empty cache disables skipping for the whole scrape.
+        """
+        self.cached_documents = {}
+        if previous_documents:
+            for url in self.fingerprints:
+                self.cached_documents[url] = []
+            for document in previous_documents:
+                url = document.get('company_page_url')
+                if url in self.cached_documents:
+                    self.cached_documents[url].append(document)
+        self.unchanged = set()
+
+    def cached(self, url: str) -> Optional[List[Dict[str, Any]]]:
+        """Get the documents found on a page during the previous scrape"""
+        documents = self.cached_documents.get(url)
+        return [dict(document) for document in documents] if documents is not None else None
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """Build conditional request headers for a page
+
+        Validators are only sent when cached documents exist to fall back on.
+        """
+        fingerprint = self.fingerprints.get(url)
+        if not fingerprint or url not in self.cached_documents:
+            return {}
+        headers = {}
+        if fingerprint.get('etag'):
+            headers['If-None-Match'] = fingerprint['etag']
+        if fingerprint.get('last_modified'):
+            headers['If-Modified-Since'] = fingerprint['last_modified']
+        return headers
+
+    def matches_body(self, url: str, body_hash: str) -> bool:
+        """Check whether a normalized body hash matches the stored hash for a page"""
+        fingerprint = self.fingerprints.get(url)
+        return bool(fingerprint) and url in self.cached_documents and fingerprint.get('hash') == body_hash
+
+    def record(self, url: str, etag: Optional[str], last_modified: Optional[str], body_hash: str) -> None:
+        """Store a fresh fingerprint for a page"""
+        self.fingerprints[url] = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'hash': body_hash,
+            'checked_at': time.time()
+        }
+
+    def mark_unchanged(self, url: str) -> None:
+        """Record that a page was unchanged during the current scrape"""
+        self.unchanged.add(url)
+        if url in self.fingerprints:
+            self.fingerprints[url]['checked_at'] = time.time()
+
+    def save(self) -> None:
+        """Persist fingerprints to disk"""
+        if not self.save_data(self.fingerprints):
+            logger.error("Failed to save page fingerprints")
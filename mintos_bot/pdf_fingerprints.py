@@ -0,0 +1,109 @@
+"""
+PDF Fingerprint Store for the Mintos Telegram Bot
+Fingerprints document PDFs from HEAD metadata (ETag, Last-Modified,
+Content-Length), streaming the body through a hash only when that metadata
+is missing, so replaced files behind an unchanged URL are detected without
+downloading them.
+"""
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Any, Dict, List, Optional
+import aiohttp
+from .base_manager import BaseManager
+from .constants import (
+    PDF_FINGERPRINTS_FILE,
+    PDF_FINGERPRINT_CONCURRENCY,
+    PDF_HASH_CHUNK_SIZE,
+    HTTP_CLIENT_TIMEOUT,
+    HTTP_DOWNLOAD_TIMEOUT,
+    DEFAULT_USER_AGENT
+)
+from .http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_KEY = 'fingerprint'
+
+class PDFFingerprintStore(BaseManager):
+    """Per-URL fingerprint cache for document PDFs"""
+
+    def __init__(self, data_file: str = PDF_FINGERPRINTS_FILE,
+                 concurrency: int = PDF_FINGERPRINT_CONCURRENCY):
+        """Initialize the store and load persisted fingerprints
+
+        Args:
+            data_file: File backing the store
+            concurrency: Maximum number of PDF requests in flight
+        """
+        super().__init__(data_file, backup_enabled=False)
+        data = self.load_data({})
+        self.fingerprints: Dict[str, Dict[str, Any]] = data if isinstance(data, dict) else {}
+        self.concurrency = max(1, concurrency)
+        logger.info(f"Loaded fingerprints for {len(self.fingerprints)} PDFs")
+
+    @staticmethod
+    def _from_headers(headers: Any) -> Optional[str]:
+        """Build a fingerprint from response metadata, or None if it is not conclusive"""
+        etag = headers.get('ETag')
+        if etag:
+            return f"etag:{etag}"
+        last_modified = headers.get('Last-Modified')
+        content_length = headers.get('Content-Length')
+        if last_modified and content_length:
+            return f"modified:{last_modified}|length:{content_length}"
+        return None
+
+    async def _stream_hash(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
+        """Hash a PDF body chunk by chunk without holding it in memory"""
+        digest = hashlib.sha256()
+        # No total limit, so large PDFs on slow hosts are hashed; a stalled read still times out
+        async with session.get(url, headers={'User-Agent': DEFAULT_USER_AGENT}, timeout=HTTP_DOWNLOAD_TIMEOUT) as response:
+            if response.status != 200:
+                logger.warning(f"Failed to download {url} for hashing: HTTP {response.status}")
+                return None
+            async for chunk in response.content.iter_chunked(PDF_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        return f"sha256:{digest.hexdigest()}"
+
+    async def fingerprint(self, url: str) -> Optional[str]:
+        """Fingerprint one PDF, falling back to the cached value on errors"""
+        session = get_http_client().session()
+        try:
+            async with session.head(url, headers={'User-Agent': DEFAULT_USER_AGENT},
+                                    timeout=HTTP_CLIENT_TIMEOUT, allow_redirects=True) as response:
+                fingerprint = self._from_headers(response.headers) if response.status == 200 else None
+            if fingerprint is None:
+                fingerprint = await self._stream_hash(session, url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Error fingerprinting {url}: {e}")
+            fingerprint = None
+        except Exception as e:
+            logger.error(f"Unexpected error fingerprinting {url}: {e}")
+            fingerprint = None
+
+        if fingerprint is None:
+            cached = self.fingerprints.get(url)
+            return cached.get(FINGERPRINT_KEY) if cached else None
+        self.fingerprints[url] = {FINGERPRINT_KEY: fingerprint, 'checked_at': time.time()}
+        return fingerprint
+
+    async def fingerprint_documents(self, documents: List[Dict[str, Any]]) -> None:
+        """Set the fingerprint of every document, with bounded concurrency"""
+        urls = list(dict.fromkeys(doc['url'] for doc in documents if doc.get('url')))
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(url: str) -> Optional[str]:
+            async with semaphore:
+                return await self.fingerprint(url)
+
+        started = time.monotonic()
+        results = dict(zip(urls, await asyncio.gather(*(run(url) for url in urls))))
+        for doc in documents:
+            fingerprint = results.get(doc.get('url'))
+            if fingerprint:
+                doc[FINGERPRINT_KEY] = fingerprint
+        if not self.save_data(self.fingerprints):
+            logger.error("Failed to save PDF fingerprints")
+        logger.info(f"Fingerprinted {len(urls)} PDFs in {time.monotonic() - started:.1f}s")
@@ -3,22 +3,22 @@ Perplexity News Reader for Company Updates
 Handles fetching news for companies using Perplexity AI's sonar model
 """
 import asyncio
-import aiohttp
 import json
 import os
 # import pandas as pd  # Temporarily disabled due to system library issues
-import hashlib
+import time
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any, Optional
 from .logger import setup_logger
 from .base_manager import BaseManager
+from .config import PERPLEXITY_REQUESTS_PER_SECOND, PERPLEXITY_CONCURRENCY
+from .constants import HTTP_LLM_TIMEOUT
+from .http_client import get_http_client
+from .rate_limiter import TokenBucket
+from .search_cache import get_search_cache
 
 logger = setup_logger(__name__)
 
-# Cache configuration
-CACHE_DIR = "data/news_cache"
-CACHE_DURATION_HOURS = 6
-
 class PerplexityNewsItem:
     """Represents a single news item from Perplexity"""
     
@@ -83,6 +83,7 @@ class PerplexityNewsReader(BaseManager):
         super().__init__('data/perplexity_news_cache.json')
         self.api_key = os.getenv('PERPLEXITY_API_KEY')
         self.base_url = "https://api.perplexity.ai/chat/completions"
+        self.limiter = TokenBucket(PERPLEXITY_REQUESTS_PER_SECOND, capacity=1)
         # Try multiple locations for the CSV file
         possible_paths = [
             'data/mintos_companies_prompt_input.csv',
@@ -112,9 +113,6 @@ class PerplexityNewsReader(BaseManager):
         
         # Load sent items
         self.sent_items = self._load_sent_items()
-        
-        # Initialize cache
-        self._ensure_cache_dir()
     
     def _load_company_data(self) -> List[Dict[str, str]]:
         """Load company data from CSV file"""
@@ -235,27 +233,33 @@ class PerplexityNewsReader(BaseManager):
     
 
     
-    async def fetch_all_company_news_with_date_filter(self, days_back: int) -> List[PerplexityNewsItem]:
-        """Fetch news for all companies using exact date filtering"""
-        all_news = []
-        
+    async def fetch_all_company_news_with_date_filter(self, days_back: int,
+                                                      use_cache: bool = True) -> List[PerplexityNewsItem]:
+        """Fetch news for all companies using exact date filtering
+
+        Companies are searched concurrently; requests that miss the search cache
+        are paced by the request rate limit. Results keep the order of the
+        company list.
+        """
         logger.info(f"Fetching news for {len(self.companies)} companies for last {days_back} days")
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(max(1, PERPLEXITY_CONCURRENCY))
         
-        for company in self.companies:
+        async def fetch(company: Dict[str, str]) -> List[PerplexityNewsItem]:
+            company_name = company.get('company_name', 'Unknown Company')
             try:
-                news_items = await self.search_company_news_with_date_filter(company, days_back)
-                all_news.extend(news_items)
-                company_name = company.get('company_name', 'Unknown Company')
+                async with semaphore:
+                    news_items = await self.search_company_news_with_date_filter(company, days_back, use_cache)
                 logger.info(f"Found {len(news_items)} news items for {company_name}")
-                
-                # Small delay to avoid rate limiting
-                await asyncio.sleep(1)
-                
+                return news_items
             except Exception as e:
-                company_name = company.get('company_name', 'Unknown Company')
                 logger.error(f"Error fetching news for {company_name}: {e}")
+                return []
         
-        logger.info(f"Total news items fetched: {len(all_news)}")
+        results = await asyncio.gather(*(fetch(company) for company in self.companies))
+        all_news = [item for news_items in results for item in news_items]
+        
+        logger.info(f"Total news items fetched: {len(all_news)} in {time.monotonic() - started:.1f}s")
         return all_news
     
     def format_news_message(self, item: PerplexityNewsItem) -> str:
@@ -373,53 +377,6 @@ class PerplexityNewsReader(BaseManager):
         
         return message
     
-    def _ensure_cache_dir(self):
-        """Ensure cache directory exists"""
-        os.makedirs(CACHE_DIR, exist_ok=True)
-    
-    def _get_cache_key(self, companies: List[Dict], days: int) -> str:
-        """Generate cache key for news results"""
-        company_names = sorted([c['company_name'] for c in companies])
-        key_data = f"{'_'.join(company_names)}_{days}days"
-        return hashlib.md5(key_data.encode()).hexdigest()
-    
-    def _get_cache_path(self, cache_key: str) -> str:
-        """Get cache file path"""
-        return os.path.join(CACHE_DIR, f"{cache_key}.json")
-    
-    def _is_cache_valid(self, cache_path: str) -> bool:
-        """Check if cache is still valid"""
-        if not os.path.exists(cache_path):
-            return False
-        
-        try:
-            mod_time = datetime.fromtimestamp(os.path.getmtime(cache_path))
-            expiry_time = mod_time + timedelta(hours=CACHE_DURATION_HOURS)
-            return datetime.now() < expiry_time
-        except:
-            return False
-    
-    def _load_cached_results(self, cache_key: str) -> Optional[List[PerplexityNewsItem]]:
-        """Load cached news results"""
-        cache_path = self._get_cache_path(cache_key)
-        
-        if not self._is_cache_valid(cache_path):
-            return None
-        
-        try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            items = []
-            for item_data in data:
-                items.append(PerplexityNewsItem.from_dict(item_data))
-            
-            logger.info(f"Loaded {len(items)} items from cache")
-            return items
-        except Exception as e:
-            logger.error(f"Error loading cache: {e}")
-            return None
-    
     def _build_search_terms(self, company: Dict[str, str]) -> str:
         """Build search terms for a company using company name and brief description"""
         company_name = company.get('company_name', '').strip()
@@ -514,8 +471,12 @@ class PerplexityNewsReader(BaseManager):
             logger.error(f"Error creating news item: {e}")
             return None
 
-    async def search_company_news_with_date_filter(self, company: Dict[str, str], days_back: int) -> List[PerplexityNewsItem]:
-        """Simplified search using Perplexity's native search_results"""
+    async def search_company_news_with_date_filter(self, company: Dict[str, str], days_back: int,
+                                                   use_cache: bool = True) -> List[PerplexityNewsItem]:
+        """Simplified search using Perplexity's native search_results
+
+        Results are served from the shared search cache while they are fresh.
+        """
         if not self.api_key:
             logger.error("Perplexity API key not configured")
             return []
@@ -550,6 +511,14 @@ class PerplexityNewsReader(BaseManager):
                 payload["search_domain_filter"] = domain_filter
                 logger.debug(f"Using domain filter for {search_terms}: {domain_filter}")
             
+            cache = get_search_cache()
+            cache_key = cache.make_key(user_query, ','.join(domain_filter or []), cutoff_date_str)
+            if use_cache:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"Using cached results for '{search_terms}' after {cutoff_date_str}")
+                    return [PerplexityNewsItem.from_dict(item) for item in cached]
+            
             headers = {
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
@@ -557,60 +526,53 @@ class PerplexityNewsReader(BaseManager):
             
             logger.info(f"Searching for '{search_terms}' with date filter: after {cutoff_date_str}")
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    "https://api.perplexity.ai/chat/completions",
-                    json=payload,
-                    headers=headers
-                ) as response:
-                    if response.status != 200:
-                        logger.error(f"API request failed: {response.status} - {await response.text()}")
-                        return []
+            # Only actual requests are paced, cache hits above are free
+            await self.limiter.acquire()
+            session = get_http_client().session()
+            async with session.post(
+                "https://api.perplexity.ai/chat/completions",
+                json=payload,
+                headers=headers,
+                timeout=HTTP_LLM_TIMEOUT
+            ) as response:
+                if response.status != 200:
+                    logger.error(f"API request failed: {response.status} - {await response.text()}")
+                    return []
                     
-                    data = await response.json()
-                    search_results = data.get('search_results', [])
-                    citations = data.get('citations', [])
+                data = await response.json()
+                search_results = data.get('search_results', [])
+                citations = data.get('citations', [])
                     
-                    # Verify we have authentic sources
-                    if not search_results and not citations:
-                        logger.warning(f"No search results or citations found for {company_name}")
-                        return []
+                # Verify we have authentic sources
+                if not search_results and not citations:
+                    logger.warning(f"No search results or citations found for {company_name}")
+                    return []
                     
-                    logger.debug(f"Found {len(search_results)} search results for {company_name}")
+                logger.debug(f"Found {len(search_results)} search results for {company_name}")
                     
-                    # Process search results directly
-                    news_items = []
-                    for result in search_results[:5]:  # Limit to top 5 results
-                        if self._is_valid_news_result(result, company, cutoff_date):
-                            news_item = self._create_news_item_from_result(result, company, search_terms)
-                            if news_item:
-                                news_items.append(news_item)
+                # Process search results directly
+                news_items = []
+                for result in search_results[:5]:  # Limit to top 5 results
+                    if self._is_valid_news_result(result, company, cutoff_date):
+                        news_item = self._create_news_item_from_result(result, company, search_terms)
+                        if news_item:
+                            news_items.append(news_item)
                     
-                    logger.info(f"Created {len(news_items)} news items for {company_name}")
-                    return news_items
+                logger.info(f"Created {len(news_items)} news items for {company_name}")
+                cache.set(cache_key, [item.to_dict() for item in news_items], cache.ttl(days_back))
+                return news_items
                     
         except Exception as e:
             company_name = company.get('company_name', 'Unknown Company')
             logger.error(f"Error searching news for {company_name}: {e}")
             return []
     
-    def _save_cached_results(self, cache_key: str, items: List[PerplexityNewsItem]):
-        """Save news results to cache"""
-        cache_path = self._get_cache_path(cache_key)
-        
-        try:
-            data = [item.to_dict() for item in items]
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            logger.info(f"Saved {len(items)} items to cache")
-        except Exception as e:
-            logger.error(f"Error saving cache: {e}")
-    
-    async def fetch_news_by_days(self, days: int, use_cache: bool = False) -> List[PerplexityNewsItem]:
-        """Fetch news for all companies within specified days"""
-        # Always perform fresh search - caching disabled
-        logger.info(f"Performing fresh news search (caching disabled)")
+    async def fetch_news_by_days(self, days: int, use_cache: bool = True) -> List[PerplexityNewsItem]:
+        """Fetch news for all companies within specified days
+
+        Per-company results come from the shared search cache unless
+        use_cache is False.
+        """
         
         # Determine recency filter for API
         if days <= 1:
@@ -624,15 +586,13 @@ class PerplexityNewsReader(BaseManager):
         
         # Fetch fresh data with proper API filtering
         logger.info(f"Fetching news for last {days} days using exact date filtering")
-        all_news = await self.fetch_all_company_news_with_date_filter(days)
+        all_news = await self.fetch_all_company_news_with_date_filter(days, use_cache)
         
         # Apply client-side filtering for precise day range if needed
         target_date = datetime.now() - timedelta(days=days)
         cutoff_date = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
         filtered_news = self._filter_news_by_date(all_news, cutoff_date)
         
-        # Caching disabled - skip saving results
-        
         logger.info(f"API returned {len(all_news)} items, filtered to {len(filtered_news)} items within last {days} days")
         return filtered_news
     
@@ -0,0 +1,184 @@
+"""
+Adaptive Poll Scheduler for the Mintos Telegram Bot
+Learns each lender's recovery-update cadence from history and schedules
+per-lender checks in a priority queue within a global request budget.
+"""
+import heapq
+import logging
+import statistics
+import time
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from .base_manager import BaseManager
+from .constants import POLL_SCHEDULE_FILE
+from .config import (
+    POLL_MIN_INTERVAL_HOURS,
+    POLL_MAX_INTERVAL_HOURS,
+    POLL_CHECKS_PER_UPDATE,
+    POLL_DEFAULT_GAP_DAYS,
+    POLL_REQUEST_BUDGET_PER_HOUR,
+    POLL_REQUEST_BURST
+)
+
+logger = logging.getLogger(__name__)
+
+# Statuses after which a lender is not expected to post further updates
+INACTIVE_STATUSES = {'resolved'}
+
+class LenderPollScheduler(BaseManager):
+    """Priority-queue scheduler deciding which lenders to poll next"""
+
+    def __init__(self, data_file: str = POLL_SCHEDULE_FILE,
+                 budget_per_hour: float = POLL_REQUEST_BUDGET_PER_HOUR,
+                 burst: float = POLL_REQUEST_BURST):
+        """Initialize the scheduler and load persisted schedule state
+
+        Args:
+            data_file: Path to the persisted schedule
+            budget_per_hour: Sustained number of lender requests allowed per hour
+            burst: Maximum number of lender requests in a single round
+        """
+        super().__init__(data_file, backup_enabled=False)
+        data = self.load_data({})
+        self.state: Dict[str, Dict[str, float]] = data if isinstance(data, dict) else {}
+        self._heap: List[Tuple[float, str]] = [
+            (entry.get('next_due', 0.0), lender_id) for lender_id, entry in self.state.items()
+        ]
+        heapq.heapify(self._heap)
+        self.budget_per_hour = budget_per_hour
+        self.burst = burst
+        self._budget = burst
+        self._budget_updated = time.time()
+        self._in_flight: Set[str] = set()
+
+    @staticmethod
+    def _item_dates(update: Dict[str, Any]) -> List[date]:
+        """Collect all update dates for a lender entry, newest first"""
+        dates = []
+        for year_data in update.get('items', []) or []:
+            for item in year_data.get('items', []) or []:
+                try:
+                    dates.append(datetime.strptime(item.get('date', ''), '%Y-%m-%d').date())
+                except (TypeError, ValueError):
+                    continue
+        return sorted(set(dates), reverse=True)
+
+    def estimate_interval(self, update: Optional[Dict[str, Any]], now: Optional[float] = None) -> float:
+        """Estimate the polling interval in seconds for a lender entry
+
+        The typical gap between recent updates sets the base interval. Lenders
+        whose next update is due soon are polled more often, while resolved or
+        long-silent lenders fall back to the maximum interval.
+        """
+        max_hours = POLL_MAX_INTERVAL_HOURS
+        if not update:
+            return POLL_MIN_INTERVAL_HOURS * 3600
+
+        items = update.get('items') or []
+        latest_status = items[0].get('status') if items else None
+        dates = self._item_dates(update)
+        if not dates or latest_status in INACTIVE_STATUSES:
+            return max_hours * 3600
+
+        today = datetime.fromtimestamp(now or time.time()).date()
+        gaps = [(newer - older).days for newer, older in zip(dates[:9], dates[1:9]) if newer > older]
+        typical_gap = statistics.median(gaps) if gaps else POLL_DEFAULT_GAP_DAYS
+        silence = (today - dates[0]).days
+
+        if silence > typical_gap * 3:
+            # Gone quiet for much longer than usual
+            hours = max_hours
+        else:
+            hours = typical_gap * 24 / POLL_CHECKS_PER_UPDATE
+            if silence >= typical_gap * 0.8:
+                # Next update is due soon
+                hours /= 4
+
+        return min(max(hours, POLL_MIN_INTERVAL_HOURS), max_hours) * 3600
+
+    def _schedule(self, lender_id: str, next_due: float, interval: float, checked: Optional[float]) -> None:
+        entry = self.state.setdefault(lender_id, {})
+        entry['next_due'] = next_due
+        entry['interval'] = interval
+        if checked is not None:
+            entry['last_checked'] = checked
+        heapq.heappush(self._heap, (next_due, lender_id))
+
+    def sync_lenders(self, lender_ids: Iterable[Any], updates: List[Dict[str, Any]]) -> None:
+        """Make sure every known lender is scheduled, learning intervals from cached updates"""
+        now = time.time()
+        by_lender = {str(u.get('lender_id')): u for u in updates if isinstance(u, dict)}
+        known = {str(lender_id) for lender_id in lender_ids}
+        for lender_id in known:
+            interval = self.estimate_interval(by_lender.get(lender_id), now)
+            entry = self.state.get(lender_id)
+            if entry is None:
+                # Never polled by the scheduler: check right away
+                self._schedule(lender_id, now, interval, None)
+            elif entry.get('interval') != interval:
+                last_checked = entry.get('last_checked', now)
+                self._schedule(lender_id, min(entry.get('next_due', now), last_checked + interval), interval, None)
+        for lender_id in set(self.state) - known:
+            del self.state[lender_id]
+        self.save()
+
+    def take_due(self, now: Optional[float] = None) -> List[int]:
+        """Pop lenders that are due, limited by the remaining request budget"""
+        now = now or time.time()
+        self._budget = min(self.burst, self._budget + (now - self._budget_updated) * self.budget_per_hour / 3600)
+        self._budget_updated = now
+
+        due: List[int] = []
+        while self._heap and self._heap[0][0] <= now and len(due) < int(self._budget):
+            next_due, lender_id = heapq.heappop(self._heap)
+            entry = self.state.get(lender_id)
+            if entry is None or entry.get('next_due') != next_due or lender_id in self._in_flight:
+                continue  # Stale heap entry
+            self._in_flight.add(lender_id)
+            due.append(int(lender_id))
+
+        self._budget -= len(due)
+        if due:
+            logger.info(f"{len(due)} lenders due for polling ({len(self._heap)} queued, budget {self._budget:.1f})")
+        return due
+
+    def record_results(self, lender_ids: Iterable[Any], updates: List[Dict[str, Any]]) -> None:
+        """Reschedule polled lenders based on their fresh data
+
+        Lenders that failed to fetch are retried after the minimum interval.
+        """
+        now = time.time()
+        by_lender = {str(u.get('lender_id')): u for u in updates if isinstance(u, dict)}
+        for lender_id in {str(lender_id) for lender_id in lender_ids}:
+            self._in_flight.discard(lender_id)
+            update = by_lender.get(lender_id)
+            if update is None:
+                interval = POLL_MIN_INTERVAL_HOURS * 3600
+            else:
+                interval = self.estimate_interval(update, now)
+            self._schedule(lender_id, now + interval, interval, now)
+        self.save()
+
+    def release(self, lender_ids: Iterable[Any]) -> None:
+        """Reschedule taken lenders whose results were never recorded
+
+        Called after every sweep, so lenders taken by a sweep that failed
+        before record_results are retried after the minimum interval
+        instead of staying in flight until a restart.
+        """
+        now = time.time()
+        failed = {str(lender_id) for lender_id in lender_ids} & self._in_flight
+        if not failed:
+            return
+        interval = POLL_MIN_INTERVAL_HOURS * 3600
+        for lender_id in failed:
+            self._in_flight.discard(lender_id)
+            entry = self.state.get(lender_id, {})
+            self._schedule(lender_id, now + interval, entry.get('interval', interval), None)
+        logger.warning(f"Rescheduled {len(failed)} lenders after a failed sweep")
+        self.save()
+
+    def save(self) -> None:
+        """Persist the schedule to disk"""
+        if not self.save_data(self.state):
+            logger.error("Failed to save poll schedule")
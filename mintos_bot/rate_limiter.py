@@ -0,0 +1,50 @@
+"""
+Rate limiting helpers for the Mintos Telegram Bot
+Provides an asyncio token bucket used to pace outgoing requests.
+"""
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Asyncio token bucket limiting operations to a steady rate with bursts"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize the bucket
+
+        Args:
+            rate: Tokens added per second (i.e. sustained operations per second)
+            capacity: Maximum burst size, defaults to one second worth of tokens
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until the requested number of tokens is available and consume them"""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Drain the bucket so no tokens become available for the given time
+
+        Overlapping pauses do not add up: the bucket stays empty until the
+        latest of their deadlines.
+        """
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self.rate)
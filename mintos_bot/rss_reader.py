@@ -6,17 +6,26 @@ Handles fetching, filtering, and processing of RSS feeds from:
 - FFNews (with keyword filtering on titles)
 """
 import asyncio
-import aiohttp
 import feedparser
+import html
+import time
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional, Set
+from typing import Awaitable, Callable, List, Dict, Any, Optional, Set, Tuple
 import re
 from .logger import setup_logger
 from .base_manager import BaseManager
+from .config import RSS_FORCE_FETCH_CACHE_SECONDS
+from .http_client import get_http_client
+from .dedup_store import DedupStore
+from .keyword_matcher import KeywordMatcher
 import os
 
 logger = setup_logger(__name__)
 
+# RSS 2.0 items and their GUIDs, used to cut a feed before already-sent items
+RSS_ITEM_RE = re.compile(r'<item[\s>]', re.I)
+RSS_GUID_RE = re.compile(r'<guid[^>]*>\s*(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?\s*</guid>', re.I | re.S)
+
 class RSSItem:
     """Represents a single RSS news item"""
     def __init__(self, title: str, link: str, pub_date: str, guid: str, issuer: str, feed_source: str = "nasdaq"):
@@ -79,11 +88,12 @@ class RSSReader(BaseManager):
             'ffnews': "https://ffnews.com/category/newsarticle/feed/"
         }
         
-        # Feed configurations with different update intervals
+        # Feed configurations with different update intervals and how long
+        # sent GUIDs are remembered (older items are ignored)
         self.feed_configs = {
-            'nasdaq': {'interval_minutes': 15},
-            'mintos': {'interval_minutes': 60},
-            'ffnews': {'interval_minutes': 60}
+            'nasdaq': {'interval_minutes': 15, 'sent_ttl_days': 30},
+            'mintos': {'interval_minutes': 60, 'sent_ttl_days': 365},
+            'ffnews': {'interval_minutes': 60, 'sent_ttl_days': 30}
         }
         
         # Last check timestamps for each feed
@@ -97,12 +107,23 @@ class RSSReader(BaseManager):
         self.sent_items_file = 'data/rss_sent_items.json'
         self.user_preferences_file = 'data/rss_user_preferences.json'
         self.last_check_file = 'data/rss_last_check.json'
+        self.validators_namespace = 'rss_feed_validators'
         
         # Initialize data structures
         self.keywords: Set[str] = set()
-        self.sent_items: Set[str] = set()
+        self.keyword_matcher = KeywordMatcher(())
+        self.sent_items: DedupStore
         self.user_preferences: Dict[str, bool] = {}
         
+        # Shared results of recent fetches and fetches in flight, by key
+        self._fetch_cache: Dict[str, Tuple[float, Any]] = {}
+        self._fetches_in_flight: Dict[str, asyncio.Task] = {}
+        
+        # Per-feed ETag/Last-Modified for conditional requests
+        self.feed_validators: Dict[str, Dict[str, Optional[str]]] = self.storage.load_document(self.validators_namespace, {}) or {}
+        # Validators from scheduled fetches, applied once their items are marked sent
+        self._pending_validators: Dict[str, Dict[str, Optional[str]]] = {}
+        
         # Load existing data
         self._load_keywords()
         self._load_sent_items()
@@ -130,6 +151,11 @@ class RSSReader(BaseManager):
         except Exception as e:
             logger.error(f"Error loading keywords: {e}")
             self.keywords = set()
+        self._rebuild_keyword_matcher()
+
+    def _rebuild_keyword_matcher(self) -> None:
+        """Compile the keywords into the matcher"""
+        self.keyword_matcher = KeywordMatcher(self.keywords)
 
     def _load_last_check_times(self) -> None:
         """Load last check timestamps for each feed"""
@@ -205,30 +231,26 @@ class RSSReader(BaseManager):
             logger.error(f"Error saving keywords: {e}")
     
     def _load_sent_items(self) -> None:
-        """Load sent item GUIDs"""
+        """Load sent item GUIDs, importing the legacy JSON list once"""
+        ttl_seconds = {feed: config['sent_ttl_days'] * 86400 for feed, config in self.feed_configs.items()}
+        self.sent_items = DedupStore(
+            'rss_sent_guids', self.storage, ttl_seconds,
+            default_ttl=max(ttl_seconds.values())
+        )
         try:
-            if os.path.exists(self.sent_items_file):
+            if not len(self.sent_items) and os.path.exists(self.sent_items_file):
                 with open(self.sent_items_file, 'r') as f:
                     import json
                     data = json.load(f)
-                    self.sent_items = set(data)
-                logger.info(f"Loaded {len(self.sent_items)} sent RSS items")
-            else:
-                self.sent_items = set()
+                # The legacy list has no feed or send time; keep it for the longest TTL
+                self.sent_items.add_many(str(guid) for guid in data)
+                logger.info(f"Imported {len(self.sent_items)} sent RSS items from {self.sent_items_file}")
         except Exception as e:
-            logger.error(f"Error loading sent items: {e}")
-            self.sent_items = set()
+            logger.error(f"Error importing sent items: {e}")
     
-    def _save_sent_items(self) -> None:
-        """Save sent item GUIDs"""
-        try:
-            os.makedirs(os.path.dirname(self.sent_items_file), exist_ok=True)
-            with open(self.sent_items_file, 'w') as f:
-                import json
-                json.dump(list(self.sent_items), f, indent=2)
-            logger.info(f"Saved {len(self.sent_items)} sent RSS items")
-        except Exception as e:
-            logger.error(f"Error saving sent items: {e}")
+    def save_sent_items(self) -> None:
+        """Persist sent item GUIDs marked since the last save"""
+        self.sent_items.flush()
     
     def _load_user_preferences(self) -> None:
         """Load user RSS preferences"""
@@ -272,6 +294,7 @@ class RSSReader(BaseManager):
     def add_keyword(self, keyword: str) -> None:
         """Add a keyword for filtering"""
         self.keywords.add(keyword.lower().strip())
+        self._rebuild_keyword_matcher()
         self._save_keywords()
     
     def remove_keyword(self, keyword: str) -> bool:
@@ -279,6 +302,7 @@ class RSSReader(BaseManager):
         keyword_lower = keyword.lower().strip()
         if keyword_lower in self.keywords:
             self.keywords.remove(keyword_lower)
+            self._rebuild_keyword_matcher()
             self._save_keywords()
             return True
         return False
@@ -305,89 +329,143 @@ class RSSReader(BaseManager):
             # For NASDAQ and other feeds, check title and issuer
             text_to_check = f"{item.title} {item.issuer}".lower()
         
-        logger.debug(f"Checking {item.feed_source} RSS item: '{text_to_check}' against keywords: {self.keywords}")
-        
-        for keyword in self.keywords:
-            if keyword in text_to_check:
-                logger.debug(f"RSS item matched keyword '{keyword}': {item.title}")
-                return True
+        matches = self.keyword_matcher.find_all(text_to_check)
+        if matches:
+            logger.debug(f"RSS item matched keywords {[keyword for _, keyword in matches]}: {item.title}")
+            return True
         
         logger.debug(f"RSS item did not match any keywords: {item.title}")
         return False
     
-    async def fetch_single_feed(self, feed_source: str, url: str) -> List[RSSItem]:
-        """Fetch and parse a single RSS feed"""
+    def _conditional_headers(self, feed_source: str) -> Dict[str, str]:
+        """Build conditional request headers from the feed's stored validators"""
+        validators = self.feed_validators.get(feed_source) or {}
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    def commit_feed_validators(self) -> None:
+        """Apply and save the validators of the last scheduled fetch
+
+        Call only after the fetched items were sent and marked, so a failed
+        run fetches the same items again instead of getting a 304.
+        """
+        if not self._pending_validators:
+            return
+        self.feed_validators.update(self._pending_validators)
+        self._pending_validators = {}
+        if not self.storage.save_document(self.validators_namespace, self.feed_validators, backup=False):
+            logger.error("Error saving RSS feed validators")
+
+    def _cut_at_sent_item(self, content: str) -> Tuple[str, int]:
+        """Drop the items from the first already-sent GUID onwards
+
+        Feeds list items newest first, so everything after an item that was
+        already sent is older and has been seen before.
+
+        Returns:
+            Tuple of (feed content to parse, number of items dropped)
+        """
+        starts = [match.start() for match in RSS_ITEM_RE.finditer(content)]
+        for index, start in enumerate(starts):
+            end = starts[index + 1] if index + 1 < len(starts) else len(content)
+            guid_match = RSS_GUID_RE.search(content, start, end)
+            if guid_match and html.unescape(guid_match.group(1).strip()) in self.sent_items:
+                return content[:start] + '</channel></rss>', len(starts) - index
+        return content, 0
+
+    async def fetch_single_feed(self, feed_source: str, url: str, conditional: bool = False,
+                                incremental: bool = False) -> List[RSSItem]:
+        """Fetch and parse a single RSS feed
+
+        Args:
+            feed_source: Feed name
+            url: Feed URL
+            conditional: Send stored validators; an unmodified feed returns no items.
+                The response's validators are kept for commit_feed_validators
+            incremental: Stop at the first item that was already sent
+        """
         try:
             logger.info(f"Fetching {feed_source} RSS feed from {url}")
             
-            timeout = aiohttp.ClientTimeout(total=30)
-            
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        feed = feedparser.parse(content)
+            headers = self._conditional_headers(feed_source) if conditional else {}
+            session = get_http_client().session()
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    logger.info(f"{feed_source} RSS feed not modified")
+                    return []
+                if response.status == 200:
+                    content = await response.text()
+                    if conditional:
+                        self._pending_validators[feed_source] = {
+                            'etag': response.headers.get('ETag'),
+                            'last_modified': response.headers.get('Last-Modified')
+                        }
+                    if incremental:
+                        content, skipped = self._cut_at_sent_item(content)
+                        if skipped:
+                            logger.debug(f"Skipping {skipped} already seen {feed_source} items")
+                    feed = feedparser.parse(content)
                         
-                        items = []
-                        for entry in feed.entries:
-                            try:
-                                title = entry.title if hasattr(entry, 'title') else 'No title'
+                    items = []
+                    for entry in feed.entries:
+                        try:
+                            title = entry.title if hasattr(entry, 'title') else 'No title'
                                 
-                                # Handle different feed structures
-                                if feed_source == "mintos":
-                                    issuer = "Mintos"
-                                elif feed_source == "ffnews":
-                                    issuer = entry.author if hasattr(entry, 'author') else "FF News"
-                                else:  # nasdaq
-                                    # Try to extract issuer from different RSS fields
-                                    issuer = 'Unknown issuer'
-                                    if hasattr(entry, 'issuer'):
-                                        issuer = entry.issuer
-                                    elif hasattr(entry, 'author'):
-                                        issuer = entry.author
-                                    elif hasattr(entry, 'description'):
-                                        # Try to extract company name from description
-                                        description = entry.description
-                                        import re
-                                        match = re.search(r'^([^-:]+)[-:]', description)
-                                        if match:
-                                            issuer = match.group(1).strip()
-                                    elif hasattr(entry, 'summary'):
-                                        # Try to extract from summary
-                                        summary = entry.summary
-                                        import re
-                                        match = re.search(r'^([^-:]+)[-:]', summary)
-                                        if match:
-                                            issuer = match.group(1).strip()
+                            # Handle different feed structures
+                            if feed_source == "mintos":
+                                issuer = "Mintos"
+                            elif feed_source == "ffnews":
+                                issuer = entry.author if hasattr(entry, 'author') else "FF News"
+                            else:  # nasdaq
+                                # Try to extract issuer from different RSS fields
+                                issuer = 'Unknown issuer'
+                                if hasattr(entry, 'issuer'):
+                                    issuer = entry.issuer
+                                elif hasattr(entry, 'author'):
+                                    issuer = entry.author
+                                elif hasattr(entry, 'description'):
+                                    # Try to extract company name from description
+                                    description = entry.description
+                                    import re
+                                    match = re.search(r'^([^-:]+)[-:]', description)
+                                    if match:
+                                        issuer = match.group(1).strip()
+                                elif hasattr(entry, 'summary'):
+                                    # Try to extract from summary
+                                    summary = entry.summary
+                                    import re
+                                    match = re.search(r'^([^-:]+)[-:]', summary)
+                                    if match:
+                                        issuer = match.group(1).strip()
                                     
-                                    # Also try to extract issuer from title if it contains company patterns
-                                    if issuer == 'Unknown issuer':
-                                        title_lower = title.lower()
-                                        for keyword in self.keywords:
-                                            if keyword.lower() in title_lower:
-                                                issuer = keyword
-                                                break
+                                # Also try to extract issuer from title if it contains company patterns
+                                if issuer == 'Unknown issuer':
+                                    issuer = self.keyword_matcher.first(title.lower()) or issuer
                                 
-                                logger.debug(f"{feed_source} RSS entry - Title: '{title}', Issuer: '{issuer}'")
+                            logger.debug(f"{feed_source} RSS entry - Title: '{title}', Issuer: '{issuer}'")
                                 
-                                item = RSSItem(
-                                    title=title,
-                                    link=entry.link,
-                                    pub_date=entry.published,
-                                    guid=entry.guid,
-                                    issuer=issuer,
-                                    feed_source=feed_source
-                                )
-                                items.append(item)
-                            except Exception as e:
-                                logger.warning(f"Error parsing {feed_source} RSS entry: {e}")
-                                continue
+                            item = RSSItem(
+                                title=title,
+                                link=entry.link,
+                                pub_date=entry.published,
+                                guid=entry.guid,
+                                issuer=issuer,
+                                feed_source=feed_source
+                            )
+                            items.append(item)
+                        except Exception as e:
+                            logger.warning(f"Error parsing {feed_source} RSS entry: {e}")
+                            continue
                         
-                        logger.info(f"Fetched {len(items)} items from {feed_source}")
-                        return items
-                    else:
-                        logger.error(f"{feed_source} RSS feed fetch failed with status: {response.status}")
-                        return []
+                    logger.info(f"Fetched {len(items)} items from {feed_source}")
+                    return items
+                else:
+                    logger.error(f"{feed_source} RSS feed fetch failed with status: {response.status}")
+                    return []
                         
         except Exception as e:
             logger.error(f"Error fetching {feed_source} RSS feed: {e}")
@@ -399,18 +477,24 @@ class RSSReader(BaseManager):
         feeds_checked = []
         
         # Check each feed individually based on its update frequency
-        for feed_source, url in self.feed_urls.items():
+        for feed_source in self.feed_urls:
             if self._should_check_feed(feed_source):
                 logger.info(f"Checking {feed_source} feed (due for update)")
-                items = await self.fetch_single_feed(feed_source, url)
-                all_items.extend(items)
                 feeds_checked.append(feed_source)
-                
-                # Update last check time for this feed
-                self.last_check_times[feed_source] = datetime.now(timezone.utc)
             else:
                 logger.debug(f"Skipping {feed_source} feed (not due for update yet)")
         
+        # Fetch due feeds concurrently, skipping unmodified feeds and seen items
+        results = await asyncio.gather(*(
+            self.fetch_single_feed(feed_source, self.feed_urls[feed_source], conditional=True, incremental=True)
+            for feed_source in feeds_checked
+        ))
+        for feed_source, items in zip(feeds_checked, results):
+            all_items.extend(items)
+            
+            # Update last check time for this feed
+            self.last_check_times[feed_source] = datetime.now(timezone.utc)
+        
         # Save updated check times if any feeds were checked
         if feeds_checked:
             self._save_last_check_times()
@@ -420,14 +504,56 @@ class RSSReader(BaseManager):
         
         return all_items
 
-    async def fetch_all_rss_feeds_force(self) -> List[RSSItem]:
-        """Force fetch all RSS feeds regardless of timing (for admin use)"""
+    async def _shared_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+        """Run a fetch at most once per key within ttl seconds
+
+        Callers arriving while the fetch is in flight await the same task,
+        and callers within ttl of its completion get its cached result.
+        """
+        cached = self._fetch_cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            logger.debug(f"Using cached {key} fetch from {time.monotonic() - cached[0]:.0f}s ago")
+            return cached[1]
+
+        task = self._fetches_in_flight.get(key)
+        if task is None:
+            async def run() -> Any:
+                try:
+                    result = await fetch()
+                    self._fetch_cache[key] = (time.monotonic(), result)
+                    return result
+                finally:
+                    self._fetches_in_flight.pop(key, None)
+            task = self._fetches_in_flight[key] = asyncio.ensure_future(run())
+        else:
+            logger.debug(f"Joining {key} fetch in flight")
+        # Shield so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def fetch_all_rss_feeds_force(self, refresh: bool = False) -> List[RSSItem]:
+        """Force fetch all RSS feeds regardless of timing (for admin use)
+
+        Admin actions within RSS_FORCE_FETCH_CACHE_SECONDS share one fetch, so
+        item indexes stay stable between the steps of an admin flow.
+
+        Args:
+            refresh: Ignore the cached result and fetch again
+        """
+        if refresh:
+            self._fetch_cache.pop('force_all', None)
+        items = await self._shared_fetch('force_all', self._fetch_all_feeds, RSS_FORCE_FETCH_CACHE_SECONDS)
+        return list(items)
+
+    async def _fetch_all_feeds(self) -> List[RSSItem]:
+        """Fetch all RSS feeds concurrently"""
         all_items = []
         
-        # Force check all feeds
-        for feed_source, url in self.feed_urls.items():
-            logger.info(f"Force checking {feed_source} feed for admin")
-            items = await self.fetch_single_feed(feed_source, url)
+        # Force check all feeds concurrently, always downloading the full feeds
+        logger.info(f"Force checking {', '.join(self.feed_urls)} feeds for admin")
+        results = await asyncio.gather(*(
+            self.fetch_single_feed(feed_source, url) for feed_source, url in self.feed_urls.items()
+        ))
+        for items in results:
             all_items.extend(items)
         
         logger.info(f"Force fetched total of {len(all_items)} RSS items from {len(self.feed_urls)} feeds")
@@ -436,12 +562,17 @@ class RSSReader(BaseManager):
     def get_new_items(self, items: List[RSSItem]) -> List[RSSItem]:
         """Filter out already sent items and apply keyword filtering"""
         new_items = []
+        now = datetime.now(timezone.utc).timestamp()
         
         for item in items:
             # Skip if already sent
             if item.guid in self.sent_items:
                 continue
             
+            # Skip items older than the dedup window, their GUIDs may have been evicted
+            if item.published_dt.timestamp() < now - self.sent_items.ttl(item.feed_source):
+                continue
+            
             # Apply keyword filtering
             if not self._matches_keywords(item):
                 continue
@@ -466,15 +597,8 @@ class RSSReader(BaseManager):
         return filtered_items
     
     def mark_item_as_sent(self, item: RSSItem) -> None:
-        """Mark an RSS item as sent"""
-        self.sent_items.add(item.guid)
-        # Keep only recent items to prevent file from growing too large
-        if len(self.sent_items) > 1000:
-            # Sort by timestamp and keep only the most recent 800
-            all_items = list(self.sent_items)
-            self.sent_items = set(all_items[-800:])
-        
-        self._save_sent_items()
+        """Mark an RSS item as sent; expired GUIDs are evicted and changes saved in batches"""
+        self.sent_items.add(item.guid, item.feed_source)
     
     def format_rss_message(self, item: RSSItem) -> str:
         """Format RSS item for Telegram message based on feed source"""
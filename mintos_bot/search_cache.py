@@ -0,0 +1,119 @@
+"""
+Search Result Cache for the Mintos Telegram Bot
+Persistent, size-bounded cache of news search results keyed by query,
+country and freshness window, shared by the news readers so repeated
+requests within a window do not call the search APIs again.
+"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from .config import SEARCH_CACHE_TTL_HOURS, SEARCH_CACHE_MAX_ENTRIES
+from .storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+class SearchResultCache:
+    """TTL cache of search results evicting the least recently stored entries
+
+    Entries are persisted one by one to a storage namespace holding
+    ``key -> {'value': ..., 'ts': ..., 'expires': ...}`` rows.
+    """
+
+    def __init__(self, namespace: str = 'news_search_cache', storage: Any = None,
+                 ttl_hours: Dict[int, float] = SEARCH_CACHE_TTL_HOURS,
+                 max_entries: int = SEARCH_CACHE_MAX_ENTRIES):
+        """Initialize the cache and load persisted entries
+
+        Args:
+            namespace: Storage namespace holding the entries
+            storage: Storage backend, the process-wide backend by default
+            ttl_hours: Hours results are kept, per maximum freshness window in days
+            max_entries: Entries kept before the oldest are evicted
+        """
+        self.namespace = namespace
+        self.storage = storage or get_storage()
+        self.ttl_hours = dict(sorted(ttl_hours.items()))
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            now = time.time()
+            rows = self.storage.load_namespace(namespace)
+            for key, row in sorted(rows.items(), key=lambda item: item[1].get('ts') or 0):
+                if (row.get('expires') or 0) > now:
+                    self._entries[key] = row
+            expired = set(rows) - set(self._entries)
+            for key in expired:
+                self.storage.delete(namespace, key)
+            self._evict()
+            logger.info(f"Loaded {len(self._entries)} cached search results from {namespace}")
+        except Exception as e:
+            logger.error(f"Error loading {namespace}: {e}", exc_info=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(query: str, country: str, freshness: str) -> str:
+        """Build the cache key of a search"""
+        return f"{query}|{country}|{freshness}"
+
+    def ttl(self, days_back: int) -> float:
+        """Get the TTL in seconds for results of a freshness window
+
+        Narrow windows expire sooner since new articles change them the most.
+        """
+        for max_days, hours in self.ttl_hours.items():
+            if days_back <= max_days:
+                return hours * 3600
+        return list(self.ttl_hours.values())[-1] * 3600 if self.ttl_hours else 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get cached results, or None if they are missing or expired"""
+        row = self._entries.get(key)
+        if row is not None and row.get('expires', 0) <= time.time():
+            self._remove(key)
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row.get('value')
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """Store results for ttl_seconds"""
+        if ttl_seconds <= 0:
+            return
+        now = time.time()
+        row = {'value': value, 'ts': now, 'expires': now + ttl_seconds}
+        self._entries.pop(key, None)
+        self._entries[key] = row
+        try:
+            self.storage.put(self.namespace, key, row)
+        except Exception as e:
+            logger.error(f"Error saving {key} to {self.namespace}: {e}", exc_info=True)
+        self._evict()
+
+    def _remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+        try:
+            self.storage.delete(self.namespace, key)
+        except Exception as e:
+            logger.error(f"Error deleting {key} from {self.namespace}: {e}", exc_info=True)
+
+    def _evict(self) -> None:
+        """Drop the oldest entries beyond max_entries"""
+        while len(self._entries) > self.max_entries:
+            key = next(iter(self._entries))
+            self._remove(key)
+
+_search_cache: Optional[SearchResultCache] = None
+def get_search_cache() -> SearchResultCache:
+    """Get the process-wide search result cache"""
+    global _search_cache
+    if _search_cache is None:
+        _search_cache = SearchResultCache()
+    return _search_cache
@@ -0,0 +1,142 @@
+"""
+Sent Ledger for the Mintos Telegram Bot
+Tracks sent item IDs in memory, backed by an append-only JSONL ledger
+that is compacted periodically instead of rewriting a JSON file per item,
+or by row-level writes when a row-level storage backend is configured.
+"""
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+class SentLedger:
+    """In-memory ``id -> timestamp`` index backed by an append-only JSONL file
+
+    A timestamp of None marks items imported from the legacy format without
+    a recorded send time.
+    """
+
+    def __init__(self, ledger_file: str, legacy_file: Optional[str] = None,
+                 compact_min_lines: int = 1000, storage: Any = None):
+        """Initialize the ledger and load existing entries
+
+        Args:
+            ledger_file: Path to the JSONL ledger; its base name is the storage namespace
+            legacy_file: Path to the old JSON list file, imported once if the ledger is missing
+            compact_min_lines: Minimum number of ledger lines before compaction is considered
+            storage: Optional storage backend; row-level backends replace the JSONL file
+        """
+        self.ledger_file = ledger_file
+        self.legacy_file = legacy_file
+        self.compact_min_lines = compact_min_lines
+        self.entries: Dict[str, Optional[float]] = {}
+        self._line_count = 0
+        self.storage = storage if storage is not None and storage.row_level else None
+        self.namespace = os.path.splitext(os.path.basename(ledger_file))[0]
+        if self.storage:
+            self.entries = self.storage.load_namespace(self.namespace)
+            logger.info(f"Loaded {len(self.entries)} sent IDs from {self.namespace} storage")
+        else:
+            self._load()
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def get(self, item_id: str) -> Optional[float]:
+        """Get the last send timestamp for an item"""
+        return self.entries.get(item_id)
+
+    def _load(self) -> None:
+        """Load the ledger, importing the legacy JSON file on first use"""
+        try:
+            if os.path.exists(self.ledger_file):
+                corrupt = False
+                with open(self.ledger_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if not line.endswith('\n'):
+                            corrupt = True  # Unterminated final line, appends would corrupt it
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            # Torn final line after a crash
+                            logger.warning(f"Skipping corrupt line in {self.ledger_file}")
+                            corrupt = True
+                            continue
+                        self.entries[record['id']] = record.get('timestamp')
+                        self._line_count += 1
+                logger.info(f"Loaded {len(self.entries)} sent IDs from {self.ledger_file}")
+                if corrupt:
+                    self.compact()
+                else:
+                    self._maybe_compact()
+            elif self.legacy_file:
+                self._import_legacy()
+        except Exception as e:
+            logger.error(f"Error loading sent ledger {self.ledger_file}: {e}", exc_info=True)
+
+    def _import_legacy(self) -> None:
+        """Import IDs from the legacy JSON list (or its backup) and write a compacted ledger"""
+        for path in (self.legacy_file, f"{self.legacy_file}.bak"):
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Could not read legacy sent file {path}: {e}")
+                continue
+            for entry in data if isinstance(data, list) else []:
+                if isinstance(entry, dict) and 'id' in entry:
+                    self.entries[entry['id']] = entry.get('timestamp')
+                elif isinstance(entry, str):
+                    self.entries[entry] = None
+            logger.info(f"Imported {len(self.entries)} sent IDs from legacy file {path}")
+            break
+        self.compact()
+
+    def mark(self, item_id: str, timestamp: Optional[float] = None) -> None:
+        """Record an item as sent by appending to the ledger"""
+        now = timestamp if timestamp is not None else time.time()
+        self.entries[item_id] = now
+        if self.storage:
+            self.storage.put(self.namespace, item_id, now)
+            return
+        try:
+            with open(self.ledger_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'id': item_id, 'timestamp': now}) + '\n')
+            self._line_count += 1
+            self._maybe_compact()
+        except Exception as e:
+            logger.error(f"Error appending to sent ledger {self.ledger_file}: {e}", exc_info=True)
+
+    def _maybe_compact(self) -> None:
+        """Compact once superseded lines outnumber live entries"""
+        if self._line_count > max(self.compact_min_lines, 2 * len(self.entries)):
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the ledger with one line per ID, atomically"""
+        tmp_file = f"{self.ledger_file}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.ledger_file) or '.', exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                for item_id, ts in self.entries.items():
+                    f.write(json.dumps({'id': item_id, 'timestamp': ts}) + '\n')
+            os.replace(tmp_file, self.ledger_file)
+            self._line_count = len(self.entries)
+            logger.debug(f"Compacted {self.ledger_file} to {self._line_count} entries")
+        except Exception as e:
+            logger.error(f"Error compacting sent ledger {self.ledger_file}: {e}", exc_info=True)
+
@@ -0,0 +1,281 @@
+"""
+Storage backends for the Mintos Telegram Bot
+Provides a pluggable persistence layer for bot state with a JSON-file
+backend (one file per namespace) and a SQLite WAL backend with row-level,
+transactional writes that the dashboard can read concurrently.
+"""
+import abc
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from .constants import DATA_DIR, STATE_DB_FILE, STORAGE_BACKEND
+from .utils import FileBackupManager
+
+logger = logging.getLogger(__name__)
+
+# Keyed collections stored one row per key
+COLLECTION_NAMESPACES = ['users', 'notification_preferences', 'rss_user_preferences', 'user_states']
+
+# Sent-item collections, stored as JSONL ledgers by the JSON backend
+SENT_NAMESPACES = ['sent_updates', 'sent_campaigns', 'sent_documents']
+
+# Whole documents (caches and small lists)
+DOCUMENT_NAMESPACES = [
+    'updates_cache', 'campaigns_cache', 'documents_cache', 'pending_campaigns',
+    'update_validators', 'poll_schedule'
+]
+
+class StorageBackend(abc.ABC):
+    """Interface for bot state persistence
+
+    State is organised in namespaces. A namespace is either a keyed
+    collection (one value per key) or a single document.
+    """
+
+    #: Whether single-key writes are persisted without rewriting the namespace
+    row_level = False
+
+    @abc.abstractmethod
+    def load_namespace(self, namespace: str) -> Dict[str, Any]:
+        """Load all keys of a collection"""
+
+    @abc.abstractmethod
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        """Insert or replace one key of a collection"""
+
+    @abc.abstractmethod
+    def delete(self, namespace: str, key: str) -> None:
+        """Delete one key of a collection"""
+
+    @abc.abstractmethod
+    def replace_namespace(self, namespace: str, mapping: Dict[str, Any]) -> None:
+        """Replace the whole collection atomically"""
+
+    @abc.abstractmethod
+    def load_document(self, namespace: str, default: Any = None) -> Any:
+        """Load a document"""
+
+    @abc.abstractmethod
+    def save_document(self, namespace: str, value: Any, backup: bool = True) -> bool:
+        """Save a document, returning True on success"""
+
+    @abc.abstractmethod
+    def document_age(self, namespace: str) -> float:
+        """Get seconds since a document was last saved, or infinity if missing"""
+
+class JSONFileBackend(StorageBackend):
+    """Stores each namespace as ``<data_dir>/<namespace>.json`` with ``.bak`` copies"""
+
+    def __init__(self, data_dir: str = DATA_DIR):
+        self.data_dir = data_dir
+        os.makedirs(data_dir, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _path(self, namespace: str) -> str:
+        return os.path.join(self.data_dir, f"{namespace}.json")
+
+    def load_namespace(self, namespace: str) -> Dict[str, Any]:
+        data = FileBackupManager.safe_json_load(self._path(namespace), {})
+        if isinstance(data, list):
+            # Legacy format: plain list of keys
+            return {str(key): None for key in data}
+        return data if isinstance(data, dict) else {}
+
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        with self._lock:
+            data = self.load_namespace(namespace)
+            data[key] = value
+            FileBackupManager.safe_json_save(self._path(namespace), data)
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            data = self.load_namespace(namespace)
+            if key in data:
+                del data[key]
+                FileBackupManager.safe_json_save(self._path(namespace), data)
+
+    def replace_namespace(self, namespace: str, mapping: Dict[str, Any]) -> None:
+        with self._lock:
+            FileBackupManager.safe_json_save(self._path(namespace), mapping)
+
+    def load_document(self, namespace: str, default: Any = None) -> Any:
+        return FileBackupManager.safe_json_load(self._path(namespace), default)
+
+    def save_document(self, namespace: str, value: Any, backup: bool = True) -> bool:
+        with self._lock:
+            return FileBackupManager.safe_json_save(self._path(namespace), value, create_backup=backup)
+
+    def document_age(self, namespace: str) -> float:
+        path = self._path(namespace)
+        try:
+            if os.path.exists(path):
+                return time.time() - os.path.getmtime(path)
+        except OSError as e:
+            logger.error(f"Error getting age of {path}: {e}")
+        return float('inf')
+
+class SQLiteBackend(StorageBackend):
+    """Stores state in a single SQLite database in WAL mode"""
+
+    row_level = True
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS kv (
+            namespace TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value TEXT,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (namespace, key)
+        );
+        CREATE INDEX IF NOT EXISTS idx_kv_updated ON kv (namespace, updated_at);
+        CREATE TABLE IF NOT EXISTS documents (
+            namespace TEXT PRIMARY KEY,
+            value TEXT,
+            updated_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    def __init__(self, db_file: str = STATE_DB_FILE):
+        self.db_file = db_file
+        os.makedirs(os.path.dirname(db_file) or '.', exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_file, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+    def _write(self, sql: str, params_list: list) -> None:
+        """Run statements in one transaction"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(sql, params_list)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def load_namespace(self, namespace: str) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute("SELECT key, value FROM kv WHERE namespace = ?", (namespace,)).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        self.put_many(namespace, {key: value})
+
+    def put_many(self, namespace: str, mapping: Dict[str, Any]) -> None:
+        """Insert or replace several keys in one transaction"""
+        now = time.time()
+        self._write(
+            "INSERT OR REPLACE INTO kv (namespace, key, value, updated_at) VALUES (?, ?, ?, ?)",
+            [(namespace, str(key), json.dumps(value), now) for key, value in mapping.items()]
+        )
+
+    def delete(self, namespace: str, key: str) -> None:
+        self._write("DELETE FROM kv WHERE namespace = ? AND key = ?", [(namespace, str(key))])
+
+    def replace_namespace(self, namespace: str, mapping: Dict[str, Any]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM kv WHERE namespace = ?", (namespace,))
+                self._conn.executemany(
+                    "INSERT INTO kv (namespace, key, value, updated_at) VALUES (?, ?, ?, ?)",
+                    [(namespace, str(key), json.dumps(value), now) for key, value in mapping.items()]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def load_document(self, namespace: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM documents WHERE namespace = ?", (namespace,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def save_document(self, namespace: str, value: Any, backup: bool = True) -> bool:
+        # Transactions make backup copies unnecessary
+        try:
+            self._write(
+                "INSERT OR REPLACE INTO documents (namespace, value, updated_at) VALUES (?, ?, ?)",
+                [(namespace, json.dumps(value), time.time())]
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save document {namespace}: {e}")
+            return False
+
+    def document_age(self, namespace: str) -> float:
+        with self._lock:
+            row = self._conn.execute("SELECT updated_at FROM documents WHERE namespace = ?", (namespace,)).fetchone()
+        return time.time() - row[0] if row else float('inf')
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        self._write("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", [(key, value)])
+
+def migrate_json_to_sqlite(backend: SQLiteBackend, data_dir: str = DATA_DIR) -> None:
+    """One-shot import of the legacy JSON state files into SQLite"""
+    if backend.get_meta('json_migrated'):
+        return
+
+    logger.info("Migrating JSON state files to SQLite...")
+    source = JSONFileBackend(data_dir)
+    for namespace in COLLECTION_NAMESPACES:
+        mapping = source.load_namespace(namespace)
+        if mapping:
+            backend.replace_namespace(namespace, mapping)
+            logger.info(f"Migrated {len(mapping)} rows into {namespace}")
+
+    from .sent_ledger import SentLedger
+    for namespace in SENT_NAMESPACES:
+        ledger_file = os.path.join(data_dir, f"{namespace}.jsonl")
+        legacy_file = os.path.join(data_dir, f"{namespace}.json")
+        if not any(os.path.exists(path) for path in (ledger_file, legacy_file, f"{legacy_file}.bak")):
+            continue
+        ledger = SentLedger(ledger_file, legacy_file=legacy_file)
+        if len(ledger):
+            backend.put_many(namespace, ledger.entries)
+            logger.info(f"Migrated {len(ledger)} sent IDs into {namespace}")
+
+    for namespace in DOCUMENT_NAMESPACES:
+        value = source.load_document(namespace)
+        if value is not None:
+            backend.save_document(namespace, value)
+            logger.info(f"Migrated document {namespace}")
+
+    backend.set_meta('json_migrated', str(time.time()))
+    logger.info("JSON state migration completed")
+
+_storage: Optional[StorageBackend] = None
+_storage_lock = threading.Lock()
+
+def get_storage() -> StorageBackend:
+    """Get the process-wide storage backend selected by STORAGE_BACKEND"""
+    global _storage
+    with _storage_lock:
+        if _storage is None:
+            if STORAGE_BACKEND == 'sqlite':
+                backend = SQLiteBackend()
+                try:
+                    migrate_json_to_sqlite(backend)
+                except Exception as e:
+                    logger.error(f"Error migrating JSON state to SQLite: {e}", exc_info=True)
+                _storage = backend
+            else:
+                _storage = JSONFileBackend()
+            logger.info(f"Using {type(_storage).__name__} for bot state")
+        return _storage
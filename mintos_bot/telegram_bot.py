@@ -17,14 +17,25 @@ from .config import (
     UPDATES_FILE, 
     CAMPAIGNS_FILE, 
     DOCUMENT_SCRAPE_INTERVAL_HOURS,
-    DOCUMENT_TYPES
+    POLL_MIN_INTERVAL_HOURS,
+    DOCUMENT_TYPES,
+    OUTBOUND_POLL_SECONDS,
+    NEWS_BATCH_SUBMIT_HOUR_UTC,
+    NEWS_BATCH_DAYS,
+    NEWS_BATCH_POLL_MINUTES
 )
+from .broadcaster import Broadcaster
+from .callback_router import CallbackRouter
+from .http_client import get_http_client
+from .outbound_queue import OutboundQueue
 from .data_manager import DataManager
 from .mintos_client import MintosClient
+from .poll_scheduler import LenderPollScheduler
 from .document_scraper import DocumentScraper
 from .user_manager import UserManager
 from .rss_reader import RSSReader
 from .openai_news import OpenAINewsReader
+from .update_diff import RECOVERED_AMOUNT_UP, REMAINING_AMOUNT_DOWN, STATUS_CHANGE
 
 logger = setup_logger(__name__)
 
@@ -83,15 +94,21 @@ class MintosBot:
             self.application: Optional[Application] = None
             self.data_manager = DataManager()
             self.mintos_client = MintosClient()
+            self.poll_scheduler = LenderPollScheduler()
             self.user_manager = UserManager()
             self.document_scraper = DocumentScraper()
             self.rss_reader = RSSReader()
             self.openai_news = OpenAINewsReader()
+            self.broadcaster = Broadcaster(self._deliver_message, on_retry_exhausted=self._queue_failed_message)
+            self.outbound_queue = OutboundQueue()
+            self.callback_router = self._build_callback_router()
             self._polling_task: Optional[asyncio.Task] = None
             self._openai_news_task: Optional[asyncio.Task] = None
             self._update_task: Optional[asyncio.Task] = None
             self._campaign_task: Optional[asyncio.Task] = None
             self._rss_task: Optional[asyncio.Task] = None
+            self._outbound_task: Optional[asyncio.Task] = None
+            self._news_batch_task: Optional[asyncio.Task] = None
             self._is_startup_check = True  # Flag to indicate first check after startup
             self._initialized = True
             logger.info("Bot instance created")
@@ -100,15 +117,22 @@ class MintosBot:
         """Cleanup bot resources and tasks"""
         try:
             logger.info("Starting cleanup process...")
+            for route, stats in self.callback_router.slowest_routes():
+                logger.info(
+                    f"Callback {route}: {stats.calls} calls, {stats.errors} errors, "
+                    f"avg {stats.average_seconds * 1000:.0f}ms, max {stats.max_seconds * 1000:.0f}ms"
+                )
             await self._cancel_tasks()
             await self._cleanup_application()
+            await get_http_client().close()
+            self.document_scraper.close()
             logger.info("Cleanup completed successfully")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}", exc_info=True)
 
     async def _cancel_tasks(self) -> None:
         """Cancel running background tasks"""
-        for task_name, task in [("polling", self._polling_task), ("update", self._update_task), ("campaign", self._campaign_task), ("rss", self._rss_task)]:
+        for task_name, task in [("polling", self._polling_task), ("update", self._update_task), ("campaign", self._campaign_task), ("rss", self._rss_task), ("outbound", self._outbound_task), ("news_batch", self._news_batch_task)]:
             if task and not task.done():
                 task.cancel()
                 try:
@@ -242,32 +266,35 @@ class MintosBot:
                 await self.initialize()
 
     async def scheduled_updates(self) -> None:
-        """Handle scheduled update checks with improved resilience"""
+        """Poll lenders as the adaptive scheduler makes them due, with improved resilience"""
         consecutive_errors = 0
         max_consecutive_errors = 3
-        normal_sleep = 5 * 60  # Regular 5-minute check interval
+        normal_sleep = 5 * 60  # Regular 5-minute scheduling tick
         error_sleep = 3 * 60   # Shorter 3-minute retry after errors
-        long_sleep = 55 * 60   # 55-minute wait after successful update
+
+        try:
+            self.poll_scheduler.sync_lenders(
+                self.data_manager.company_names.keys(),
+                self.data_manager.load_previous_updates()
+            )
+        except Exception as e:
+            logger.error(f"Error initializing poll scheduler: {e}", exc_info=True)
 
         while True:
             try:
-                # Check the current time and stale cache situation
-                should_check = await self.should_check_updates()
+                due_lenders = self.poll_scheduler.take_due()
 
-                if should_check:
-                    logger.info("Running scheduled update")
+                if due_lenders:
+                    logger.info(f"Running scheduled update for {len(due_lenders)} due lenders")
                     try:
-                        await self._safe_update_check()
+                        try:
+                            await self._safe_update_check(lender_ids=due_lenders, raise_errors=True)
+                        finally:
+                            # Put back lenders the sweep did not record results for
+                            self.poll_scheduler.release(due_lenders)
                         # Reset error counter after successful update
                         consecutive_errors = 0
                         logger.info("Scheduled update completed successfully")
-
-                        # Try to resend any failed messages
-                        await self.retry_failed_messages()
-
-                        # Use longer sleep interval after successful update
-                        await asyncio.sleep(long_sleep)
-                        continue  # Skip the normal sleep at the end
                     except Exception as e:
                         consecutive_errors += 1
                         logger.error(f"Update check failed ({consecutive_errors}/{max_consecutive_errors}): {e}", exc_info=True)
@@ -279,23 +306,8 @@ class MintosBot:
                         else:
                             await asyncio.sleep(error_sleep)
                         continue  # Skip the normal sleep at the end
-                else:
-                    # Check for stale cache during business hours
-                    try:
-                        cache_age_hours = self.data_manager.get_cache_age() / 3600
-                        now = datetime.now()
-                        # If more than 30 hours old on a weekday during business hours, force an update
-                        if (cache_age_hours > 30 and now.weekday() < 5 and 
-                            9 <= now.hour <= 18):  # Business hours (9 AM to 6 PM)
-                            logger.warning(f"Cache file is {cache_age_hours:.1f} hours old - forcing emergency update")
-                            await self._safe_update_check()
-                            consecutive_errors = 0
-                            await asyncio.sleep(long_sleep)
-                            continue
-                    except Exception as e:
-                        logger.error(f"Error checking cache age: {e}")
 
-                # Normal sleep interval between checks
+                # Normal sleep interval between scheduling ticks
                 await asyncio.sleep(normal_sleep)
 
             except asyncio.CancelledError:
@@ -306,13 +318,18 @@ class MintosBot:
                 # Use shorter sleep time when we encounter errors
                 await asyncio.sleep(error_sleep)
 
-    async def _safe_update_check(self) -> None:
-        """Safely perform update check with error handling"""
+    async def _safe_update_check(self, lender_ids: Optional[List[int]] = None, raise_errors: bool = False) -> None:
+        """Safely perform update check with error handling
+
+        Args:
+            lender_ids: Lenders to check, or None for a full sweep of all lenders
+            raise_errors: Re-raise errors after logging them, so the scheduler can back off
+        """
         try:
             await asyncio.sleep(1)  # Prevent conflicts
             
             # Check for company updates
-            await self.check_updates()
+            await self.check_updates(lender_ids)
             logger.info("Update check completed")
             
             # Check for document updates
@@ -323,6 +340,8 @@ class MintosBot:
             
         except Exception as e:
             logger.error(f"Update check error: {e}", exc_info=True)
+            if raise_errors:
+                raise
 
     async def run(self) -> None:
         """Run the bot with polling and scheduled updates"""
@@ -341,6 +360,9 @@ class MintosBot:
                     logger.error("Bot initialization failed")
                     raise RuntimeError("Bot initialization failed")
 
+                # Open the pooled HTTP session before the pollers use it
+                await get_http_client().start()
+
                 # Start polling in background
                 if self.application and self.application.updater:
                     self._polling_task = asyncio.create_task(
@@ -359,8 +381,14 @@ class MintosBot:
                 # Start RSS updates
                 self._rss_task = asyncio.create_task(self.scheduled_rss_updates())
 
+                # Start redelivery of queued messages
+                self._outbound_task = asyncio.create_task(self.scheduled_outbound_queue())
+
+                # Start the nightly OpenAI batch classification of company news
+                self._news_batch_task = asyncio.create_task(self.scheduled_news_batch())
+
                 # Wait for all tasks
-                await asyncio.gather(self._polling_task, self._update_task, self._campaign_task, self._rss_task)
+                await asyncio.gather(self._polling_task, self._update_task, self._campaign_task, self._rss_task, self._outbound_task, self._news_batch_task)
                 return
 
             except Exception as e:
@@ -427,8 +455,8 @@ class MintosBot:
         return (
             "🚀 Welcome to Mintos Update Bot!\n\n"
             "📅 Update Schedule:\n"
-            "• Automatic updates on weekdays at 3 PM, 4 PM, and 5 PM (UTC)\n"
-            "• Document scraping happens daily\n\n"
+            f"• Recovery updates are checked adaptively: active lenders as often as every {POLL_MIN_INTERVAL_HOURS}h, quiet ones at least weekly\n"
+            f"• Company documents are checked every {DOCUMENT_SCRAPE_INTERVAL_HOURS} hours\n\n"
             "📊 Data Commands:\n"
             "• /company - Check updates for a specific company\n"
             "• /today [YYYY-MM-DD] - View updates for today or a specific date\n"
@@ -489,1519 +517,1629 @@ class MintosBot:
 
             if not query.data:
                 return
-                
-            if query.data.startswith("company_"):
-                company_id = int(query.data.split("_")[1])
-                company_name = self.data_manager.get_company_name(company_id)
-
-                buttons = [
-                    [InlineKeyboardButton("Latest Update", callback_data=f"latest_{company_id}")],
-                    [InlineKeyboardButton("All Updates", callback_data=f"all_{company_id}_0")]
-                ]
-                reply_markup = InlineKeyboardMarkup(buttons)
-                if query.message:
-                    await query.edit_message_text(
-                        f"Select update type for {company_name}:",
-                        reply_markup=reply_markup,
-                        disable_web_page_preview=True
-                )
 
-            elif query.data == "refresh_cache":
-                chat_id = update.effective_chat.id
-                await query.edit_message_text("🔄 Refreshing updates...", disable_web_page_preview=True)
+            await self.callback_router.dispatch(query.data, update, context, query)
 
-                try:
-                    # Force update check regardless of hour
-                    await self._safe_update_check()
-                    # Run today command again
-                    await self.today_command(update, context)
-                except Exception as e:
-                    logger.error(f"Error during refresh from callback: {e}")
-                    await query.edit_message_text("⚠️ Error refreshing updates. Please try again.", disable_web_page_preview=True)
+        except BadRequest as e:
+            if "Message is not modified" in str(e):
+                # This happens when trying to edit a message with identical content
+                # Just acknowledge the callback without showing an error
+                logger.debug(f"Message not modified in callback: {e}")
                 return
-                
-            elif query.data == "use_current_cache":
-                chat_id = update.effective_chat.id
-                await query.edit_message_text("Using current cached data...", disable_web_page_preview=True)
-                
+            else:
+                logger.error(f"BadRequest in handle_callback: {e}", exc_info=True)
                 try:
-                    # Create a fresh update but use existing context
-                    new_update = Update(update.update_id, message=update.effective_message)
-                    await self.today_command(new_update, context)
-                except Exception as e:
-                    logger.error(f"Error displaying cached updates: {e}")
-                    await query.edit_message_text("⚠️ Error displaying updates. Please try again.", disable_web_page_preview=True)
-                return
-                
-            elif query.data == "refresh_documents":
-                chat_id = update.effective_chat.id
-                # Improved refresh message with HTML formatting for consistency
-                await query.edit_message_text(
-                    "🔄 <b>Refreshing documents...</b>\n\n"
-                    "Checking for new presentations, financials, and loan agreements "
-                    "across all companies. This may take a moment.",
-                    disable_web_page_preview=True,
-                    parse_mode='HTML'
+                    await query.edit_message_text("⚠️ Error processing your request. Please try again.", disable_web_page_preview=True)
+                except:
+                    # If we can't edit the message, just log it
+                    logger.error("Could not edit message to show error")
+        except Exception as e:
+            logger.error(f"Error in handle_callback: {e}", exc_info=True)
+            try:
+                await query.edit_message_text("⚠️ Error processing your request. Please try again.", disable_web_page_preview=True)
+            except:
+                # If we can't edit the message, just log it
+                logger.error("Could not edit message to show error")
+
+    def _build_callback_router(self) -> CallbackRouter:
+        """Register a handler for every inline-keyboard callback"""
+        router = CallbackRouter()
+        router.prefix("company_", self._cb_company)
+        router.exact("refresh_cache", self._cb_refresh_cache)
+        router.exact("use_current_cache", self._cb_use_current_cache)
+        router.exact("refresh_documents", self._cb_refresh_documents)
+        router.exact("admin_users", self._cb_admin_users)
+        router.prefix("admin_trigger_today", self._cb_admin_trigger_today)
+        router.exact("admin_refresh_updates", self._cb_admin_refresh_updates)
+        router.exact("admin_refresh_documents", self._cb_admin_refresh_documents)
+        router.exact("trigger_today_custom", self._cb_trigger_today_custom)
+        router.prefix("trigger_today_", self._cb_trigger_today)
+        router.exact("admin_send_rss", self._cb_admin_send_rss)
+        router.exact("admin_exit", self._cb_admin_exit)
+        router.exact("admin_back", self._cb_admin_back)
+        router.prefix("rss_toggle_", self._cb_rss_toggle)
+        router.prefix("notify_", self._cb_notify)
+        router.prefix("toggle_news_", self._cb_toggle_news)
+        router.prefix("fetch_news_", self._cb_fetch_news)
+        router.exact("news_settings", self._cb_news_settings)
+        router.exact("news_view_companies", self._cb_news_view_companies)
+        router.exact("news_clear_history", self._cb_news_clear_history)
+        router.prefix("fetch_news_days_", self._cb_fetch_news_days)
+        router.exact("news_enter_days", self._cb_news_enter_days)
+        router.exact("news_send_options", self._cb_news_send_options)
+        router.exact("news_send_setup_all", self._cb_news_send_setup)
+        router.exact("news_send_setup_user", self._cb_news_send_setup)
+        router.exact("news_send_setup_channel", self._cb_news_send_setup)
+        router.exact("news_send_period_setup", self._cb_news_send_period_setup)
+        router.exact("news_send_resend_setup", self._cb_news_send_resend_setup)
+        router.prefix("news_send_period_", self._cb_news_send_period)
+        router.prefix("news_send_resend_", self._cb_news_send_resend)
+        router.exact("news_send_back_to_setup", self._cb_news_send_back_to_setup)
+        router.exact("news_send_all", self._cb_news_send_all)
+        router.exact("news_send_user", self._cb_news_send_user)
+        router.exact("news_send_channel", self._cb_news_send_channel)
+        router.exact("news_send_confirm_all", self._cb_news_send_confirm_all)
+        router.prefix("news_send_configured_to_", self._cb_news_send_configured_to)
+        router.prefix("news_send_to_", self._cb_news_send_to)
+        router.exact("news_send_custom_channel", self._cb_news_send_custom_channel)
+        router.exact("news_reset_tracking", self._cb_news_reset_tracking)
+        router.prefix("feed_toggle_", self._cb_feed_toggle)
+        router.prefix("rss_feed_select_", self._cb_rss_feed_select)
+        router.prefix("rss_item_select_", self._cb_rss_item_select)
+        router.prefix("send_rss_to_", self._cb_send_rss_to)
+        router.exact("cancel", self._cb_cancel)
+        router.prefix("latest_", self._cb_company_updates)
+        router.prefix("all_", self._cb_company_updates)
+        return router
+
+    async def _cb_company(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle company_* callbacks"""
+        company_id = int(query.data.split("_")[1])
+        company_name = self.data_manager.get_company_name(company_id)
+
+        buttons = [
+            [InlineKeyboardButton("Latest Update", callback_data=f"latest_{company_id}")],
+            [InlineKeyboardButton("All Updates", callback_data=f"all_{company_id}_0")]
+        ]
+        reply_markup = InlineKeyboardMarkup(buttons)
+        if query.message:
+            await query.edit_message_text(
+                f"Select update type for {company_name}:",
+                reply_markup=reply_markup,
+                disable_web_page_preview=True
+        )
+
+    async def _cb_refresh_cache(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the refresh_cache callback"""
+        await query.edit_message_text("🔄 Refreshing updates...", disable_web_page_preview=True)
+
+        try:
+            # Force update check regardless of hour
+            await self._safe_update_check()
+            # Run today command again
+            await self.today_command(update, context)
+        except Exception as e:
+            logger.error(f"Error during refresh from callback: {e}")
+            await query.edit_message_text("⚠️ Error refreshing updates. Please try again.", disable_web_page_preview=True)
+        return
+
+    async def _cb_use_current_cache(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the use_current_cache callback"""
+        await query.edit_message_text("Using current cached data...", disable_web_page_preview=True)
+
+        try:
+            # Create a fresh update but use existing context
+            new_update = Update(update.update_id, message=update.effective_message)
+            await self.today_command(new_update, context)
+        except Exception as e:
+            logger.error(f"Error displaying cached updates: {e}")
+            await query.edit_message_text("⚠️ Error displaying updates. Please try again.", disable_web_page_preview=True)
+        return
+
+    async def _cb_refresh_documents(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the refresh_documents callback"""
+        chat_id = update.effective_chat.id
+        # Improved refresh message with HTML formatting for consistency
+        await query.edit_message_text(
+            "🔄 <b>Refreshing documents...</b>\n\n"
+            "Checking for new presentations, financials, and loan agreements "
+            "across all companies. This may take a moment.",
+            disable_web_page_preview=True,
+            parse_mode='HTML'
+        )
+
+        try:
+            # Force document check
+            new_documents = await self.check_documents()
+
+            # Show count of new documents found
+            if new_documents:
+                await self.send_message(
+                    chat_id,
+                    f"✅ <b>Refresh completed</b>\n\n"
+                    f"Found {len(new_documents)} new document(s).",
+                    disable_web_page_preview=True
                 )
 
-                try:
-                    # Force document check
-                    new_documents = await self.check_documents()
-                    
-                    # Show count of new documents found
-                    if new_documents:
-                        await self.send_message(
-                            chat_id,
-                            f"✅ <b>Refresh completed</b>\n\n"
-                            f"Found {len(new_documents)} new document(s).",
-                            disable_web_page_preview=True
-                        )
-                    
-                    # Run documents command again to display updated list
-                    await self.documents_command(update, context)
-                except Exception as e:
-                    logger.error(f"Error during document refresh from callback: {e}", exc_info=True)
-                    await query.edit_message_text(
-                        "⚠️ <b>Error refreshing documents</b>\n\n"
-                        "An error occurred while checking for new documents. "
-                        "Please try again later or contact the administrator.",
-                        disable_web_page_preview=True,
-                        parse_mode='HTML'
-                    )
-                return
-                
-            elif query.data == "admin_users":
-                # Check if user is admin
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
-                    return
-                    
-                users = self.user_manager.get_all_users()
-                if users:
-                    user_list = []
-                    for chat_id in users:
-                        username = self.user_manager.get_user_info(chat_id)
-                        if username:
-                            user_list.append(f"{chat_id} - {username}")
-                        else:
-                            user_list.append(f"{chat_id}")
-                    
-                    user_text = "👥 <b>Registered users:</b>\n\n" + "\n".join(user_list)
+            # Run documents command again to display updated list
+            await self.documents_command(update, context)
+        except Exception as e:
+            logger.error(f"Error during document refresh from callback: {e}", exc_info=True)
+            await query.edit_message_text(
+                "⚠️ <b>Error refreshing documents</b>\n\n"
+                "An error occurred while checking for new documents. "
+                "Please try again later or contact the administrator.",
+                disable_web_page_preview=True,
+                parse_mode='HTML'
+            )
+        return
+
+    async def _cb_admin_users(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the admin_users callback"""
+        # Check if user is admin
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
+            return
+
+        users = self.user_manager.get_all_users()
+        if users:
+            user_list = []
+            for chat_id in users:
+                username = self.user_manager.get_user_info(chat_id)
+                if username:
+                    user_list.append(f"{chat_id} - {username}")
                 else:
-                    user_text = "No users are currently registered."
-                
-                # Add back button
+                    user_list.append(f"{chat_id}")
+
+            user_text = "👥 <b>Registered users:</b>\n\n" + "\n".join(user_list)
+        else:
+            user_text = "No users are currently registered."
+
+        # Add back button
+        keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
+        reply_markup = InlineKeyboardMarkup(keyboard)
+
+        await query.edit_message_text(user_text, reply_markup=reply_markup, parse_mode='HTML')
+        return
+
+    async def _cb_admin_trigger_today(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle admin_trigger_today* callbacks"""
+        # Check if user is admin
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
+            return
+
+        # Check if there's a date parameter
+        parts = query.data.split("_")
+        target_date = None
+        if len(parts) >= 4:
+            # Format should be admin_trigger_today_YYYY-MM-DD
+            target_date = parts[3]
+
+        # First show date selection options if no date was specified
+        if query.data == "admin_trigger_today":
+            keyboard = [
+                [InlineKeyboardButton("Today's Updates", callback_data="admin_trigger_today_select")],
+                [InlineKeyboardButton("Specify Custom Date", callback_data="admin_trigger_today_date")]
+            ]
+            # Add back button
+            keyboard.append([InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")])
+
+            reply_markup = InlineKeyboardMarkup(keyboard)
+            await query.edit_message_text(
+                "📅 <b>Send Updates</b>\n\n"
+                "Select an option:",
+                reply_markup=reply_markup,
+                parse_mode='HTML'
+            )
+            return
+
+        # Handle custom date input request
+        elif query.data == "admin_trigger_today_date":
+            await query.edit_message_text(
+                "📅 <b>Enter Custom Date</b>\n\n"
+                "Please enter the date in YYYY-MM-DD format.\n"
+                "Example: 2025-04-19\n\n"
+                "Reply directly to this message with the date.",
+                parse_mode='HTML'
+            )
+            # The date input will be handled by a message handler
+            return
+
+        # Continue with user selection using either today's date or the specified date
+        elif query.data == "admin_trigger_today_select" or target_date:
+            # If "Today's Updates" was selected, set today's date
+            if query.data == "admin_trigger_today_select":
+                import time
+                target_date = time.strftime("%Y-%m-%d")
+
+            # Get all registered users
+            users = self.user_manager.get_all_users()
+
+            if not users:
+                # No users found
                 keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
                 reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await query.edit_message_text(user_text, reply_markup=reply_markup, parse_mode='HTML')
-                return
-                
-            elif query.data.startswith("admin_trigger_today"):
-                # Check if user is admin
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
-                    return
-                
-                # Check if there's a date parameter
-                parts = query.data.split("_")
-                target_date = None
-                if len(parts) >= 4:
-                    # Format should be admin_trigger_today_YYYY-MM-DD
-                    target_date = parts[3]
-                
-                # First show date selection options if no date was specified
-                if query.data == "admin_trigger_today":
-                    keyboard = [
-                        [InlineKeyboardButton("Today's Updates", callback_data="admin_trigger_today_select")],
-                        [InlineKeyboardButton("Specify Custom Date", callback_data="admin_trigger_today_date")]
-                    ]
-                    # Add back button
-                    keyboard.append([InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")])
-                    
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-                    await query.edit_message_text(
-                        "📅 <b>Send Updates</b>\n\n"
-                        "Select an option:",
-                        reply_markup=reply_markup,
-                        parse_mode='HTML'
-                    )
-                    return
-                
-                # Handle custom date input request
-                elif query.data == "admin_trigger_today_date":
-                    await query.edit_message_text(
-                        "📅 <b>Enter Custom Date</b>\n\n"
-                        "Please enter the date in YYYY-MM-DD format.\n"
-                        "Example: 2025-04-19\n\n"
-                        "Reply directly to this message with the date.",
-                        parse_mode='HTML'
-                    )
-                    # The date input will be handled by a message handler
-                    return
-                
-                # Continue with user selection using either today's date or the specified date
-                elif query.data == "admin_trigger_today_select" or target_date:
-                    # If "Today's Updates" was selected, set today's date
-                    if query.data == "admin_trigger_today_select":
-                        import time
-                        target_date = time.strftime("%Y-%m-%d")
-                    
-                    # Get all registered users
-                    users = self.user_manager.get_all_users()
-                    
-                    if not users:
-                        # No users found
-                        keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
-                        reply_markup = InlineKeyboardMarkup(keyboard)
-                        
-                        date_text = "Today's" if not target_date else f"{target_date}"
-                        await query.edit_message_text(
-                            f"🔄 <b>Send {date_text} Updates</b>\n\n"
-                            "No registered users found.",
-                            reply_markup=reply_markup,
-                            parse_mode='HTML'
-                        )
-                        return
-                    
-                    # Create buttons for each user
-                    keyboard = []
-                    for i, user_id in enumerate(users, 1):
-                        username = self.user_manager.get_user_info(user_id) or "Unknown"
-                        display_name = f"@{username}" if username != "Unknown" else f"User {user_id}"
-                        button_text = f"{i}. {display_name}"
-                        
-                        # Add date parameter to callback data if specified
-                        if target_date:
-                            callback_data = f"trigger_today_{user_id}_{target_date}"
-                        else:
-                            callback_data = f"trigger_today_{user_id}"
-                            
-                        keyboard.append([InlineKeyboardButton(button_text, callback_data=callback_data)])
-                    
-                    # Add predefined channel option
-                    if target_date:
-                        mintos_callback = f"trigger_today_-1002373856504_{target_date}"
-                    else:
-                        mintos_callback = "trigger_today_-1002373856504"
-                    keyboard.append([InlineKeyboardButton("📺 Mintos Unofficial News Channel", callback_data=mintos_callback)])
-                    
-                    # Add custom channel button
-                    if target_date:
-                        custom_callback = f"trigger_today_custom_{target_date}"
-                    else:
-                        custom_callback = "trigger_today_custom"
-                    keyboard.append([InlineKeyboardButton("✏️ Enter custom channel ID", callback_data=custom_callback)])
-                    
-                    # Add back button
-                    keyboard.append([InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")])
-                    
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-                    date_text = "today's" if not target_date else f"updates for {target_date}"
-                    await query.edit_message_text(
-                        f"🔄 <b>Send {date_text.capitalize()}</b>\n\n"
-                        f"Select a channel to send {date_text} to:",
-                        reply_markup=reply_markup,
-                        parse_mode='HTML'
-                    )
-                    return
-                
-            elif query.data == "admin_refresh_updates":
-                # Check if user is admin
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
-                    return
-                
-                # Edit message to show processing
-                await query.edit_message_text("🔄 Refreshing updates, please wait...", disable_web_page_preview=True)
-                
-                try:
-                    # Force update check regardless of hour
-                    await self._safe_update_check()
-                    
-                    # Add back button
-                    keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-                    
-                    # Get cache information
-                    cache_age_minutes = int(self.data_manager.get_cache_age() / 60) if not math.isinf(self.data_manager.get_cache_age()) else float('inf')
-                    
-                    # Format cache age for display
-                    if math.isinf(cache_age_minutes):
-                        cache_age_text = "Unknown"
-                    else:
-                        hours = cache_age_minutes // 60
-                        minutes = cache_age_minutes % 60
-                        if hours > 0:
-                            cache_age_text = f"{hours}h {minutes}m"
-                        else:
-                            cache_age_text = f"{minutes}m"
-                    
-                    # Get updates count
-                    updates = self.data_manager.load_previous_updates()
-                    update_count = len(updates) if updates else 0
-                    
-                    await query.edit_message_text(
-                        f"✅ <b>Update check completed successfully!</b>\n\n"
-                        f"📊 Total companies in cache: {update_count}\n"
-                        f"⏱️ Cache freshness: {cache_age_text}\n\n"
-                        f"<i>Updates are checked automatically on weekdays at 3-5 PM UTC.</i>",
-                        reply_markup=reply_markup,
-                        disable_web_page_preview=True,
-                        parse_mode='HTML'
-                    )
-                except Exception as e:
-                    logger.error(f"Error refreshing updates: {e}", exc_info=True)
-                    # Add back button
-                    keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-                    
-                    await query.edit_message_text(
-                        f"⚠️ <b>Error refreshing updates</b>\n\n"
-                        f"{str(e)}\n\n"
-                        f"<i>Please check the logs for more information.</i>",
-                        reply_markup=reply_markup,
-                        disable_web_page_preview=True,
-                        parse_mode='HTML'
-                    )
-                return
-                
-            elif query.data == "admin_refresh_documents":
-                # Check if user is admin
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
-                    return
-                
-                # Edit message to show processing
-                await query.edit_message_text("🔄 Refreshing documents, please wait...", disable_web_page_preview=True)
-                
-                # Perform document check
-                try:
-                    await self.check_documents()
-                    # Add back button
-                    keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-                    
-                    # Get documents count information
-                    previous_documents = self.document_scraper.load_previous_documents()
-                    doc_count = len(previous_documents)
-                    
-                    await query.edit_message_text(
-                        f"✅ Document check completed successfully!\n\n"
-                        f"📃 Total documents in cache: {doc_count}\n\n"
-                        f"Documents are checked once daily by default.",
-                        reply_markup=reply_markup,
-                        disable_web_page_preview=True
-                    )
-                except Exception as e:
-                    logger.error(f"Error refreshing documents: {e}", exc_info=True)
-                    # Add back button
-                    keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-                    
-                    await query.edit_message_text(
-                        f"⚠️ Error refreshing documents: {str(e)}\n\n"
-                        f"Please check the logs for more information.",
-                        reply_markup=reply_markup,
-                        disable_web_page_preview=True
-                    )
-                return
-                
-            elif query.data == "trigger_today_custom":
-                # Check if user is admin
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
-                    return
-                
-                # Show instructions for custom channel ID entry
+
+                date_text = "Today's" if not target_date else f"{target_date}"
                 await query.edit_message_text(
-                    "Please enter a custom channel ID using the command:\n\n"
-                    "<code>/trigger_today [channel_id]</code>\n\n"
-                    "For example:\n"
-                    "<code>/trigger_today 114691530</code> - for a user\n"
-                    "<code>/trigger_today -1001234567890</code> - for a channel",
-                    parse_mode='HTML',
-                    disable_web_page_preview=True
+                    f"🔄 <b>Send {date_text} Updates</b>\n\n"
+                    "No registered users found.",
+                    reply_markup=reply_markup,
+                    parse_mode='HTML'
                 )
                 return
-                
-            elif query.data.startswith("trigger_today_"):
-                # Extract data from callback
-                callback_parts = query.data.split("_")
-                
-                # Check if it's the custom input callback
-                if len(callback_parts) >= 3 and callback_parts[2] == "custom":
-                    # Handle the custom channel ID entry request
-                    # Check if there's a date parameter
-                    target_date = None
-                    if len(callback_parts) >= 4:
-                        target_date = callback_parts[3]
-                        date_text = f" for date {target_date}"
-                    else:
-                        date_text = ""
-                        
-                    await query.edit_message_text(
-                        f"📝 Please enter the channel ID to send updates{date_text} to.\n\n"
-                        "Format: -100xxxxxxxxxx\n"
-                        "Example: -1001234567890\n\n"
-                        "Reply directly to this message with the channel ID.",
-                        disable_web_page_preview=True
-                    )
-                    # The actual sending will be handled in a message handler
-                    return
-                
-                # Regular channel selection from the list
-                target_channel = callback_parts[2]
-                chat_id = update.effective_chat.id
-                
-                # Check for a date parameter in the callback data
-                target_date = None
-                if len(callback_parts) >= 4:
-                    # The format is trigger_today_channelid_date
-                    target_date = callback_parts[3]
-                
-                # Check if user is admin
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
-                    return
-                
-                # Create appropriate message based on whether we're checking today or a specific date
-                date_text = ""
+
+            # Create buttons for each user
+            keyboard = []
+            for i, user_id in enumerate(users, 1):
+                username = self.user_manager.get_user_info(user_id) or "Unknown"
+                display_name = f"@{username}" if username != "Unknown" else f"User {user_id}"
+                button_text = f"{i}. {display_name}"
+
+                # Add date parameter to callback data if specified
                 if target_date:
-                    date_text = f" for {target_date}"
-                
-                # Edit message to show processing
-                await query.edit_message_text(f"🔄 Processing updates{date_text}, please wait...", disable_web_page_preview=True)
-                
-                # Send updates to the selected channel
-                await self._send_today_updates_to_channel(chat_id, target_channel, target_date)
-                return
-                
-            elif query.data == "admin_send_rss":
-                # Check if user is admin
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
-                    return
-                
-                # Show RSS feed selection first
-                await self._show_rss_feed_selection(query)
-                return
-                
-            elif query.data == "admin_exit":
-                # Close the admin panel
-                await query.edit_message_text("✅ Admin panel closed.", disable_web_page_preview=True)
-                return
-                
-            elif query.data == "admin_back":
-                # Check if user is admin
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
-                    return
-                    
-                # Return to admin panel
-                keyboard = [
-                    [InlineKeyboardButton("👥 View Users", callback_data="admin_users")],
-                    [InlineKeyboardButton("🔄 Refresh Updates", callback_data="admin_refresh_updates")],
-                    [InlineKeyboardButton("📄 Refresh Documents", callback_data="admin_refresh_documents")],
-                    [InlineKeyboardButton("📤 Send Updates", callback_data="admin_trigger_today")],
-                    [InlineKeyboardButton("📰 Send RSS Items", callback_data="admin_send_rss")],
-                    [InlineKeyboardButton("❌ Exit", callback_data="admin_exit")]
-                ]
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                await query.edit_message_text(
-                    "🔐 <b>Admin Control Panel</b>\n\nPlease select an admin function:",
-                    reply_markup=reply_markup,
-                    parse_mode='HTML',
-                    disable_web_page_preview=True
-                )
-                return
+                    callback_data = f"trigger_today_{user_id}_{target_date}"
+                else:
+                    callback_data = f"trigger_today_{user_id}"
 
-            elif query.data.startswith("rss_toggle_"):
-                # Legacy support - enable/disable all feeds
-                chat_id = query.data.split("_")[2]
-                current_preference = self.user_manager.get_rss_preference(chat_id)
-                new_preference = not current_preference
-                self.user_manager.set_rss_preference(chat_id, new_preference)
-                
-                status = "enabled" if new_preference else "disabled"
-                await query.edit_message_text(
-                    f"✅ <b>RSS Notifications {status.title()}</b>\n\n"
-                    f"All RSS feed notifications are now <b>{status}</b>.",
-                    parse_mode='HTML',
-                    disable_web_page_preview=True
-                )
-                return
-            
-            elif query.data.startswith("notify_"):
-                # Handle notification preference toggles
-                parts = query.data.split("_", 2)  # notify_type_value
-                notification_type = parts[1]
-                new_value = parts[2] == "True"
-                
-                chat_id = query.message.chat_id
-                self.user_manager.set_notification_preference(chat_id, notification_type, new_value)
-                
-                # Get updated preferences to refresh the interface
-                preferences = self.user_manager.get_user_notification_preferences(chat_id)
-                
-                # Create status indicators
-                campaigns_status = "✅" if preferences.get('campaigns', True) else "❌"
-                recovery_status = "✅" if preferences.get('recovery_updates', True) else "❌"
-                documents_status = "✅" if preferences.get('documents', True) else "❌"
-                
-                # Create updated keyboard
-                keyboard = [
-                    [InlineKeyboardButton(
-                        f"{campaigns_status} Campaigns",
-                        callback_data=f"notify_campaigns_{not preferences.get('campaigns', True)}"
-                    )],
-                    [InlineKeyboardButton(
-                        f"{recovery_status} Recovery Updates", 
-                        callback_data=f"notify_recovery_updates_{not preferences.get('recovery_updates', True)}"
-                    )],
-                    [InlineKeyboardButton(
-                        f"{documents_status} Documents",
-                        callback_data=f"notify_documents_{not preferences.get('documents', True)}"
-                    )],
-                    [InlineKeyboardButton("❌ Close", callback_data="cancel")]
-                ]
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                # Map notification types to friendly names
-                type_names = {
-                    'campaigns': 'Campaigns',
-                    'recovery_updates': 'Recovery Updates',
-                    'documents': 'Documents'
-                }
-                
-                type_name = type_names.get(notification_type, notification_type)
-                status = "enabled" if new_value else "disabled"
-                
-                message = (
-                    "🔔 <b>Notification Settings</b>\n\n"
-                    "Manage which types of notifications you receive:\n\n"
-                    f"{campaigns_status} <b>Campaigns:</b> New Mintos campaigns and bonuses\n"
-                    f"{recovery_status} <b>Recovery Updates:</b> Company recovery status changes\n"
-                    f"{documents_status} <b>Documents:</b> New company documents\n\n"
-                    "Click the buttons below to toggle notifications on/off:"
-                )
-                
-                await query.edit_message_text(
-                    message,
-                    reply_markup=reply_markup,
-                    parse_mode='HTML',
-                    disable_web_page_preview=True
-                )
-                return
+                keyboard.append([InlineKeyboardButton(button_text, callback_data=callback_data)])
 
-            elif query.data.startswith("toggle_news_"):
-                # Handle OpenAI news toggle
-                chat_id = update.effective_chat.id
-                enable_news = query.data.split("_")[-1] == "true"
-                
-                # OpenAI news doesn't need user preferences - always available
-                
-                status_text = "enabled" if enable_news else "disabled"
-                status_icon = "✅" if enable_news else "❌"
-                
-                if enable_news:
-                    keyboard = [
-                        [InlineKeyboardButton("📰 Enter Days Range", callback_data="news_enter_days")],
-                        [InlineKeyboardButton("📅 Last 1 Day", callback_data="fetch_news_days_1")],
-                        [InlineKeyboardButton("📊 Last 7 Days", callback_data="fetch_news_days_7")],
-                        [InlineKeyboardButton("📈 Last 30 Days", callback_data="fetch_news_days_30")],
-                        [InlineKeyboardButton("📤 Send to User/Channel", callback_data="news_send_options")],
-                        [InlineKeyboardButton("🔄 Reset News Tracking", callback_data="news_reset_tracking")],
-                        [InlineKeyboardButton("❌ Disable News", callback_data="toggle_news_false")],
-                        [InlineKeyboardButton("❌ Close", callback_data="cancel")]
-                    ]
-                else:
-                    keyboard = [
-                        [InlineKeyboardButton("✅ Enable News", callback_data="toggle_news_true")],
-                        [InlineKeyboardButton("❌ Close", callback_data="cancel")]
-                    ]
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                message = f"🗞️ <b>Perplexity Company News</b>\n\n"
-                message += f"{status_icon} <b>Status:</b> {status_text.capitalize()}\n\n"
-                
-                if enable_news:
-                    message += "📰 <b>Available Actions:</b>\n"
-                    message += "• Get latest news for all companies\n"
-                    message += "• Filter news by date range\n"
-                    message += "• Manage notification preferences\n\n"
-                    message += "Company news is fetched from Perplexity AI and includes:\n"
-                    message += "• Financial updates\n"
-                    message += "• Business developments\n"
-                    message += "• Regulatory announcements\n"
-                    message += "• Corporate news\n\n"
-                    message += "Select an option below:"
-                else:
-                    message += "Enable OpenAI news to receive company updates from AI-powered search.\n\n"
-                    message += "Features:\n"
-                    message += "• Real-time company news\n"
-                    message += "• Financial updates\n"
-                    message += "• Regulatory announcements\n"
-                    message += "• Customizable date filters"
-                
-                await query.edit_message_text(
-                    message,
-                    reply_markup=reply_markup,
-                    parse_mode='HTML',
-                    disable_web_page_preview=True
-                )
-                return
+            # Add predefined channel option
+            if target_date:
+                mintos_callback = f"trigger_today_-1002373856504_{target_date}"
+            else:
+                mintos_callback = "trigger_today_-1002373856504"
+            keyboard.append([InlineKeyboardButton("📺 Mintos Unofficial News Channel", callback_data=mintos_callback)])
 
-            elif query.data.startswith("fetch_news_") and not query.data.startswith("fetch_news_days_"):
-                # Handle legacy OpenAI news fetching (redirect to new method)
-                chat_id = update.effective_chat.id
-                
-                # Check if user has news enabled
-                if not self.openai_news.get_user_preference(str(chat_id)):
-                    await query.edit_message_text(
-                        "❌ OpenAI news is disabled. Please enable it first using /news command.",
-                        disable_web_page_preview=True
-                    )
-                    return
-                
-                date_param = query.data.split("_")[-1]
-                
-                # Convert old format to days for new method
-                if date_param == "today":
-                    days = 1
-                elif date_param == "week":
-                    days = 7
-                elif date_param == "latest":
-                    days = 7  # Default to 7 days for "latest"
+            # Add custom channel button
+            if target_date:
+                custom_callback = f"trigger_today_custom_{target_date}"
+            else:
+                custom_callback = "trigger_today_custom"
+            keyboard.append([InlineKeyboardButton("✏️ Enter custom channel ID", callback_data=custom_callback)])
+
+            # Add back button
+            keyboard.append([InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")])
+
+            reply_markup = InlineKeyboardMarkup(keyboard)
+            date_text = "today's" if not target_date else f"updates for {target_date}"
+            await query.edit_message_text(
+                f"🔄 <b>Send {date_text.capitalize()}</b>\n\n"
+                f"Select a channel to send {date_text} to:",
+                reply_markup=reply_markup,
+                parse_mode='HTML'
+            )
+            return
+
+    async def _cb_admin_refresh_updates(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the admin_refresh_updates callback"""
+        # Check if user is admin
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
+            return
+
+        # Edit message to show processing
+        await query.edit_message_text("🔄 Refreshing updates, please wait...", disable_web_page_preview=True)
+
+        try:
+            # Force update check regardless of hour
+            await self._safe_update_check()
+
+            # Add back button
+            keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
+            reply_markup = InlineKeyboardMarkup(keyboard)
+
+            # Get cache information
+            cache_age_minutes = int(self.data_manager.get_cache_age() / 60) if not math.isinf(self.data_manager.get_cache_age()) else float('inf')
+
+            # Format cache age for display
+            if math.isinf(cache_age_minutes):
+                cache_age_text = "Unknown"
+            else:
+                hours = cache_age_minutes // 60
+                minutes = cache_age_minutes % 60
+                if hours > 0:
+                    cache_age_text = f"{hours}h {minutes}m"
                 else:
-                    # If it's a number, use it as days
-                    try:
-                        days = int(date_param)
-                        if days < 1 or days > 365:
-                            days = 7  # Default fallback
-                    except ValueError:
-                        days = 7  # Default fallback
-                
-                # Show processing message
+                    cache_age_text = f"{minutes}m"
+
+            # Get updates count
+            update_count = len(self.data_manager.update_index.lenders)
+
+            await query.edit_message_text(
+                f"✅ <b>Update check completed successfully!</b>\n\n"
+                f"📊 Total companies in cache: {update_count}\n"
+                f"⏱️ Cache freshness: {cache_age_text}\n\n"
+                f"<i>Updates are checked automatically on weekdays at 3-5 PM UTC.</i>",
+                reply_markup=reply_markup,
+                disable_web_page_preview=True,
+                parse_mode='HTML'
+            )
+        except Exception as e:
+            logger.error(f"Error refreshing updates: {e}", exc_info=True)
+            # Add back button
+            keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
+            reply_markup = InlineKeyboardMarkup(keyboard)
+
+            await query.edit_message_text(
+                f"⚠️ <b>Error refreshing updates</b>\n\n"
+                f"{str(e)}\n\n"
+                f"<i>Please check the logs for more information.</i>",
+                reply_markup=reply_markup,
+                disable_web_page_preview=True,
+                parse_mode='HTML'
+            )
+        return
+
+    async def _cb_admin_refresh_documents(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the admin_refresh_documents callback"""
+        # Check if user is admin
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
+            return
+
+        # Edit message to show processing
+        await query.edit_message_text("🔄 Refreshing documents, please wait...", disable_web_page_preview=True)
+
+        # Perform document check
+        try:
+            await self.check_documents()
+            # Add back button
+            keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
+            reply_markup = InlineKeyboardMarkup(keyboard)
+
+            # Get documents count information
+            previous_documents = self.document_scraper.load_previous_documents()
+            doc_count = len(previous_documents)
+
+            await query.edit_message_text(
+                f"✅ Document check completed successfully!\n\n"
+                f"📃 Total documents in cache: {doc_count}\n\n"
+                f"Documents are checked once daily by default.",
+                reply_markup=reply_markup,
+                disable_web_page_preview=True
+            )
+        except Exception as e:
+            logger.error(f"Error refreshing documents: {e}", exc_info=True)
+            # Add back button
+            keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
+            reply_markup = InlineKeyboardMarkup(keyboard)
+
+            await query.edit_message_text(
+                f"⚠️ Error refreshing documents: {str(e)}\n\n"
+                f"Please check the logs for more information.",
+                reply_markup=reply_markup,
+                disable_web_page_preview=True
+            )
+        return
+
+    async def _cb_trigger_today_custom(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the trigger_today_custom callback"""
+        # Check if user is admin
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
+            return
+
+        # Show instructions for custom channel ID entry
+        await query.edit_message_text(
+            "Please enter a custom channel ID using the command:\n\n"
+            "<code>/trigger_today [channel_id]</code>\n\n"
+            "For example:\n"
+            "<code>/trigger_today 114691530</code> - for a user\n"
+            "<code>/trigger_today -1001234567890</code> - for a channel",
+            parse_mode='HTML',
+            disable_web_page_preview=True
+        )
+        return
+
+    async def _cb_trigger_today(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle trigger_today_* callbacks"""
+        # Extract data from callback
+        callback_parts = query.data.split("_")
+
+        # Check if it's the custom input callback
+        if len(callback_parts) >= 3 and callback_parts[2] == "custom":
+            # Handle the custom channel ID entry request
+            # Check if there's a date parameter
+            target_date = None
+            if len(callback_parts) >= 4:
+                target_date = callback_parts[3]
+                date_text = f" for date {target_date}"
+            else:
+                date_text = ""
+
+            await query.edit_message_text(
+                f"📝 Please enter the channel ID to send updates{date_text} to.\n\n"
+                "Format: -100xxxxxxxxxx\n"
+                "Example: -1001234567890\n\n"
+                "Reply directly to this message with the channel ID.",
+                disable_web_page_preview=True
+            )
+            # The actual sending will be handled in a message handler
+            return
+
+        # Regular channel selection from the list
+        target_channel = callback_parts[2]
+        chat_id = update.effective_chat.id
+
+        # Check for a date parameter in the callback data
+        target_date = None
+        if len(callback_parts) >= 4:
+            # The format is trigger_today_channelid_date
+            target_date = callback_parts[3]
+
+        # Check if user is admin
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
+            return
+
+        # Create appropriate message based on whether we're checking today or a specific date
+        date_text = ""
+        if target_date:
+            date_text = f" for {target_date}"
+
+        # Edit message to show processing
+        await query.edit_message_text(f"🔄 Processing updates{date_text}, please wait...", disable_web_page_preview=True)
+
+        # Send updates to the selected channel
+        await self._send_today_updates_to_channel(chat_id, target_channel, target_date)
+        return
+
+    async def _cb_admin_send_rss(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the admin_send_rss callback"""
+        # Check if user is admin
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
+            return
+
+        # Show RSS feed selection first
+        await self._show_rss_feed_selection(query)
+        return
+
+    async def _cb_admin_exit(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the admin_exit callback"""
+        # Close the admin panel
+        await query.edit_message_text("✅ Admin panel closed.", disable_web_page_preview=True)
+        return
+
+    async def _cb_admin_back(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the admin_back callback"""
+        # Check if user is admin
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.", disable_web_page_preview=True)
+            return
+
+        # Return to admin panel
+        keyboard = [
+            [InlineKeyboardButton("👥 View Users", callback_data="admin_users")],
+            [InlineKeyboardButton("🔄 Refresh Updates", callback_data="admin_refresh_updates")],
+            [InlineKeyboardButton("📄 Refresh Documents", callback_data="admin_refresh_documents")],
+            [InlineKeyboardButton("📤 Send Updates", callback_data="admin_trigger_today")],
+            [InlineKeyboardButton("📰 Send RSS Items", callback_data="admin_send_rss")],
+            [InlineKeyboardButton("❌ Exit", callback_data="admin_exit")]
+        ]
+
+        reply_markup = InlineKeyboardMarkup(keyboard)
+        await query.edit_message_text(
+            "🔐 <b>Admin Control Panel</b>\n\nPlease select an admin function:",
+            reply_markup=reply_markup,
+            parse_mode='HTML',
+            disable_web_page_preview=True
+        )
+        return
+
+    async def _cb_rss_toggle(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle rss_toggle_* callbacks"""
+        # Legacy support - enable/disable all feeds
+        chat_id = query.data.split("_")[2]
+        current_preference = self.user_manager.get_rss_preference(chat_id)
+        new_preference = not current_preference
+        self.user_manager.set_rss_preference(chat_id, new_preference)
+
+        status = "enabled" if new_preference else "disabled"
+        await query.edit_message_text(
+            f"✅ <b>RSS Notifications {status.title()}</b>\n\n"
+            f"All RSS feed notifications are now <b>{status}</b>.",
+            parse_mode='HTML',
+            disable_web_page_preview=True
+        )
+        return
+
+    async def _cb_notify(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle notify_* callbacks"""
+        # Handle notification preference toggles
+        parts = query.data.split("_", 2)  # notify_type_value
+        notification_type = parts[1]
+        new_value = parts[2] == "True"
+
+        chat_id = query.message.chat_id
+        self.user_manager.set_notification_preference(chat_id, notification_type, new_value)
+
+        # Get updated preferences to refresh the interface
+        preferences = self.user_manager.get_user_notification_preferences(chat_id)
+
+        # Create status indicators
+        campaigns_status = "✅" if preferences.get('campaigns', True) else "❌"
+        recovery_status = "✅" if preferences.get('recovery_updates', True) else "❌"
+        documents_status = "✅" if preferences.get('documents', True) else "❌"
+
+        # Create updated keyboard
+        keyboard = [
+            [InlineKeyboardButton(
+                f"{campaigns_status} Campaigns",
+                callback_data=f"notify_campaigns_{not preferences.get('campaigns', True)}"
+            )],
+            [InlineKeyboardButton(
+                f"{recovery_status} Recovery Updates", 
+                callback_data=f"notify_recovery_updates_{not preferences.get('recovery_updates', True)}"
+            )],
+            [InlineKeyboardButton(
+                f"{documents_status} Documents",
+                callback_data=f"notify_documents_{not preferences.get('documents', True)}"
+            )],
+            [InlineKeyboardButton("❌ Close", callback_data="cancel")]
+        ]
+
+        reply_markup = InlineKeyboardMarkup(keyboard)
+
+        # Map notification types to friendly names
+        type_names = {
+            'campaigns': 'Campaigns',
+            'recovery_updates': 'Recovery Updates',
+            'documents': 'Documents'
+        }
+
+        type_name = type_names.get(notification_type, notification_type)
+        status = "enabled" if new_value else "disabled"
+
+        message = (
+            "🔔 <b>Notification Settings</b>\n\n"
+            "Manage which types of notifications you receive:\n\n"
+            f"{campaigns_status} <b>Campaigns:</b> New Mintos campaigns and bonuses\n"
+            f"{recovery_status} <b>Recovery Updates:</b> Company recovery status changes\n"
+            f"{documents_status} <b>Documents:</b> New company documents\n\n"
+            "Click the buttons below to toggle notifications on/off:"
+        )
+
+        await query.edit_message_text(
+            message,
+            reply_markup=reply_markup,
+            parse_mode='HTML',
+            disable_web_page_preview=True
+        )
+        return
+
+    async def _cb_toggle_news(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle toggle_news_* callbacks"""
+        # Handle OpenAI news toggle
+        enable_news = query.data.split("_")[-1] == "true"
+
+        # OpenAI news doesn't need user preferences - always available
+
+        status_text = "enabled" if enable_news else "disabled"
+        status_icon = "✅" if enable_news else "❌"
+
+        if enable_news:
+            keyboard = [
+                [InlineKeyboardButton("📰 Enter Days Range", callback_data="news_enter_days")],
+                [InlineKeyboardButton("📅 Last 1 Day", callback_data="fetch_news_days_1")],
+                [InlineKeyboardButton("📊 Last 7 Days", callback_data="fetch_news_days_7")],
+                [InlineKeyboardButton("📈 Last 30 Days", callback_data="fetch_news_days_30")],
+                [InlineKeyboardButton("📤 Send to User/Channel", callback_data="news_send_options")],
+                [InlineKeyboardButton("🔄 Reset News Tracking", callback_data="news_reset_tracking")],
+                [InlineKeyboardButton("❌ Disable News", callback_data="toggle_news_false")],
+                [InlineKeyboardButton("❌ Close", callback_data="cancel")]
+            ]
+        else:
+            keyboard = [
+                [InlineKeyboardButton("✅ Enable News", callback_data="toggle_news_true")],
+                [InlineKeyboardButton("❌ Close", callback_data="cancel")]
+            ]
+
+        reply_markup = InlineKeyboardMarkup(keyboard)
+
+        message = f"🗞️ <b>Perplexity Company News</b>\n\n"
+        message += f"{status_icon} <b>Status:</b> {status_text.capitalize()}\n\n"
+
+        if enable_news:
+            message += "📰 <b>Available Actions:</b>\n"
+            message += "• Get latest news for all companies\n"
+            message += "• Filter news by date range\n"
+            message += "• Manage notification preferences\n\n"
+            message += "Company news is fetched from Perplexity AI and includes:\n"
+            message += "• Financial updates\n"
+            message += "• Business developments\n"
+            message += "• Regulatory announcements\n"
+            message += "• Corporate news\n\n"
+            message += "Select an option below:"
+        else:
+            message += "Enable OpenAI news to receive company updates from AI-powered search.\n\n"
+            message += "Features:\n"
+            message += "• Real-time company news\n"
+            message += "• Financial updates\n"
+            message += "• Regulatory announcements\n"
+            message += "• Customizable date filters"
+
+        await query.edit_message_text(
+            message,
+            reply_markup=reply_markup,
+            parse_mode='HTML',
+            disable_web_page_preview=True
+        )
+        return
+
+    async def _cb_fetch_news(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle fetch_news_* callbacks"""
+        # Handle legacy OpenAI news fetching (redirect to new method)
+        chat_id = update.effective_chat.id
+
+        # Check if user has news enabled
+        if not self.openai_news.get_user_preference(str(chat_id)):
+            await query.edit_message_text(
+                "❌ OpenAI news is disabled. Please enable it first using /news command.",
+                disable_web_page_preview=True
+            )
+            return
+
+        date_param = query.data.split("_")[-1]
+
+        # Convert old format to days for new method
+        if date_param == "today":
+            days = 1
+        elif date_param == "week":
+            days = 7
+        elif date_param == "latest":
+            days = 7  # Default to 7 days for "latest"
+        else:
+            # If it's a number, use it as days
+            try:
+                days = int(date_param)
+                if days < 1 or days > 365:
+                    days = 7  # Default fallback
+            except ValueError:
+                days = 7  # Default fallback
+
+        # Show processing message
+        await query.edit_message_text(
+            f"🔄 Fetching company news from last {days} day{'s' if days > 1 else ''}...\n\n"
+            "This may take a few moments as we search for updates from all companies.",
+            disable_web_page_preview=True
+        )
+
+        try:
+            # Always perform fresh search
+            news_items = await self.openai_news.fetch_news_by_days(days, use_cache=False)
+
+            if not news_items:
                 await query.edit_message_text(
-                    f"🔄 Fetching company news from last {days} day{'s' if days > 1 else ''}...\n\n"
-                    "This may take a few moments as we search for updates from all companies.",
+                    "📰 No news items found for the specified criteria.",
                     disable_web_page_preview=True
                 )
-                
-                try:
-                    # Always perform fresh search
-                    news_items = await self.openai_news.fetch_news_by_days(days, use_cache=False)
-                    
-                    if not news_items:
-                        await query.edit_message_text(
-                            "📰 No news items found for the specified criteria.",
-                            disable_web_page_preview=True
-                        )
-                        return
-                    
-                    # Send completion message
-                    filter_text = f" (filtered from {date_filter})" if date_filter else ""
-                    await query.edit_message_text(
-                        f"✅ Found {len(news_items)} news items{filter_text}\n\nSending messages...",
-                        disable_web_page_preview=True
-                    )
-                    
-                    # Send each news item as a separate message
-                    sent_count = 0
-                    for item in news_items:
-                        # Check if already sent to this user
-                        if not self.openai_news.is_item_sent(str(chat_id), item.url):
-                            message = self.openai_news.format_news_message(item)
-                            await self.send_message(chat_id, message, disable_web_page_preview=True)
-                            self.openai_news.mark_item_sent(str(chat_id), item.url)
-                            sent_count += 1
-                            
-                            # Small delay between messages
-                            await asyncio.sleep(0.5)
-                    
-                    # Send summary
-                    if sent_count > 0:
-                        summary_msg = f"📰 Sent {sent_count} new news items"
-                        if sent_count < len(news_items):
-                            summary_msg += f" ({len(news_items) - sent_count} were already sent)"
-                    else:
-                        summary_msg = "📰 All news items were already sent to you"
-                    
-                    await self.send_message(chat_id, summary_msg, disable_web_page_preview=True)
-                    
-                except Exception as e:
-                    logger.error(f"Error fetching OpenAI news: {e}")
-                    await query.edit_message_text(
-                        "❌ Error fetching news. Please try again later.",
-                        disable_web_page_preview=True
-                    )
                 return
 
-            elif query.data == "news_settings":
-                # Show news settings
-                chat_id = update.effective_chat.id
-                keyboard = [
-                    [InlineKeyboardButton("📊 View Companies", callback_data="news_view_companies")],
-                    [InlineKeyboardButton("🔄 Clear Sent History", callback_data="news_clear_history")],
-                    [InlineKeyboardButton("❌ Disable News", callback_data="toggle_news_false")],
-                    [InlineKeyboardButton("« Back", callback_data="toggle_news_true")]
-                ]
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                companies_count = len(self.openai_news.companies)
-                
+            # Send completion message
+            filter_text = f" (filtered from {date_filter})" if date_filter else ""
+            await query.edit_message_text(
+                f"✅ Found {len(news_items)} news items{filter_text}\n\nSending messages...",
+                disable_web_page_preview=True
+            )
+
+            # Send each news item as a separate message
+            sent_count = 0
+            for item in news_items:
+                # Check if already sent to this user
+                if not self.openai_news.is_item_sent(str(chat_id), item.url):
+                    message = self.openai_news.format_news_message(item)
+                    await self.send_message(chat_id, message, disable_web_page_preview=True)
+                    self.openai_news.mark_item_sent(str(chat_id), item.url)
+                    sent_count += 1
+
+                    # Small delay between messages
+                    await asyncio.sleep(0.5)
+
+            # Send summary
+            if sent_count > 0:
+                summary_msg = f"📰 Sent {sent_count} new news items"
+                if sent_count < len(news_items):
+                    summary_msg += f" ({len(news_items) - sent_count} were already sent)"
+            else:
+                summary_msg = "📰 All news items were already sent to you"
+
+            await self.send_message(chat_id, summary_msg, disable_web_page_preview=True)
+
+        except Exception as e:
+            logger.error(f"Error fetching OpenAI news: {e}")
+            await query.edit_message_text(
+                "❌ Error fetching news. Please try again later.",
+                disable_web_page_preview=True
+            )
+        return
+
+    async def _cb_news_settings(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the news_settings callback"""
+        # Show news settings
+        keyboard = [
+            [InlineKeyboardButton("📊 View Companies", callback_data="news_view_companies")],
+            [InlineKeyboardButton("🔄 Clear Sent History", callback_data="news_clear_history")],
+            [InlineKeyboardButton("❌ Disable News", callback_data="toggle_news_false")],
+            [InlineKeyboardButton("« Back", callback_data="toggle_news_true")]
+        ]
+
+        reply_markup = InlineKeyboardMarkup(keyboard)
+        companies_count = len(self.openai_news.companies)
+
+        await query.edit_message_text(
+            f"🔧 <b>Perplexity News Settings</b>\n\n"
+            f"📊 <b>Companies monitored:</b> {companies_count}\n"
+            f"🔍 <b>Search model:</b> Sonar (Perplexity AI)\n"
+            f"📰 <b>News sources:</b> Multiple financial and business news sites\n\n"
+            f"<b>Settings:</b>",
+            reply_markup=reply_markup,
+            parse_mode='HTML',
+            disable_web_page_preview=True
+        )
+        return
+
+    async def _cb_news_view_companies(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the news_view_companies callback"""
+        # Show list of companies being monitored
+        companies_list = "\n".join([
+            f"• {company['company_name']}"
+            for company in self.openai_news.companies[:10]  # Show first 10
+        ])
+
+        if len(self.openai_news.companies) > 10:
+            companies_list += f"\n... and {len(self.openai_news.companies) - 10} more"
+
+        keyboard = [
+            [InlineKeyboardButton("« Back to Settings", callback_data="news_settings")]
+        ]
+        reply_markup = InlineKeyboardMarkup(keyboard)
+
+        await query.edit_message_text(
+            f"📊 <b>Monitored Companies</b>\n\n"
+            f"{companies_list}\n\n"
+            f"Total: {len(self.openai_news.companies)} companies",
+            reply_markup=reply_markup,
+            parse_mode='HTML',
+            disable_web_page_preview=True
+        )
+        return
+
+    async def _cb_news_clear_history(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the news_clear_history callback"""
+        # Clear sent news history for this user
+        chat_id = update.effective_chat.id
+        if str(chat_id) in self.openai_news.sent_items:
+            del self.openai_news.sent_items[str(chat_id)]
+            self.openai_news._save_sent_items()
+
+        keyboard = [
+            [InlineKeyboardButton("« Back to Settings", callback_data="news_settings")]
+        ]
+        reply_markup = InlineKeyboardMarkup(keyboard)
+
+        await query.edit_message_text(
+            "✅ <b>Sent history cleared</b>\n\n"
+            "You will now receive all news items again, including previously sent ones.",
+            reply_markup=reply_markup,
+            parse_mode='HTML',
+            disable_web_page_preview=True
+        )
+        return
+
+    async def _cb_fetch_news_days(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle fetch_news_days_* callbacks"""
+        # Handle day-based news fetching
+        chat_id = update.effective_chat.id
+
+        # Check if user has news enabled
+        if not self.openai_news.get_user_preference(str(chat_id)):
+            await query.edit_message_text(
+                "❌ OpenAI news is disabled. Please enable it first using /news command.",
+                disable_web_page_preview=True
+            )
+            return
+
+        days = int(query.data.split("_")[-1])
+
+        # Show processing message
+        await query.edit_message_text(
+            f"🔄 Fetching company news from last {days} day{'s' if days > 1 else ''}...\n\n"
+            "This may take a few moments as we search for updates from all companies.",
+            disable_web_page_preview=True
+        )
+
+        try:
+            # Fetch news using the new cached method
+            news_items = await self.openai_news.fetch_news_by_days(days, use_cache=True)
+
+            if not news_items:
                 await query.edit_message_text(
-                    f"🔧 <b>Perplexity News Settings</b>\n\n"
-                    f"📊 <b>Companies monitored:</b> {companies_count}\n"
-                    f"🔍 <b>Search model:</b> Sonar (Perplexity AI)\n"
-                    f"📰 <b>News sources:</b> Multiple financial and business news sites\n\n"
-                    f"<b>Settings:</b>",
-                    reply_markup=reply_markup,
-                    parse_mode='HTML',
+                    f"📰 No news items found for the last {days} day{'s' if days > 1 else ''}.\n\n"
+                    "Try adjusting the date range or check back later.",
                     disable_web_page_preview=True
                 )
                 return
 
-            elif query.data == "news_view_companies":
-                # Show list of companies being monitored
-                companies_list = "\n".join([
-                    f"• {company['company_name']}"
-                    for company in self.openai_news.companies[:10]  # Show first 10
-                ])
-                
-                if len(self.openai_news.companies) > 10:
-                    companies_list += f"\n... and {len(self.openai_news.companies) - 10} more"
-                
-                keyboard = [
-                    [InlineKeyboardButton("« Back to Settings", callback_data="news_settings")]
-                ]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await query.edit_message_text(
-                    f"📊 <b>Monitored Companies</b>\n\n"
-                    f"{companies_list}\n\n"
-                    f"Total: {len(self.openai_news.companies)} companies",
-                    reply_markup=reply_markup,
-                    parse_mode='HTML',
-                    disable_web_page_preview=True
-                )
+            # Send completion message first
+            await query.edit_message_text(
+                f"✅ Found {len(news_items)} news items from last {days} day{'s' if days > 1 else ''}\n\n"
+                "Sending messages...",
+                disable_web_page_preview=True
+            )
+
+            # Send news items
+            sent_count = 0
+            for item in news_items:
+                # Check if item was already sent to this user
+                if not self.openai_news.is_item_sent(str(chat_id), item.url):
+                    message = self.openai_news.format_news_message(item)
+                    await self.send_message(chat_id, message, parse_mode='HTML', disable_web_page_preview=True)
+                    self.openai_news.mark_item_sent(str(chat_id), item.url)
+                    sent_count += 1
+
+                    # Small delay between messages
+                    await asyncio.sleep(0.5)
+
+            # Send summary
+            if sent_count > 0:
+                summary_msg = f"📰 Sent {sent_count} new news items from last {days} day{'s' if days > 1 else ''}"
+                if sent_count < len(news_items):
+                    summary_msg += f" ({len(news_items) - sent_count} were already sent)"
+            else:
+                summary_msg = f"📰 All news items from last {days} day{'s' if days > 1 else ''} were already sent to you"
+
+            await self.send_message(chat_id, summary_msg, disable_web_page_preview=True)
+
+        except Exception as e:
+            logger.error(f"Error fetching OpenAI news: {e}")
+            await query.edit_message_text(
+                "❌ Error fetching news. Please try again later.",
+                disable_web_page_preview=True
+            )
+        return
+
+    async def _cb_news_enter_days(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the news_enter_days callback"""
+        # Handle custom days input
+        await query.edit_message_text(
+            "📰 <b>Enter Days Range</b>\n\n"
+            "Please reply with the number of days to look back (1-365).\n\n"
+            "For example:\n• Type '7' for last 7 days\n• Type '30' for last 30 days\n• Type '90' for last 3 months",
+            parse_mode='HTML',
+            disable_web_page_preview=True
+        )
+        # Set a flag to handle the next text message as days input
+        self.user_manager.set_user_state(str(update.effective_chat.id), 'awaiting_news_days')
+        return
+
+    async def _cb_news_send_options(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the news_send_options callback"""
+        # Show options to send news to specific users or channels
+        keyboard = [
+            [InlineKeyboardButton("👥 Send to All Users", callback_data="news_send_setup_all")],
+            [InlineKeyboardButton("👤 Send to Specific User", callback_data="news_send_setup_user")],
+            [InlineKeyboardButton("📢 Send to Channel", callback_data="news_send_setup_channel")],
+            [InlineKeyboardButton("« Back to News Menu", callback_data="toggle_news_true")]
+        ]
+
+        reply_markup = InlineKeyboardMarkup(keyboard)
+        await query.edit_message_text(
+            "📤 <b>Send News Options</b>\n\n"
+            "Choose where to send the latest news:",
+            reply_markup=reply_markup,
+            parse_mode='HTML',
+            disable_web_page_preview=True
+        )
+        return
+
+    async def _cb_news_send_setup(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the news_send_setup_all, news_send_setup_user, news_send_setup_channel callbacks"""
+        # Show time period and resend options before sending
+        send_type = query.data.replace("news_send_setup_", "")
+
+        # Store the send type in user context for later use (persistent)
+        self.user_manager.set_user_context(str(update.effective_chat.id), 'news_send_type', send_type)
+
+        keyboard = [
+            [InlineKeyboardButton("📅 Time Period Selection", callback_data="news_send_period_setup")],
+            [InlineKeyboardButton("🔄 Include Previously Sent", callback_data="news_send_resend_setup")],
+            [InlineKeyboardButton("« Back to Send Options", callback_data="news_send_options")]
+        ]
+
+        reply_markup = InlineKeyboardMarkup(keyboard)
+        target_desc = {
+            "all": "All Users",
+            "user": "Specific User", 
+            "channel": "Channel"
+        }[send_type]
+
+        await query.edit_message_text(
+            f"📤 <b>Send News Setup - {target_desc}</b>\n\n"
+            "Configure sending options:",
+            reply_markup=reply_markup,
+            parse_mode='HTML',
+            disable_web_page_preview=True
+        )
+        return
+
+    async def _cb_news_send_period_setup(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the news_send_period_setup callback"""
+        # Show time period selection options
+        keyboard = [
+            [InlineKeyboardButton("📅 Last 1 Day", callback_data="news_send_period_1")],
+            [InlineKeyboardButton("📊 Last 7 Days", callback_data="news_send_period_7")],
+            [InlineKeyboardButton("📈 Last 30 Days", callback_data="news_send_period_30")],
+            [InlineKeyboardButton("📋 Custom Days (1-365)", callback_data="news_send_period_custom")],
+            [InlineKeyboardButton("« Back", callback_data="news_send_back_to_setup")]
+        ]
+
+        reply_markup = InlineKeyboardMarkup(keyboard)
+        await query.edit_message_text(
+            "📅 <b>Select Time Period</b>\n\n"
+            "Choose how far back to fetch news:",
+            reply_markup=reply_markup,
+            parse_mode='HTML',
+            disable_web_page_preview=True
+        )
+        return
+
+    async def _cb_news_send_resend_setup(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the news_send_resend_setup callback"""
+        # Show resend options
+        keyboard = [
+            [InlineKeyboardButton("📰 Only New Items", callback_data="news_send_resend_false")],
+            [InlineKeyboardButton("🔄 Include Previously Sent", callback_data="news_send_resend_true")],
+            [InlineKeyboardButton("« Back", callback_data="news_send_back_to_setup")]
+        ]
+
+        reply_markup = InlineKeyboardMarkup(keyboard)
+        await query.edit_message_text(
+            "🔄 <b>Resend Options</b>\n\n"
+            "Should previously sent items be included?",
+            reply_markup=reply_markup,
+            parse_mode='HTML',
+            disable_web_page_preview=True
+        )
+        return
+
+    async def _cb_news_send_period(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle news_send_period_* callbacks"""
+        # Handle time period selection
+        period = query.data.replace("news_send_period_", "")
+        chat_id = str(update.effective_chat.id)
+
+        if period == "custom":
+            # Ask for custom days input
+            await query.edit_message_text(
+                "📋 <b>Enter Custom Days</b>\n\n"
+                "Please enter the number of days (1-365) to look back for news:",
+                parse_mode='HTML',
+                disable_web_page_preview=True
+            )
+            self.user_manager.set_user_state(chat_id, 'awaiting_news_send_days')
+            return
+        else:
+            # Store selected period and proceed to resend options
+            self.user_manager.set_user_context(chat_id, 'news_send_days', int(period))
+
+            # Show resend options next
+            keyboard = [
+                [InlineKeyboardButton("📰 Only New Items", callback_data="news_send_resend_false")],
+                [InlineKeyboardButton("🔄 Include Previously Sent", callback_data="news_send_resend_true")],
+                [InlineKeyboardButton("« Back to Time Period", callback_data="news_send_period_setup")]
+            ]
+
+            reply_markup = InlineKeyboardMarkup(keyboard)
+            await query.edit_message_text(
+                f"🔄 <b>Resend Options</b>\n\n"
+                f"📅 Selected: Last {period} day{'s' if int(period) > 1 else ''}\n\n"
+                "Should previously sent items be included?",
+                reply_markup=reply_markup,
+                parse_mode='HTML',
+                disable_web_page_preview=True
+            )
+        return
+
+    async def _cb_news_send_resend(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle news_send_resend_* callbacks"""
+        # Handle resend option selection
+        include_sent = query.data.replace("news_send_resend_", "") == "true"
+        chat_id = str(update.effective_chat.id)
+
+        # Store resend preference
+        self.user_manager.set_user_context(chat_id, 'news_send_include_sent', include_sent)
+
+        # Get stored parameters for display
+        days = self.user_manager.get_user_context(chat_id, 'news_send_days') or 7
+
+        # Get send type from context (persistent storage)
+        send_type = self.user_manager.get_user_context(chat_id, 'news_send_type') or "all"
+
+        logger.info(f"Determined send type: {send_type} from context")
+
+        # Clear user state 
+        self.user_manager.clear_user_state(chat_id)
+
+        # Proceed to target selection based on send type
+        if send_type == "all":
+            # Confirm and execute for all users
+            keyboard = [
+                [InlineKeyboardButton("✅ Confirm Send to All Users", callback_data="news_send_confirm_all")],
+                [InlineKeyboardButton("« Back to Resend Options", callback_data="news_send_resend_setup")]
+            ]
+
+            reply_markup = InlineKeyboardMarkup(keyboard)
+            await query.edit_message_text(
+                f"👥 <b>Send to All Users</b>\n\n"
+                f"📅 Period: {days} day{'s' if days > 1 else ''}\n"
+                f"🔄 Include sent: {'Yes' if include_sent else 'No'}\n\n"
+                "Confirm sending news to all registered users?",
+                reply_markup=reply_markup,
+                parse_mode='HTML'
+            )
+        elif send_type == "user":
+            # Show user selection
+            await self._show_configured_user_selection(query, days, include_sent)
+        elif send_type == "channel":
+            # Show channel selection
+            await self._show_configured_channel_selection(query, days, include_sent)
+
+        return
+
+    async def _cb_news_send_back_to_setup(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the news_send_back_to_setup callback"""
+        # Return to setup based on current send type
+        chat_id = str(update.effective_chat.id)
+        user_state = self.user_manager.get_user_state(chat_id)
+
+        send_type = None
+        if user_state:
+            if isinstance(user_state, str) and user_state.startswith('news_send_type_'):
+                send_type = user_state.replace('news_send_type_', '')
+            elif isinstance(user_state, dict):
+                # Handle case where user state is stored as dict
+                for key, value in user_state.items():
+                    if key.startswith('news_send_type_'):
+                        send_type = key.replace('news_send_type_', '')
+                        break
+
+        if send_type:
+            # Simulate the setup callback
+            query.data = f"news_send_setup_{send_type}"
+            return await self.handle_callback(update, context)
+        else:
+            # Fallback to send options
+            query.data = "news_send_options"
+            return await self.handle_callback(update, context)
+
+    async def _cb_news_send_all(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the news_send_all callback"""
+        # Send news to all registered users
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
+            return
+
+        await query.edit_message_text("🔄 Sending news to all users...")
+
+        try:
+            # Get recent news
+            news_items = await self.openai_news.fetch_news_by_days(7)  # Last 7 days
+            users = self.user_manager.get_all_users()
+
+            if not users:
+                await query.edit_message_text("⚠️ No registered users found.")
                 return
 
-            elif query.data == "news_clear_history":
-                # Clear sent news history for this user
-                chat_id = update.effective_chat.id
-                if str(chat_id) in self.openai_news.sent_items:
-                    del self.openai_news.sent_items[str(chat_id)]
-                    self.openai_news._save_sent_items()
-                
-                keyboard = [
-                    [InlineKeyboardButton("« Back to Settings", callback_data="news_settings")]
-                ]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
+            sent_count, total_messages = await self._broadcast_news_items(users, news_items)
+
+            await query.edit_message_text(
+                f"✅ Successfully sent {total_messages} news items to {sent_count} users"
+            )
+
+        except Exception as e:
+            logger.error(f"Error sending news to all users: {e}")
+            await query.edit_message_text(f"❌ Error sending news: {str(e)}")
+        return
+
+    async def _cb_news_send_user(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the news_send_user callback"""
+        # Show user selection for sending news
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
+            return
+
+        users = self.user_manager.get_all_users()
+
+        if not users:
+            await query.edit_message_text("⚠️ No registered users found.")
+            return
+
+        keyboard = []
+        for i, user_id in enumerate(users, 1):
+            username = self.user_manager.get_user_info(user_id) or "Unknown"
+            display_name = f"@{username}" if username != "Unknown" else f"User {user_id}"
+            button_text = f"{i}. {display_name}"
+            keyboard.append([InlineKeyboardButton(button_text, callback_data=f"news_send_to_{user_id}")])
+
+        keyboard.append([InlineKeyboardButton("« Back to Send Options", callback_data="news_send_options")])
+
+        reply_markup = InlineKeyboardMarkup(keyboard)
+        await query.edit_message_text(
+            "👤 <b>Select User</b>\n\n"
+            "Choose a user to send news to:",
+            reply_markup=reply_markup,
+            parse_mode='HTML'
+        )
+        return
+
+    async def _cb_news_send_channel(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the news_send_channel callback"""
+        # Show channel selection/input for sending news
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
+            return
+
+        keyboard = [
+            [InlineKeyboardButton("📺 Mintos Unofficial News Channel", callback_data="news_send_to_-1002373856504")],
+            [InlineKeyboardButton("✏️ Enter custom channel ID", callback_data="news_send_custom_channel")],
+            [InlineKeyboardButton("« Back to Send Options", callback_data="news_send_options")]
+        ]
+
+        reply_markup = InlineKeyboardMarkup(keyboard)
+        await query.edit_message_text(
+            "📢 <b>Select Channel</b>\n\n"
+            "Choose a channel to send news to:",
+            reply_markup=reply_markup,
+            parse_mode='HTML'
+        )
+        return
+
+    async def _cb_news_send_confirm_all(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the news_send_confirm_all callback"""
+        # Execute send to all users with configured parameters
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
+            return
+
+        chat_id = str(update.effective_chat.id)
+        days = self.user_manager.get_user_context(chat_id, 'news_send_days') or 7
+        include_sent = self.user_manager.get_user_context(chat_id, 'news_send_include_sent') or False
+
+        await query.edit_message_text("🔍 Fetching news items...")
+
+        try:
+            # Get news items
+            news_items = await self.openai_news.fetch_news_by_days(days)
+
+            if not news_items:
                 await query.edit_message_text(
-                    "✅ <b>Sent history cleared</b>\n\n"
-                    "You will now receive all news items again, including previously sent ones.",
-                    reply_markup=reply_markup,
-                    parse_mode='HTML',
-                    disable_web_page_preview=True
+                    f"📰 No news items found for the last {days} day{'s' if days > 1 else ''}.",
+                    parse_mode='HTML'
                 )
                 return
 
-            elif query.data.startswith("fetch_news_days_"):
-                # Handle day-based news fetching
-                chat_id = update.effective_chat.id
-                
-                # Check if user has news enabled
-                if not self.openai_news.get_user_preference(str(chat_id)):
-                    await query.edit_message_text(
-                        "❌ OpenAI news is disabled. Please enable it first using /news command.",
-                        disable_web_page_preview=True
-                    )
-                    return
-                
-                days = int(query.data.split("_")[-1])
-                
-                # Show processing message
-                await query.edit_message_text(
-                    f"🔄 Fetching company news from last {days} day{'s' if days > 1 else ''}...\n\n"
-                    "This may take a few moments as we search for updates from all companies.",
-                    disable_web_page_preview=True
-                )
-                
-                try:
-                    # Fetch news using the new cached method
-                    news_items = await self.openai_news.fetch_news_by_days(days, use_cache=True)
-                    
-                    if not news_items:
-                        await query.edit_message_text(
-                            f"📰 No news items found for the last {days} day{'s' if days > 1 else ''}.\n\n"
-                            "Try adjusting the date range or check back later.",
-                            disable_web_page_preview=True
-                        )
-                        return
-                    
-                    # Send completion message first
-                    await query.edit_message_text(
-                        f"✅ Found {len(news_items)} news items from last {days} day{'s' if days > 1 else ''}\n\n"
-                        "Sending messages...",
-                        disable_web_page_preview=True
-                    )
-                    
-                    # Send news items
-                    sent_count = 0
-                    for item in news_items:
-                        # Check if item was already sent to this user
-                        if not self.openai_news.is_item_sent(str(chat_id), item.url):
-                            message = self.openai_news.format_news_message(item)
-                            await self.send_message(chat_id, message, parse_mode='HTML', disable_web_page_preview=True)
-                            self.openai_news.mark_item_sent(str(chat_id), item.url)
-                            sent_count += 1
-                            
-                            # Small delay between messages
-                            await asyncio.sleep(0.5)
-                    
-                    # Send summary
-                    if sent_count > 0:
-                        summary_msg = f"📰 Sent {sent_count} new news items from last {days} day{'s' if days > 1 else ''}"
-                        if sent_count < len(news_items):
-                            summary_msg += f" ({len(news_items) - sent_count} were already sent)"
-                    else:
-                        summary_msg = f"📰 All news items from last {days} day{'s' if days > 1 else ''} were already sent to you"
-                    
-                    await self.send_message(chat_id, summary_msg, disable_web_page_preview=True)
-                    
-                except Exception as e:
-                    logger.error(f"Error fetching OpenAI news: {e}")
-                    await query.edit_message_text(
-                        "❌ Error fetching news. Please try again later.",
-                        disable_web_page_preview=True
-                    )
-                return
+            # Send to all users
+            await self._send_news_to_all_users_configured(query, news_items, days, include_sent)
+
+        except Exception as e:
+            logger.error(f"Error executing send to all users: {e}")
+            await query.edit_message_text(f"❌ Error sending news: {str(e)}")
+        return
+
+    async def _cb_news_send_configured_to(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle news_send_configured_to_* callbacks"""
+        # Send news to configured user/channel with stored parameters
+        logger.info(f"Processing news_send_configured_to_ callback: {query.data}")
+
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
+            return
+
+        target_id = query.data.replace("news_send_configured_to_", "")
+        logger.info(f"Target ID extracted: {target_id}")
+
+        # Get stored parameters from user context
+        try:
+            if hasattr(query, 'message') and query.message:
+                chat_id = str(query.message.chat_id)
+            elif hasattr(query, 'from_user'):
+                chat_id = str(query.from_user.id)
+            else:
+                chat_id = str(query.chat_instance)
+
+            logger.info(f"Chat ID for context retrieval: {chat_id}")
+        except Exception as e:
+            logger.error(f"Error getting chat_id: {e}")
+            chat_id = "114691530"
+
+        news_items = self.user_manager.get_user_context(chat_id, 'news_send_items') or []
+        days = self.user_manager.get_user_context(chat_id, 'news_send_days_final') or 7
+        include_sent = self.user_manager.get_user_context(chat_id, 'news_send_include_sent_final') or False
+
+        logger.info(f"Retrieved context - Items: {len(news_items)}, Days: {days}, Include sent: {include_sent}")
+
+        await query.edit_message_text(f"🔄 Sending news to {target_id}...")
+
+        try:
+            sent_count = 0
+            for item in news_items:
+                # Check if item was already sent (unless include_sent is True)
+                if include_sent or not self.openai_news.is_item_sent(target_id, item.url):
+                    try:
+                        message = self.openai_news.format_news_message(item)
+                        await self.send_message(target_id, message, disable_web_page_preview=True)
+
+                        if not include_sent:  # Only mark as sent if we're tracking
+                            self.openai_news.mark_item_sent(target_id, item.url)
+
+                        sent_count += 1
+                        await asyncio.sleep(0.5)
+                    except Exception as e:
+                        logger.error(f"Error sending news to {target_id}: {e}")
+
+            await query.edit_message_text(
+                f"✅ <b>Send Complete</b>\n\n"
+                f"📊 <b>Summary:</b>\n"
+                f"• Target: {target_id}\n"
+                f"• Messages sent: {sent_count}\n"
+                f"• Time period: {days} day{'s' if days > 1 else ''}\n"
+                f"• Include sent: {'Yes' if include_sent else 'No'}",
+                parse_mode='HTML'
+            )
+
+        except Exception as e:
+            logger.error(f"Error sending news to {target_id}: {e}")
+            await query.edit_message_text(f"❌ Error sending news: {str(e)}")
+        return
+
+    async def _cb_news_send_to(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle news_send_to_* callbacks"""
+        # Send news to specific user or channel
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
+            return
 
-            elif query.data == "news_enter_days":
-                # Handle custom days input
-                await query.edit_message_text(
-                    "📰 <b>Enter Days Range</b>\n\n"
-                    "Please reply with the number of days to look back (1-365).\n\n"
-                    "For example:\n• Type '7' for last 7 days\n• Type '30' for last 30 days\n• Type '90' for last 3 months",
-                    parse_mode='HTML',
-                    disable_web_page_preview=True
-                )
-                # Set a flag to handle the next text message as days input
-                self.user_manager.set_user_state(str(update.effective_chat.id), 'awaiting_news_days')
-                return
+        target_id = query.data.replace("news_send_to_", "")
 
-            elif query.data == "news_send_options":
-                # Show options to send news to specific users or channels
-                keyboard = [
-                    [InlineKeyboardButton("👥 Send to All Users", callback_data="news_send_setup_all")],
-                    [InlineKeyboardButton("👤 Send to Specific User", callback_data="news_send_setup_user")],
-                    [InlineKeyboardButton("📢 Send to Channel", callback_data="news_send_setup_channel")],
-                    [InlineKeyboardButton("« Back to News Menu", callback_data="toggle_news_true")]
-                ]
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                await query.edit_message_text(
-                    "📤 <b>Send News Options</b>\n\n"
-                    "Choose where to send the latest news:",
-                    reply_markup=reply_markup,
-                    parse_mode='HTML',
-                    disable_web_page_preview=True
-                )
-                return
+        await query.edit_message_text(f"🔄 Sending news to {target_id}...")
 
-            elif query.data in ["news_send_setup_all", "news_send_setup_user", "news_send_setup_channel"]:
-                # Show time period and resend options before sending
-                send_type = query.data.replace("news_send_setup_", "")
-                
-                # Store the send type in user context for later use (persistent)
-                self.user_manager.set_user_context(str(update.effective_chat.id), 'news_send_type', send_type)
-                
-                keyboard = [
-                    [InlineKeyboardButton("📅 Time Period Selection", callback_data="news_send_period_setup")],
-                    [InlineKeyboardButton("🔄 Include Previously Sent", callback_data="news_send_resend_setup")],
-                    [InlineKeyboardButton("« Back to Send Options", callback_data="news_send_options")]
-                ]
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                target_desc = {
-                    "all": "All Users",
-                    "user": "Specific User", 
-                    "channel": "Channel"
-                }[send_type]
-                
-                await query.edit_message_text(
-                    f"📤 <b>Send News Setup - {target_desc}</b>\n\n"
-                    "Configure sending options:",
-                    reply_markup=reply_markup,
-                    parse_mode='HTML',
-                    disable_web_page_preview=True
-                )
-                return
+        try:
+            # Get recent news
+            news_items = await self.openai_news.fetch_news_by_days(7)  # Last 7 days
 
-            elif query.data == "news_send_period_setup":
-                # Show time period selection options
-                keyboard = [
-                    [InlineKeyboardButton("📅 Last 1 Day", callback_data="news_send_period_1")],
-                    [InlineKeyboardButton("📊 Last 7 Days", callback_data="news_send_period_7")],
-                    [InlineKeyboardButton("📈 Last 30 Days", callback_data="news_send_period_30")],
-                    [InlineKeyboardButton("📋 Custom Days (1-365)", callback_data="news_send_period_custom")],
-                    [InlineKeyboardButton("« Back", callback_data="news_send_back_to_setup")]
-                ]
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                await query.edit_message_text(
-                    "📅 <b>Select Time Period</b>\n\n"
-                    "Choose how far back to fetch news:",
-                    reply_markup=reply_markup,
-                    parse_mode='HTML',
-                    disable_web_page_preview=True
-                )
+            if not news_items:
+                await query.edit_message_text("📰 No recent news found.")
                 return
 
-            elif query.data == "news_send_resend_setup":
-                # Show resend options
-                keyboard = [
-                    [InlineKeyboardButton("📰 Only New Items", callback_data="news_send_resend_false")],
-                    [InlineKeyboardButton("🔄 Include Previously Sent", callback_data="news_send_resend_true")],
-                    [InlineKeyboardButton("« Back", callback_data="news_send_back_to_setup")]
-                ]
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                await query.edit_message_text(
-                    "🔄 <b>Resend Options</b>\n\n"
-                    "Should previously sent items be included?",
-                    reply_markup=reply_markup,
-                    parse_mode='HTML',
-                    disable_web_page_preview=True
-                )
-                return
+            sent_count = 0
+            for item in news_items:
+                if not self.openai_news.is_item_sent(target_id, item.url):
+                    try:
+                        message = self.openai_news.format_news_message(item)
+                        await self.send_message(target_id, message, disable_web_page_preview=True)
+                        self.openai_news.mark_item_sent(target_id, item.url)
+                        sent_count += 1
+                        await asyncio.sleep(0.5)
+                    except Exception as e:
+                        logger.error(f"Error sending news to {target_id}: {e}")
 
-            elif query.data.startswith("news_send_period_"):
-                # Handle time period selection
-                period = query.data.replace("news_send_period_", "")
-                chat_id = str(update.effective_chat.id)
-                
-                if period == "custom":
-                    # Ask for custom days input
-                    await query.edit_message_text(
-                        "📋 <b>Enter Custom Days</b>\n\n"
-                        "Please enter the number of days (1-365) to look back for news:",
-                        parse_mode='HTML',
-                        disable_web_page_preview=True
-                    )
-                    self.user_manager.set_user_state(chat_id, 'awaiting_news_send_days')
-                    return
+            # Get target name for status message
+            target_name = target_id
+            try:
+                if target_id.startswith('-'):
+                    # It's a channel
+                    channel_info = await self.application.bot.get_chat(target_id)
+                    target_name = channel_info.title if channel_info.title else target_id
                 else:
-                    # Store selected period and proceed to resend options
-                    self.user_manager.set_user_context(chat_id, 'news_send_days', int(period))
-                    
-                    # Show resend options next
-                    keyboard = [
-                        [InlineKeyboardButton("📰 Only New Items", callback_data="news_send_resend_false")],
-                        [InlineKeyboardButton("🔄 Include Previously Sent", callback_data="news_send_resend_true")],
-                        [InlineKeyboardButton("« Back to Time Period", callback_data="news_send_period_setup")]
-                    ]
-                    
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-                    await query.edit_message_text(
-                        f"🔄 <b>Resend Options</b>\n\n"
-                        f"📅 Selected: Last {period} day{'s' if int(period) > 1 else ''}\n\n"
-                        "Should previously sent items be included?",
-                        reply_markup=reply_markup,
-                        parse_mode='HTML',
-                        disable_web_page_preview=True
-                    )
-                return
+                    # It's a user
+                    username = self.user_manager.get_user_info(target_id)
+                    target_name = f"@{username}" if username else target_id
+            except:
+                pass  # Keep original ID if we can't get the name
 
-            elif query.data.startswith("news_send_resend_"):
-                # Handle resend option selection
-                include_sent = query.data.replace("news_send_resend_", "") == "true"
-                chat_id = str(update.effective_chat.id)
-                
-                # Store resend preference
-                self.user_manager.set_user_context(chat_id, 'news_send_include_sent', include_sent)
-                
-                # Get stored parameters for display
-                days = self.user_manager.get_user_context(chat_id, 'news_send_days') or 7
-                
-                # Get send type from context (persistent storage)
-                send_type = self.user_manager.get_user_context(chat_id, 'news_send_type') or "all"
-                
-                logger.info(f"Determined send type: {send_type} from context")
-                
-                # Clear user state 
-                self.user_manager.clear_user_state(chat_id)
-                
-                # Proceed to target selection based on send type
-                if send_type == "all":
-                    # Confirm and execute for all users
-                    keyboard = [
-                        [InlineKeyboardButton("✅ Confirm Send to All Users", callback_data="news_send_confirm_all")],
-                        [InlineKeyboardButton("« Back to Resend Options", callback_data="news_send_resend_setup")]
-                    ]
-                    
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-                    await query.edit_message_text(
-                        f"👥 <b>Send to All Users</b>\n\n"
-                        f"📅 Period: {days} day{'s' if days > 1 else ''}\n"
-                        f"🔄 Include sent: {'Yes' if include_sent else 'No'}\n\n"
-                        "Confirm sending news to all registered users?",
-                        reply_markup=reply_markup,
-                        parse_mode='HTML'
-                    )
-                elif send_type == "user":
-                    # Show user selection
-                    await self._show_configured_user_selection(query, days, include_sent)
-                elif send_type == "channel":
-                    # Show channel selection
-                    await self._show_configured_channel_selection(query, days, include_sent)
-                
-                return
+            await query.edit_message_text(
+                f"✅ Successfully sent {sent_count} news items to {target_name}"
+            )
 
-            elif query.data == "news_send_back_to_setup":
-                # Return to setup based on current send type
-                chat_id = str(update.effective_chat.id)
-                user_state = self.user_manager.get_user_state(chat_id)
-                
-                send_type = None
-                if user_state:
-                    if isinstance(user_state, str) and user_state.startswith('news_send_type_'):
-                        send_type = user_state.replace('news_send_type_', '')
-                    elif isinstance(user_state, dict):
-                        # Handle case where user state is stored as dict
-                        for key, value in user_state.items():
-                            if key.startswith('news_send_type_'):
-                                send_type = key.replace('news_send_type_', '')
-                                break
-                
-                if send_type:
-                    # Simulate the setup callback
-                    query.data = f"news_send_setup_{send_type}"
-                    return await self.handle_callback(update, context)
-                else:
-                    # Fallback to send options
-                    query.data = "news_send_options"
-                    return await self.handle_callback(update, context)
-
-            elif query.data == "news_send_all":
-                # Send news to all registered users
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
-                    return
-                
-                await query.edit_message_text("🔄 Sending news to all users...")
-                
-                try:
-                    # Get recent news
-                    news_items = await self.openai_news.fetch_news_by_days(7)  # Last 7 days
-                    users = self.user_manager.get_all_users()
-                    
-                    if not users:
-                        await query.edit_message_text("⚠️ No registered users found.")
-                        return
-                    
-                    sent_count = 0
-                    total_messages = 0
-                    
-                    for user_id in users:
-                        user_sent = 0
-                        for item in news_items:
-                            if not self.openai_news.is_item_sent(user_id, item.url):
-                                try:
-                                    message = self.openai_news.format_news_message(item)
-                                    await self.send_message(user_id, message, disable_web_page_preview=True)
-                                    self.openai_news.mark_item_sent(user_id, item.url)
-                                    user_sent += 1
-                                    await asyncio.sleep(0.5)
-                                except Exception as e:
-                                    logger.error(f"Error sending news to user {user_id}: {e}")
-                        
-                        if user_sent > 0:
-                            sent_count += 1
-                            total_messages += user_sent
-                    
-                    await query.edit_message_text(
-                        f"✅ Successfully sent {total_messages} news items to {sent_count} users"
-                    )
-                    
-                except Exception as e:
-                    logger.error(f"Error sending news to all users: {e}")
-                    await query.edit_message_text(f"❌ Error sending news: {str(e)}")
-                return
+        except Exception as e:
+            logger.error(f"Error sending news to {target_id}: {e}")
+            await query.edit_message_text(f"❌ Error sending news: {str(e)}")
+        return
 
-            elif query.data == "news_send_user":
-                # Show user selection for sending news
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
-                    return
-                
-                users = self.user_manager.get_all_users()
-                
-                if not users:
-                    await query.edit_message_text("⚠️ No registered users found.")
-                    return
-                
-                keyboard = []
-                for i, user_id in enumerate(users, 1):
-                    username = self.user_manager.get_user_info(user_id) or "Unknown"
-                    display_name = f"@{username}" if username != "Unknown" else f"User {user_id}"
-                    button_text = f"{i}. {display_name}"
-                    keyboard.append([InlineKeyboardButton(button_text, callback_data=f"news_send_to_{user_id}")])
-                
-                keyboard.append([InlineKeyboardButton("« Back to Send Options", callback_data="news_send_options")])
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                await query.edit_message_text(
-                    "👤 <b>Select User</b>\n\n"
-                    "Choose a user to send news to:",
-                    reply_markup=reply_markup,
-                    parse_mode='HTML'
-                )
-                return
+    async def _cb_news_send_custom_channel(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the news_send_custom_channel callback"""
+        # Handle custom channel ID input
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
+            return
 
-            elif query.data == "news_send_channel":
-                # Show channel selection/input for sending news
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
-                    return
-                
-                keyboard = [
-                    [InlineKeyboardButton("📺 Mintos Unofficial News Channel", callback_data="news_send_to_-1002373856504")],
-                    [InlineKeyboardButton("✏️ Enter custom channel ID", callback_data="news_send_custom_channel")],
-                    [InlineKeyboardButton("« Back to Send Options", callback_data="news_send_options")]
-                ]
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                await query.edit_message_text(
-                    "📢 <b>Select Channel</b>\n\n"
-                    "Choose a channel to send news to:",
-                    reply_markup=reply_markup,
-                    parse_mode='HTML'
-                )
-                return
+        await query.edit_message_text(
+            "✏️ <b>Enter Channel ID</b>\n\n"
+            "Please reply with the channel ID or username.\n\n"
+            "Examples:\n"
+            "• @channelname\n"
+            "• -1001234567890\n\n"
+            "Reply directly to this message with the channel ID.",
+            parse_mode='HTML'
+        )
 
-            elif query.data == "news_send_confirm_all":
-                # Execute send to all users with configured parameters
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
-                    return
-                
-                chat_id = str(update.effective_chat.id)
-                days = self.user_manager.get_user_context(chat_id, 'news_send_days') or 7
-                include_sent = self.user_manager.get_user_context(chat_id, 'news_send_include_sent') or False
-                
-                await query.edit_message_text("🔍 Fetching news items...")
-                
-                try:
-                    # Get news items
-                    news_items = await self.openai_news.fetch_news_by_days(days)
-                    
-                    if not news_items:
-                        await query.edit_message_text(
-                            f"📰 No news items found for the last {days} day{'s' if days > 1 else ''}.",
-                            parse_mode='HTML'
-                        )
-                        return
-                    
-                    # Send to all users
-                    await self._send_news_to_all_users_configured(query, news_items, days, include_sent)
-                    
-                except Exception as e:
-                    logger.error(f"Error executing send to all users: {e}")
-                    await query.edit_message_text(f"❌ Error sending news: {str(e)}")
-                return
+        # Set user state to await channel ID input
+        self.user_manager.set_user_state(str(update.effective_chat.id), 'awaiting_channel_id')
+        return
 
-            elif query.data.startswith("news_send_configured_to_"):
-                # Send news to configured user/channel with stored parameters
-                logger.info(f"Processing news_send_configured_to_ callback: {query.data}")
-                
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
-                    return
-                
-                target_id = query.data.replace("news_send_configured_to_", "")
-                logger.info(f"Target ID extracted: {target_id}")
-                
-                # Get stored parameters from user context
-                try:
-                    if hasattr(query, 'message') and query.message:
-                        chat_id = str(query.message.chat_id)
-                    elif hasattr(query, 'from_user'):
-                        chat_id = str(query.from_user.id)
-                    else:
-                        chat_id = str(query.chat_instance)
-                    
-                    logger.info(f"Chat ID for context retrieval: {chat_id}")
-                except Exception as e:
-                    logger.error(f"Error getting chat_id: {e}")
-                    chat_id = "114691530"
-                
-                news_items = self.user_manager.get_user_context(chat_id, 'news_send_items') or []
-                days = self.user_manager.get_user_context(chat_id, 'news_send_days_final') or 7
-                include_sent = self.user_manager.get_user_context(chat_id, 'news_send_include_sent_final') or False
-                
-                logger.info(f"Retrieved context - Items: {len(news_items)}, Days: {days}, Include sent: {include_sent}")
-                
-                await query.edit_message_text(f"🔄 Sending news to {target_id}...")
-                
-                try:
-                    sent_count = 0
-                    for item in news_items:
-                        # Check if item was already sent (unless include_sent is True)
-                        if include_sent or not self.openai_news.is_item_sent(target_id, item.url):
-                            try:
-                                message = self.openai_news.format_news_message(item)
-                                await self.send_message(target_id, message, disable_web_page_preview=True)
-                                
-                                if not include_sent:  # Only mark as sent if we're tracking
-                                    self.openai_news.mark_item_sent(target_id, item.url)
-                                
-                                sent_count += 1
-                                await asyncio.sleep(0.5)
-                            except Exception as e:
-                                logger.error(f"Error sending news to {target_id}: {e}")
-                    
-                    await query.edit_message_text(
-                        f"✅ <b>Send Complete</b>\n\n"
-                        f"📊 <b>Summary:</b>\n"
-                        f"• Target: {target_id}\n"
-                        f"• Messages sent: {sent_count}\n"
-                        f"• Time period: {days} day{'s' if days > 1 else ''}\n"
-                        f"• Include sent: {'Yes' if include_sent else 'No'}",
-                        parse_mode='HTML'
-                    )
-                    
-                except Exception as e:
-                    logger.error(f"Error sending news to {target_id}: {e}")
-                    await query.edit_message_text(f"❌ Error sending news: {str(e)}")
-                return
+    async def _cb_news_reset_tracking(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the news_reset_tracking callback"""
+        # Reset news tracking for current user
+        if not await self.is_admin(update.effective_user.id):
+            await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
+            return
+
+        chat_id = str(update.effective_chat.id)
+        reset_count = self.openai_news.reset_sent_items(chat_id)
+
+        await query.edit_message_text(
+            f"🔄 <b>News Tracking Reset</b>\n\n"
+            f"✅ Cleared {reset_count} tracked news items for this user.\n"
+            f"You can now receive all news items again.",
+            parse_mode='HTML'
+        )
+        return
+
+    async def _cb_feed_toggle(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle feed_toggle_* callbacks"""
+        # Handle individual feed toggle
+        parts = query.data.split("_")
+        feed_source = parts[2]  # nasdaq, mintos, or ffnews
+        chat_id = parts[3]
+
+        current_preference = self.user_manager.get_feed_preference(chat_id, feed_source)
+        new_preference = not current_preference
+        self.user_manager.set_feed_preference(chat_id, feed_source, new_preference)
+
+        # Get feed display names
+        feed_names = {
+            'nasdaq': 'NASDAQ Baltic',
+            'mintos': 'Mintos News',
+            'ffnews': 'FFNews'
+        }
+
+        feed_name = feed_names.get(feed_source, feed_source)
+        status = "enabled" if new_preference else "disabled"
+
+        # Show updated subscription menu
+        user_prefs = self.user_manager.get_user_feed_preferences(chat_id)
+        nasdaq_enabled = user_prefs.get('nasdaq', False)
+        mintos_enabled = user_prefs.get('mintos', False)
+        ffnews_enabled = user_prefs.get('ffnews', False)
+
+        # Build updated keyboard
+        keyboard = [
+            [InlineKeyboardButton(
+                f"{'✅' if nasdaq_enabled else '⭕'} NASDAQ Baltic (filtered)",
+                callback_data=f"feed_toggle_nasdaq_{chat_id}"
+            )],
+            [InlineKeyboardButton(
+                f"{'✅' if mintos_enabled else '⭕'} Mintos News (all articles)",
+                callback_data=f"feed_toggle_mintos_{chat_id}"
+            )],
+            [InlineKeyboardButton(
+                f"{'✅' if ffnews_enabled else '⭕'} FFNews (filtered)",
+                callback_data=f"feed_toggle_ffnews_{chat_id}"
+            )],
+            [InlineKeyboardButton("❌ Cancel", callback_data="cancel")]
+        ]
+
+        reply_markup = InlineKeyboardMarkup(keyboard)
+        enabled_count = sum([nasdaq_enabled, mintos_enabled, ffnews_enabled])
+
+        await query.edit_message_text(
+            f"📰 <b>RSS Feed Subscriptions</b>\n\n"
+            f"✅ <b>{feed_name}</b> notifications {status}\n"
+            f"You have <b>{enabled_count}</b> feed(s) enabled\n\n"
+            f"<b>Available feeds:</b>\n"
+            f"• <b>NASDAQ Baltic</b> - Filtered news about Mintos, DelfinGroup, Grenardi, etc.\n"
+            f"• <b>Mintos News</b> - All articles from Mintos blog\n"
+            f"• <b>FFNews</b> - Financial news filtered by keywords\n\n"
+            f"Click on any feed to toggle notifications:",
+            reply_markup=reply_markup,
+            parse_mode='HTML'
+        )
+        return
+
+    async def _cb_rss_feed_select(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle rss_feed_select_* callbacks"""
+        # Handle RSS feed selection
+        feed_source = query.data.replace("rss_feed_select_", "")
+        await self._show_rss_items_for_feed(query, feed_source)
+        return
+
+    async def _cb_rss_item_select(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle rss_item_select_* callbacks"""
+        # Handle RSS item selection for sending
+        await self._handle_rss_item_selection(query)
+        return
+
+    async def _cb_send_rss_to(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle send_rss_to_* callbacks"""
+        # Handle sending selected RSS items to a user/channel
+        await self._handle_send_rss_items(query)
+        return
+
+    async def _cb_cancel(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle the cancel callback"""
+        # Make the cancellation message more attractive and consistent
+        await query.edit_message_text(
+            "✅ <b>Operation cancelled</b>\n\n"
+            "Menu has been closed successfully.",
+            disable_web_page_preview=True,
+            parse_mode='HTML'
+        )
+        return
 
-            elif query.data.startswith("news_send_to_"):
-                # Send news to specific user or channel
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
-                    return
-                
-                target_id = query.data.replace("news_send_to_", "")
-                
-                await query.edit_message_text(f"🔄 Sending news to {target_id}...")
-                
-                try:
-                    # Get recent news
-                    news_items = await self.openai_news.fetch_news_by_days(7)  # Last 7 days
-                    
-                    if not news_items:
-                        await query.edit_message_text("📰 No recent news found.")
-                        return
-                    
-                    sent_count = 0
-                    for item in news_items:
-                        if not self.openai_news.is_item_sent(target_id, item.url):
-                            try:
-                                message = self.openai_news.format_news_message(item)
-                                await self.send_message(target_id, message, disable_web_page_preview=True)
-                                self.openai_news.mark_item_sent(target_id, item.url)
-                                sent_count += 1
-                                await asyncio.sleep(0.5)
-                            except Exception as e:
-                                logger.error(f"Error sending news to {target_id}: {e}")
-                    
-                    # Get target name for status message
-                    target_name = target_id
-                    try:
-                        if target_id.startswith('-'):
-                            # It's a channel
-                            channel_info = await self.application.bot.get_chat(target_id)
-                            target_name = channel_info.title if channel_info.title else target_id
-                        else:
-                            # It's a user
-                            username = self.user_manager.get_user_info(target_id)
-                            target_name = f"@{username}" if username else target_id
-                    except:
-                        pass  # Keep original ID if we can't get the name
-                    
-                    await query.edit_message_text(
-                        f"✅ Successfully sent {sent_count} news items to {target_name}"
-                    )
-                    
-                except Exception as e:
-                    logger.error(f"Error sending news to {target_id}: {e}")
-                    await query.edit_message_text(f"❌ Error sending news: {str(e)}")
-                return
+    async def _cb_company_updates(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: Any) -> None:
+        """Handle latest_* and all_* callbacks"""
+        parts = query.data.split("_")
+        update_type = parts[0]
+        company_id = int(parts[1])
+        page = int(parts[2]) if len(parts) > 2 else 0
+        company_name = self.data_manager.get_company_name(company_id)
 
-            elif query.data == "news_send_custom_channel":
-                # Handle custom channel ID input
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
-                    return
-                
-                await query.edit_message_text(
-                    "✏️ <b>Enter Channel ID</b>\n\n"
-                    "Please reply with the channel ID or username.\n\n"
-                    "Examples:\n"
-                    "• @channelname\n"
-                    "• -1001234567890\n\n"
-                    "Reply directly to this message with the channel ID.",
-                    parse_mode='HTML'
-                )
-                
-                # Set user state to await channel ID input
-                self.user_manager.set_user_state(str(update.effective_chat.id), 'awaiting_channel_id')
-                return
+        await query.edit_message_text(f"Fetching latest data for {company_name}...", disable_web_page_preview=True)
 
-            elif query.data == "news_reset_tracking":
-                # Reset news tracking for current user
-                if not await self.is_admin(update.effective_user.id):
-                    await query.edit_message_text("⚠️ Access denied. Only admin can use this feature.")
-                    return
-                
-                chat_id = str(update.effective_chat.id)
-                reset_count = self.openai_news.reset_sent_items(chat_id)
-                
-                await query.edit_message_text(
-                    f"🔄 <b>News Tracking Reset</b>\n\n"
-                    f"✅ Cleared {reset_count} tracked news items for this user.\n"
-                    f"You can now receive all news items again.",
-                    parse_mode='HTML'
-                )
-                return
-                
-            elif query.data.startswith("feed_toggle_"):
-                # Handle individual feed toggle
-                parts = query.data.split("_")
-                feed_source = parts[2]  # nasdaq, mintos, or ffnews
-                chat_id = parts[3]
-                
-                current_preference = self.user_manager.get_feed_preference(chat_id, feed_source)
-                new_preference = not current_preference
-                self.user_manager.set_feed_preference(chat_id, feed_source, new_preference)
-                
-                # Get feed display names
-                feed_names = {
-                    'nasdaq': 'NASDAQ Baltic',
-                    'mintos': 'Mintos News',
-                    'ffnews': 'FFNews'
-                }
-                
-                feed_name = feed_names.get(feed_source, feed_source)
-                status = "enabled" if new_preference else "disabled"
-                
-                # Show updated subscription menu
-                user_prefs = self.user_manager.get_user_feed_preferences(chat_id)
-                nasdaq_enabled = user_prefs.get('nasdaq', False)
-                mintos_enabled = user_prefs.get('mintos', False)
-                ffnews_enabled = user_prefs.get('ffnews', False)
-                
-                # Build updated keyboard
-                keyboard = [
-                    [InlineKeyboardButton(
-                        f"{'✅' if nasdaq_enabled else '⭕'} NASDAQ Baltic (filtered)",
-                        callback_data=f"feed_toggle_nasdaq_{chat_id}"
-                    )],
-                    [InlineKeyboardButton(
-                        f"{'✅' if mintos_enabled else '⭕'} Mintos News (all articles)",
-                        callback_data=f"feed_toggle_mintos_{chat_id}"
-                    )],
-                    [InlineKeyboardButton(
-                        f"{'✅' if ffnews_enabled else '⭕'} FFNews (filtered)",
-                        callback_data=f"feed_toggle_ffnews_{chat_id}"
-                    )],
-                    [InlineKeyboardButton("❌ Cancel", callback_data="cancel")]
-                ]
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                enabled_count = sum([nasdaq_enabled, mintos_enabled, ffnews_enabled])
-                
-                await query.edit_message_text(
-                    f"📰 <b>RSS Feed Subscriptions</b>\n\n"
-                    f"✅ <b>{feed_name}</b> notifications {status}\n"
-                    f"You have <b>{enabled_count}</b> feed(s) enabled\n\n"
-                    f"<b>Available feeds:</b>\n"
-                    f"• <b>NASDAQ Baltic</b> - Filtered news about Mintos, DelfinGroup, Grenardi, etc.\n"
-                    f"• <b>Mintos News</b> - All articles from Mintos blog\n"
-                    f"• <b>FFNews</b> - Financial news filtered by keywords\n\n"
-                    f"Click on any feed to toggle notifications:",
-                    reply_markup=reply_markup,
-                    parse_mode='HTML'
-                )
-                return
-                
-            elif query.data.startswith("rss_feed_select_"):
-                # Handle RSS feed selection
-                feed_source = query.data.replace("rss_feed_select_", "")
-                await self._show_rss_items_for_feed(query, feed_source)
-                return
-                
-            elif query.data.startswith("rss_item_select_"):
-                # Handle RSS item selection for sending
-                await self._handle_rss_item_selection(query)
-                return
-                
-            elif query.data.startswith("send_rss_to_"):
-                # Handle sending selected RSS items to a user/channel
-                await self._handle_send_rss_items(query)
-                return
-                
-            elif query.data == "cancel":
-                # Make the cancellation message more attractive and consistent
-                await query.edit_message_text(
-                    "✅ <b>Operation cancelled</b>\n\n"
-                    "Menu has been closed successfully.",
-                    disable_web_page_preview=True,
-                    parse_mode='HTML'
-                )
-                return
+        company_updates = self.mintos_client.get_recovery_updates(company_id)
+        if company_updates:
+            company_updates = {"lender_id": company_id, **company_updates}
+            self.data_manager.save_lender_update(company_updates)
 
-            elif query.data.startswith(("latest_", "all_")):
-                parts = query.data.split("_")
-                update_type = parts[0]
-                company_id = int(parts[1])
-                page = int(parts[2]) if len(parts) > 2 else 0
-                company_name = self.data_manager.get_company_name(company_id)
-
-                await query.edit_message_text(f"Fetching latest data for {company_name}...", disable_web_page_preview=True)
-
-                company_updates = self.mintos_client.get_recovery_updates(company_id)
-                if company_updates:
-                    company_updates = {"lender_id": company_id, **company_updates}
-                    cached_updates = self.data_manager.load_previous_updates()
-                    updated = False
-                    for i, update in enumerate(cached_updates):
-                        if update.get('lender_id') == company_id:
-                            cached_updates[i] = company_updates
-                            updated = True
-                            break
-                    if not updated:
-                        cached_updates.append(company_updates)
-                    self.data_manager.save_updates(cached_updates)
-
-                if not company_updates:
-                    await query.edit_message_text(f"No updates found for {company_name}", disable_web_page_preview=True)
-                    return
+        if not company_updates:
+            await query.edit_message_text(f"No updates found for {company_name}", disable_web_page_preview=True)
+            return
 
-                if update_type == "latest":
-                    latest_update = {"lender_id": company_id, "company_name": company_name}
-                    if "items" in company_updates and company_updates["items"]:
-                        latest_year = company_updates["items"][0]
-                        if "items" in latest_year and latest_year["items"]:
-                            latest_item = latest_year["items"][0]
-                            latest_update.update(latest_item)
-                    message = self.format_update_message(latest_update)
-                    await query.edit_message_text(message, parse_mode='HTML', disable_web_page_preview=True)
-
-                else:  # all updates
-                    messages = []
-                    for year_data in sorted(company_updates.get("items", []), key=lambda x: x.get('year', 0), reverse=True):
-                        year_items = sorted(year_data.get("items", []),
-                                             key=lambda x: datetime.strptime(x.get('date', '1900-01-01'), '%Y-%m-%d'),
-                                             reverse=True)
-                        for update_item in year_items:
-                            update_with_company = {
-                                "lender_id": company_id,
-                                "company_name": company_name,
-                                **update_item
-                            }
-                            messages.append(self.format_update_message(update_with_company))
-
-                    updates_per_page = 5
-                    total_updates = len(messages)
-                    total_pages = (total_updates + updates_per_page - 1) // updates_per_page
-
-                    if page >= total_pages:
-                        page = total_pages - 1
-                    if page < 0:
-                        page = 0
-
-                    start_idx = page * updates_per_page
-                    end_idx = min(start_idx + updates_per_page, total_updates)
-
-                    header_message = (
-                        f"📊 Updates for {company_name}\n"
-                        f"Page {page + 1} of {total_pages}\n"
-                        f"Showing updates {start_idx + 1}-{end_idx} of {total_updates}"
-                    )
-                    await self.send_message(query.message.chat_id, header_message, disable_web_page_preview=True)
+        if update_type == "latest":
+            latest_update = self.data_manager.update_index.latest_for_lender(company_id)
+            if latest_update is None:
+                latest_update = {"lender_id": company_id, "company_name": company_name}
+            message = self.format_update_message(latest_update)
+            await query.edit_message_text(message, parse_mode='HTML', disable_web_page_preview=True)
+
+        else:  # all updates
+            messages = [
+                self.format_update_message(update_item)
+                for update_item in self.data_manager.update_index.for_lender(company_id)
+            ]
 
-                    current_page_updates = messages[start_idx:end_idx]
-                    for message in current_page_updates:
-                        await self.send_message(query.message.chat_id, message, disable_web_page_preview=True)
+            updates_per_page = 5
+            total_updates = len(messages)
+            total_pages = (total_updates + updates_per_page - 1) // updates_per_page
 
-                    nav_buttons = []
-                    if page > 0:
-                        nav_buttons.append(InlineKeyboardButton("◀️ Previous", callback_data=f"all_{company_id}_{page-1}"))
-                    if page < total_pages - 1:
-                        nav_buttons.append(InlineKeyboardButton("Next ▶️", callback_data=f"all_{company_id}_{page+1}"))
+            if page >= total_pages:
+                page = total_pages - 1
+            if page < 0:
+                page = 0
 
-                    if nav_buttons:
-                        reply_markup = InlineKeyboardMarkup([nav_buttons])
-                        await self.send_message(
-                            query.message.chat_id,
-                            "Navigate through updates:",
-                            reply_markup=reply_markup,
-                            disable_web_page_preview=True
-                        )
+            start_idx = page * updates_per_page
+            end_idx = min(start_idx + updates_per_page, total_updates)
 
-        except BadRequest as e:
-            if "Message is not modified" in str(e):
-                # This happens when trying to edit a message with identical content
-                # Just acknowledge the callback without showing an error
-                logger.debug(f"Message not modified in callback: {e}")
-                return
-            else:
-                logger.error(f"BadRequest in handle_callback: {e}", exc_info=True)
-                try:
-                    await query.edit_message_text("⚠️ Error processing your request. Please try again.", disable_web_page_preview=True)
-                except:
-                    # If we can't edit the message, just log it
-                    logger.error("Could not edit message to show error")
-        except Exception as e:
-            logger.error(f"Error in handle_callback: {e}", exc_info=True)
-            try:
-                await query.edit_message_text("⚠️ Error processing your request. Please try again.", disable_web_page_preview=True)
-            except:
-                # If we can't edit the message, just log it
-                logger.error("Could not edit message to show error")
+            header_message = (
+                f"📊 Updates for {company_name}\n"
+                f"Page {page + 1} of {total_pages}\n"
+                f"Showing updates {start_idx + 1}-{end_idx} of {total_updates}"
+            )
+            await self.send_message(query.message.chat_id, header_message, disable_web_page_preview=True)
+
+            current_page_updates = messages[start_idx:end_idx]
+            for message in current_page_updates:
+                await self.send_message(query.message.chat_id, message, disable_web_page_preview=True)
+
+            nav_buttons = []
+            if page > 0:
+                nav_buttons.append(InlineKeyboardButton("◀️ Previous", callback_data=f"all_{company_id}_{page-1}"))
+            if page < total_pages - 1:
+                nav_buttons.append(InlineKeyboardButton("Next ▶️", callback_data=f"all_{company_id}_{page+1}"))
+
+            if nav_buttons:
+                reply_markup = InlineKeyboardMarkup([nav_buttons])
+                await self.send_message(
+                    query.message.chat_id,
+                    "Navigate through updates:",
+                    reply_markup=reply_markup,
+                    disable_web_page_preview=True
+                )
 
-    _failed_messages: List[Dict[str, Any]] = []
     _admin_rss_items: List[Any] = []  # Store filtered RSS items for admin operations
 
-    async def retry_failed_messages(self) -> None:
-        """Attempt to resend failed messages"""
-        if not self._failed_messages:
+    async def retry_outbound_messages(self) -> None:
+        """Attempt to redeliver queued messages that are due"""
+        due_messages = self.outbound_queue.due()
+        if not due_messages:
             return
 
-        logger.info(f"Attempting to resend {len(self._failed_messages)} failed messages")
-        retry_messages = self._failed_messages.copy()
-        self._failed_messages.clear()
-
-        for msg in retry_messages:
+        logger.info(f"Attempting to resend {len(due_messages)} queued messages")
+        for message_id in due_messages:
+            msg = self.outbound_queue.messages.get(message_id)
+            if msg is None:
+                continue
             try:
-                await self.send_message(
+                reply_markup = None
+                if msg.get('reply_markup'):
+                    reply_markup = InlineKeyboardMarkup.de_json(msg['reply_markup'], self.application.bot)
+                await self.broadcaster.send(
                     msg['chat_id'],
                     msg['text'],
-                    msg.get('reply_markup'),
+                    reply_markup=reply_markup,
                     disable_web_page_preview=msg.get('disable_web_page_preview', True),
-                    parse_mode=msg.get('parse_mode', 'HTML')
+                    parse_mode=msg.get('parse_mode', 'HTML'),
+                    queue_on_failure=False
                 )
+                self.outbound_queue.mark_sent(message_id)
                 logger.info(f"Successfully resent message to {msg['chat_id']}")
+            except (Forbidden, BadRequest) as e:
+                # The chat is gone or the message is invalid, retrying will not help
+                self.outbound_queue.mark_failed(message_id, str(e), permanent=True)
+            except Exception as e:
+                self.outbound_queue.mark_failed(message_id, str(e))
+
+    async def scheduled_outbound_queue(self) -> None:
+        """Redeliver queued messages as soon as they are due"""
+        while True:
+            try:
+                await self.retry_outbound_messages()
+                await asyncio.sleep(OUTBOUND_POLL_SECONDS)
+            except asyncio.CancelledError:
+                logger.info("Outbound queue worker cancelled")
+                break
+            except Exception as e:
+                logger.error(f"Outbound queue worker error: {e}", exc_info=True)
+                await asyncio.sleep(OUTBOUND_POLL_SECONDS * 10)
+
+    async def scheduled_news_batch(self) -> None:
+        """Submit company news for OpenAI batch classification nightly and collect the verdicts
+
+        Collected verdicts fill the verdict cache, so daytime news fetches only
+        call OpenAI for companies whose results changed since the night.
+        """
+        if not self.openai_news.openai_api_key:
+            logger.info("OpenAI API key not configured, nightly news batch disabled")
+            return
+        last_submitted = None
+        while True:
+            try:
+                await self.openai_news.collect_batch_job()
+                now = datetime.now(timezone.utc)
+                if now.hour == NEWS_BATCH_SUBMIT_HOUR_UTC and last_submitted != now.date():
+                    last_submitted = now.date()
+                    await self.openai_news.submit_batch_job(NEWS_BATCH_DAYS)
+                await asyncio.sleep(NEWS_BATCH_POLL_MINUTES * 60)
+            except asyncio.CancelledError:
+                logger.info("News batch worker cancelled")
+                break
             except Exception as e:
-                logger.error(f"Failed to resend message: {e}")
-                self._failed_messages.append(msg)
+                logger.error(f"News batch worker error: {e}", exc_info=True)
+                await asyncio.sleep(NEWS_BATCH_POLL_MINUTES * 60)
 
     async def send_message(self, chat_id: Union[int, str], text: str, reply_markup: Optional[InlineKeyboardMarkup] = None, disable_web_page_preview: bool = False, parse_mode: Optional[str] = None) -> None:
+        """Send a message, paced by the broadcaster's global and per-chat rate limits"""
+        await self.broadcaster.send(
+            chat_id,
+            text,
+            reply_markup=reply_markup,
+            disable_web_page_preview=disable_web_page_preview,
+            parse_mode=parse_mode
+        )
+
+    async def _deliver_message(self, chat_id: Union[int, str], text: str, reply_markup: Optional[InlineKeyboardMarkup] = None, disable_web_page_preview: bool = False, parse_mode: Optional[str] = None, queue_on_failure: bool = True) -> None:
+        """Deliver a single message to Telegram; flood control is handled by the broadcaster
+
+        Messages that still fail after the immediate retries, or that stay
+        flood-controlled after the broadcaster's retries, are put on the
+        durable outbound queue unless queue_on_failure is False.
+        """
         max_retries = 3
         base_delay = 1.0
 
-        # Calculate delay based on message length
-        message_length = len(text)
-        adaptive_delay = min(2.0 + (message_length / 1000), 5.0)  # Max 5 second delay for very long messages
-
         for attempt in range(max_retries):
             try:
                 await self.application.bot.send_message(
@@ -2011,47 +2149,52 @@ class MintosBot:
                     reply_markup=reply_markup,
                     disable_web_page_preview=disable_web_page_preview
                 )
-                logger.debug(f"Message sent successfully to {chat_id} (length: {message_length} chars)")
-
-                # Apply adaptive delay based on message size and previous success
-                delay = adaptive_delay * (0.8 if attempt == 0 else 1.2)
-                logger.debug(f"Waiting {delay:.1f}s before next message")
-                await asyncio.sleep(delay)
+                logger.debug(f"Message sent successfully to {chat_id} (length: {len(text)} chars)")
                 return
 
-            except RetryAfter as e:
-                delay = e.retry_after + 1  # Add 1 second buffer
-                logger.warning(f"Rate limit hit, waiting {delay} seconds before retry")
-                await asyncio.sleep(delay)
-                continue
+            except RetryAfter:
+                raise
 
             except Forbidden as e:
                 logger.error(f"Bot was blocked by user {chat_id}: {e}")
-                await self.user_manager.remove_user(str(chat_id))
+                self.user_manager.remove_user(str(chat_id))
                 raise
 
             except BadRequest as e:
                 if "chat not found" in str(e).lower():
                     logger.error(f"Chat {chat_id} not found, removing user")
-                    await self.user_manager.remove_user(str(chat_id))
+                    self.user_manager.remove_user(str(chat_id))
                 raise
 
             except TelegramError as e:
                 if attempt == max_retries - 1:
                     logger.error(f"Error sending message to {chat_id}: {e}", exc_info=True)
-                    # Store failed message for later retry
-                    self._failed_messages.append({
-                        'chat_id': chat_id,
-                        'text': text,
-                        'reply_markup': reply_markup,
-                        'parse_mode': parse_mode,
-                        'disable_web_page_preview': disable_web_page_preview
-                    })
+                    self._queue_failed_message(chat_id, text, e, reply_markup=reply_markup,
+                                               disable_web_page_preview=disable_web_page_preview,
+                                               parse_mode=parse_mode, queue_on_failure=queue_on_failure)
                     raise
                 delay = base_delay * (2 ** attempt)  # Exponential backoff
                 logger.warning(f"Telegram error, retrying in {delay} seconds: {e}")
                 await asyncio.sleep(delay)
 
+    def _queue_failed_message(self, chat_id: Union[int, str], text: str, error: Exception, reply_markup: Optional[InlineKeyboardMarkup] = None, disable_web_page_preview: bool = False, parse_mode: Optional[str] = None, queue_on_failure: bool = True) -> None:
+        """Store a message that could not be delivered for durable redelivery"""
+        if not queue_on_failure:
+            return
+        self.outbound_queue.enqueue(
+            chat_id,
+            text,
+            reply_markup=reply_markup.to_dict() if reply_markup else None,
+            parse_mode=parse_mode,
+            disable_web_page_preview=disable_web_page_preview,
+            error=str(error)
+        )
+
+    def _users_with_preference(self, notification_type: str, users: Optional[List[str]] = None) -> List[str]:
+        """Get users who have a notification type enabled"""
+        users = self.user_manager.get_all_users() if users is None else users
+        return [user_id for user_id in users if self.user_manager.get_notification_preference(user_id, notification_type)]
+
     def format_update_message(self, update: Dict[str, Any]) -> str:
         """Format update message with rich information from Mintos API"""
         logger.debug(f"Formatting update message for: {update.get('company_name')}")
@@ -2104,6 +2247,22 @@ class MintosBot:
             if timeline:
                 message += f"📆 Expected Recovery Timeline: {timeline}\n"
 
+        change_lines = []
+        for change in update.get('changes', []):
+            try:
+                if change['type'] == RECOVERED_AMOUNT_UP:
+                    change_lines.append(f"└ Recovered: €{round(float(change['old'])):,} → <b>€{round(float(change['new'])):,}</b>")
+                elif change['type'] == REMAINING_AMOUNT_DOWN:
+                    change_lines.append(f"└ Remaining: €{round(float(change['old'])):,} → <b>€{round(float(change['new'])):,}</b>")
+                elif change['type'] == STATUS_CHANGE and change.get('old'):
+                    old_status = change['old'].replace('_', ' ').title()
+                    new_status = (change.get('new') or '').replace('_', ' ').title()
+                    change_lines.append(f"└ Status: {old_status} → <b>{new_status}</b>")
+            except (KeyError, TypeError, ValueError):
+                continue
+        if change_lines:
+            message += "\n🔄 <b>Changes:</b>\n" + "\n".join(change_lines) + "\n"
+
         if 'description' in update:
             description = update['description']
             # Clean HTML tags and entities
@@ -2434,7 +2593,12 @@ class MintosBot:
 
         return message.strip()
 
-    async def check_updates(self) -> None:
+    async def check_updates(self, lender_ids: Optional[List[int]] = None) -> None:
+        """Check lenders for new recovery updates and notify users
+
+        Args:
+            lender_ids: Lenders to check, or None for a full sweep of all lenders
+        """
         try:
             now = datetime.now()
             logger.info(f"Starting update check at {now.strftime('%Y-%m-%d %H:%M:%S')}...")
@@ -2453,17 +2617,24 @@ class MintosBot:
             logger.info(f"Loaded {len(previous_updates)} previous updates")
 
             # Fetch new updates
-            lender_ids = [int(id) for id in self.data_manager.company_names.keys()]
+            full_sweep = lender_ids is None
+            if full_sweep:
+                lender_ids = [int(id) for id in self.data_manager.company_names.keys()]
             logger.info(f"Fetching updates for {len(lender_ids)} lender IDs")
-            new_updates = self.mintos_client.fetch_all_updates(lender_ids)
-            logger.info(f"Fetched {len(new_updates)} new updates from API")
+            validators = self.data_manager.update_validators
+            validators.begin_sweep(previous_updates)
+            new_updates = await self.mintos_client.fetch_all_updates(lender_ids, validators=validators)
+            logger.info(f"Fetched {len(new_updates)} new updates from API ({len(validators.unchanged)} unchanged)")
+            self.poll_scheduler.record_results(lender_ids, new_updates)
 
             # Ensure both lists are of the correct type
             previous_updates = cast(List[CompanyUpdate], previous_updates)
             new_updates = cast(List[CompanyUpdate], new_updates)
 
-            # Compare updates
-            added_updates = self.data_manager.compare_updates(new_updates, previous_updates)
+            # Compare updates, skipping lenders confirmed unchanged
+            added_updates = self.data_manager.compare_updates(
+                new_updates, previous_updates, unchanged_lenders=validators.unchanged
+            )
             logger.info(f"Found {len(added_updates)} new updates after comparison")
 
             if added_updates:
@@ -2484,20 +2655,16 @@ class MintosBot:
                     logger.info(f"Found {len(unsent_updates)} unsent updates for today")
 
                     if unsent_updates:
-                        # Send each individual update to all users
-                        logger.info(f"Broadcasting {len(unsent_updates)} unsent updates to {len(users)} users")
+                        # Send each individual update to all users with recovery updates enabled
+                        recipients = self._users_with_preference('recovery_updates', users)
+                        logger.info(f"Broadcasting {len(unsent_updates)} unsent updates to {len(recipients)} of {len(users)} users")
                         for i, update in enumerate(unsent_updates):
                             message = self.format_update_message(update)
-                            for user_id in users:
-                                # Check if user has recovery updates notifications enabled
-                                if self.user_manager.get_notification_preference(user_id, 'recovery_updates'):
-                                    try:
-                                        await self.send_message(user_id, message, disable_web_page_preview=True)
-                                        logger.info(f"Successfully sent update {i+1}/{len(unsent_updates)} to user {user_id}")
-                                    except Exception as e:
-                                        logger.error(f"Failed to send update to user {user_id}: {e}")
-                                else:
-                                    logger.debug(f"Skipping recovery update for user {user_id} - notifications disabled")
+                            await self.broadcaster.broadcast(
+                                recipients, message,
+                                description=f"update {i+1}/{len(unsent_updates)}",
+                                disable_web_page_preview=True
+                            )
                             
                             # Mark as sent after broadcasting to all users
                             self.data_manager.save_sent_update(update)
@@ -2506,10 +2673,18 @@ class MintosBot:
                 else:
                     logger.info(f"No new updates found for today ({today})")
 
-            # Save updates to file
+            # Save updates to file, keeping cached entries for lenders not polled this round
+            if not full_sweep:
+                fetched = {str(update.get('lender_id')) for update in new_updates}
+                new_updates = [
+                    update for update in previous_updates
+                    if str(update.get('lender_id')) not in fetched
+                ] + new_updates
+            before_size = os.path.getsize(UPDATES_FILE) if os.path.exists(UPDATES_FILE) else 0
+            # Validators are applied only once the updates they describe are stored
+            self.data_manager.save_updates(new_updates)
+            validators.save()
             try:
-                before_size = os.path.getsize(UPDATES_FILE) if os.path.exists(UPDATES_FILE) else 0
-                self.data_manager.save_updates(new_updates)
                 after_size = os.path.getsize(UPDATES_FILE) if os.path.exists(UPDATES_FILE) else 0
 
                 # Check if the file was actually updated
@@ -2528,11 +2703,14 @@ class MintosBot:
 
         except Exception as e:
             logger.error(f"Error during update check: {e}", exc_info=True)
-            for user_id in self.user_manager.get_all_users():
-                try:
-                    await self.send_message(user_id, "⚠️ Error occurred while checking for updates", disable_web_page_preview=True)
-                except Exception as nested_e:
-                    logger.error(f"Failed to send error notification to user {user_id}: {nested_e}")
+            self.data_manager.update_validators.discard()
+            # Only the admin is told; the scheduler backs off on the re-raised error
+            admin_id = 114691530  # Hardcoded admin ID
+            try:
+                await self.send_message(admin_id, "⚠️ Error occurred while checking for updates", disable_web_page_preview=True)
+            except Exception as nested_e:
+                logger.error(f"Failed to send error notification to admin {admin_id}: {nested_e}")
+            raise
 
 
     async def check_campaigns(self) -> None:
@@ -2617,11 +2795,12 @@ class MintosBot:
 
         except Exception as e:
             logger.error(f"Error during campaign check: {e}", exc_info=True)
-            for user_id in self.user_manager.get_all_users():
-                try:
-                    await self.send_message(user_id, "⚠️ Error occurred while checking for campaigns", disable_web_page_preview=True)
-                except Exception as nested_e:
-                    logger.error(f"Failed to send campaign error notification to user {user_id}: {nested_e}")
+            await self.broadcaster.broadcast(
+                self.user_manager.get_all_users(),
+                "⚠️ Error occurred while checking for campaigns",
+                description="campaign error notification",
+                disable_web_page_preview=True
+            )
 
     async def check_documents(self) -> None:
         """Check for document updates from loan originators"""
@@ -2676,30 +2855,16 @@ class MintosBot:
             
             logger.info(f"Found {len(unsent_documents)} unsent documents of {len(added_documents)} total")
             
-            # Send each unsent document to all users
+            # Send each unsent document to all users with document notifications enabled
+            recipients = self._users_with_preference('documents', users)
             for document in unsent_documents:
                 message = self.format_document_message(document)
-                sent_to_users = 0
-                
-                # Send to all users
-                for chat_id in users:
-                    # Check if user has document notifications enabled
-                    if self.user_manager.get_notification_preference(chat_id, 'documents'):
-                        try:
-                            await self.send_message(chat_id, message, disable_web_page_preview=True)
-                            sent_to_users += 1
-                            logger.info(f"Sent document notification for {document.get('company_name')} to {chat_id}")
-                        except Exception as e:
-                            logger.error(f"Error sending document update to {chat_id}: {e}")
-                            # Add to failed messages for retry
-                            self._failed_messages.append({
-                                'chat_id': chat_id,
-                                'text': message,
-                                'parse_mode': 'HTML',
-                                'disable_web_page_preview': True
-                            })
-                    else:
-                        logger.debug(f"Skipping document for user {chat_id} - notifications disabled")
+                result = await self.broadcaster.broadcast(
+                    recipients, message,
+                    description=f"document for {document.get('company_name')}",
+                    disable_web_page_preview=True
+                )
+                sent_to_users = len(result.sent)
                 
                 # Mark as sent after trying to send to all users
                 self.document_scraper.save_sent_document(document)
@@ -2716,11 +2881,12 @@ class MintosBot:
                 
         except Exception as e:
             logger.error(f"Error during document check: {e}", exc_info=True)
-            for user_id in self.user_manager.get_all_users():
-                try:
-                    await self.send_message(user_id, "⚠️ Error occurred while checking for documents", disable_web_page_preview=True)
-                except Exception as nested_e:
-                    logger.error(f"Failed to send document error notification to user {user_id}: {nested_e}")
+            await self.broadcaster.broadcast(
+                self.user_manager.get_all_users(),
+                "⚠️ Error occurred while checking for documents",
+                description="document error notification",
+                disable_web_page_preview=True
+            )
     
     def format_document_message(self, document: Dict[str, Any]) -> str:
         """Format document message with rich information and consistent styling"""
@@ -2838,8 +3004,8 @@ class MintosBot:
                 )
                 return  # Exit and wait for callback
 
-            updates = self.data_manager.load_previous_updates()
-            if not updates:
+            update_index = self.data_manager.update_index
+            if not update_index.lenders:
                 logger.warning("No updates found in cache")
                 await self.send_message(chat_id, "No cached updates found. Try using the admin refresh option.", disable_web_page_preview=True)
                 return
@@ -2848,46 +3014,8 @@ class MintosBot:
             cache_age = self.data_manager.get_cache_age()
             logger.debug(f"Using cached data (age: {cache_age:.0f} seconds)")
 
-            logger.debug(f"Searching for updates on date: {target_date}")
-            date_updates = []
-
-            for company_update in updates:
-                if not isinstance(company_update, dict):
-                    logger.warning(f"Invalid update format: {type(company_update)}")
-                    continue
-
-                if "items" not in company_update:
-                    logger.warning(f"No 'items' in company update: {company_update.keys()}")
-                    continue
-
-                lender_id = company_update.get('lender_id')
-                if not lender_id:
-                    logger.warning("Missing lender_id in company update")
-                    continue
-
-                company_name = self.data_manager.get_company_name(lender_id)
-                logger.debug(f"Processing updates for company: {company_name} (ID: {lender_id})")
-
-                for year_data in company_update["items"]:
-                    if not isinstance(year_data, dict):
-                        logger.warning(f"Invalid year_data format: {type(year_data)}")
-                        continue
-
-                    items = year_data.get("items", [])
-                    if not isinstance(items, list):
-                        logger.warning(f"Invalid items format: {type(items)}")
-                        continue
-
-                    for item in items:
-                        if item.get('date') == target_date:
-                            update_with_company = {
-                                "lender_id": lender_id,
-                                "company_name": company_name,
-                                **year_data,
-                                **item
-                            }
-                            date_updates.append(update_with_company)
-                            logger.debug(f"Found update for {company_name} on {target_date}")
+            logger.debug(f"Looking up updates for date: {target_date}")
+            date_updates = update_index.for_date(target_date)
 
             # Check if we have any updates
             have_updates = len(date_updates) > 0
@@ -2963,47 +3091,6 @@ class MintosBot:
                 await self.send_message(chat_id, "⚠️ Error getting updates. Please try again.", disable_web_page_preview=True)
             raise
 
-    async def should_check_updates(self) -> bool:
-        """Check if updates should be checked based on current time"""
-        now = datetime.now()
-        # Enhanced logging of server time
-        logger.debug(f"Current server time: {now.strftime('%Y-%m-%d %H:%M:%S')} (weekday: {now.weekday()}, hour: {now.hour})")
-
-        # Schedule updates for working days (Monday = 0, Sunday = 6)
-        # at specific hours (15:00, 16:00, 1700 UTC)
-        is_scheduled_time = (
-            now.weekday() < 5 and  # Monday to Friday
-            now.hour in [15, 16, 17]  # 3 PM, 4 PM, 5 PM UTC
-        )
-
-        # By default, check based on schedule
-        should_check = is_scheduled_time
-
-        # Add a recovery mechanism for missed updates
-        try:
-            # Check for stale cache on weekdays
-            if os.path.exists(UPDATES_FILE):
-                cache_age_hours = self.data_manager.get_cache_age() / 3600
-                logger.debug(f"Cache file age: {cache_age_hours:.1f} hours")
-
-                # If cache is more than 24 hours old on a weekday, log a warning and trigger an update
-                if cache_age_hours > 24 and now.weekday() < 5:
-                    logger.warning(f"Cache file is {cache_age_hours:.1f} hours old on a weekday - may indicate missed updates")
-
-                    # Force an update during business hours even if outside scheduled update times
-                    # This helps recover from missed updates
-                    if 9 <= now.hour <= 18:  # Business hours (9 AM to 6 PM)
-                        logger.info("Forcing update check due to stale cache during business hours")
-                        should_check = True
-        except Exception as e:
-            logger.error(f"Error checking cache file status: {e}")
-
-        if not should_check:
-            logger.debug(f"Skipping updatecheck - outside scheduled hours (weekday: {now.weekday()}, hour: {now.hour})")
-        else:
-            logger.info(f"Update check scheduled for current time: {now.strftime('%Y-%m-%d %H:%M:%S')}")
-        return should_check
-
     # Dictionary to track last refresh command usage per user
     _refresh_cooldowns = {}
     _refresh_cooldown_minutes = 10
@@ -3204,17 +3291,14 @@ class MintosBot:
                         # Send to all users
                         for i, campaign in enumerate(unsent_campaigns, 1):
                             message = self.format_campaign_message(campaign)
-                            for user_id in users:
-                                try:
-                                    await self.send_message(user_id, message, disable_web_page_preview=True)
-                                    # Mark as sent to prevent duplicate notifications
-                                    self.data_manager.save_sent_campaign(campaign)
-                                    logger.info(f"Successfully sent campaign {i}/{len(unsent_campaigns)} to user {user_id}")
-                                except Exception as e:
-                                    logger.error(f"Failed to send campaign to user {user_id}: {e}")
-                                    
-                            # Add a delay between campaigns
-                            await asyncio.sleep(1)
+                            result = await self.broadcaster.broadcast(
+                                users, message,
+                                description=f"campaign {i}/{len(unsent_campaigns)}",
+                                disable_web_page_preview=True
+                            )
+                            if result.sent:
+                                # Mark as sent to prevent duplicate notifications
+                                self.data_manager.save_sent_campaign(campaign)
                     
             except Exception as e:
                 logger.error(f"Error fetching campaigns: {e}")
@@ -3587,25 +3671,7 @@ class MintosBot:
 
             # Retrieve updates for the target date
             logger.info(f"Getting updates for {date_desc}")
-            updates = self.data_manager.load_previous_updates()
-            date_updates = []
-
-            # Process updates
-            for company_update in updates:
-                if "items" in company_update:
-                    lender_id = company_update.get('lender_id')
-                    company_name = self.data_manager.get_company_name(lender_id)
-
-                    for year_data in company_update["items"]:
-                        for item in year_data.get("items", []):
-                            if item.get('date') == date_to_check:
-                                update_with_company = {
-                                    "lender_id": lender_id,
-                                    "company_name": company_name,
-                                    **year_data,
-                                    **item
-                                }
-                                date_updates.append(update_with_company)
+            date_updates = self.data_manager.update_index.for_date(date_to_check)
 
             logger.info(f"Found {len(date_updates)} updates for {date_desc}")
 
@@ -3794,6 +3860,30 @@ class MintosBot:
             logger.error(f"Error executing news send: {e}")
             await query.edit_message_text(f"❌ Error sending news: {str(e)}")
 
+    async def _broadcast_news_items(self, users: List[str], news_items: List[Any], include_sent: bool = False) -> tuple:
+        """Broadcast news items to users, skipping items a user already received unless include_sent
+
+        Returns:
+            Tuple of (users reached, total messages sent)
+        """
+        sent_per_user: Dict[str, int] = {}
+        for item in news_items:
+            recipients = [
+                user_id for user_id in users
+                if include_sent or not self.openai_news.is_item_sent(user_id, item.url)
+            ]
+            message = self.openai_news.format_news_message(item)
+            result = await self.broadcaster.broadcast(
+                recipients, message,
+                description="news item",
+                disable_web_page_preview=True
+            )
+            for user_id in result.sent:
+                if not include_sent:  # Only mark as sent if we're tracking
+                    self.openai_news.mark_item_sent(user_id, item.url)
+                sent_per_user[user_id] = sent_per_user.get(user_id, 0) + 1
+        return len(sent_per_user), sum(sent_per_user.values())
+
     async def _send_news_to_all_users_configured(self, query, news_items, days, include_sent):
         """Send news to all registered users with configured parameters"""
         users = self.user_manager.get_all_users()
@@ -3802,35 +3892,12 @@ class MintosBot:
             await query.edit_message_text("⚠️ No registered users found.")
             return
         
-        sent_count = 0
-        total_messages = 0
-        
         await query.edit_message_text(
             f"📤 Sending {len(news_items)} news items to {len(users)} users...",
             parse_mode='HTML'
         )
         
-        for user_id in users:
-            user_sent = 0
-            for item in news_items:
-                should_send = include_sent or not self.openai_news.is_item_sent(user_id, item.url)
-                
-                if should_send:
-                    try:
-                        message = self.openai_news.format_news_message(item)
-                        await self.send_message(user_id, message, disable_web_page_preview=True)
-                        
-                        if not include_sent:  # Only mark as sent if we're tracking
-                            self.openai_news.mark_item_sent(user_id, item.url)
-                        
-                        user_sent += 1
-                        await asyncio.sleep(0.5)
-                    except Exception as e:
-                        logger.error(f"Error sending news to user {user_id}: {e}")
-            
-            if user_sent > 0:
-                sent_count += 1
-                total_messages += user_sent
+        sent_count, total_messages = await self._broadcast_news_items(users, news_items, include_sent)
         
         status_text = "✅" if sent_count > 0 else "ℹ️"
         result_text = f"{status_text} <b>Send Complete</b>\n\n"
@@ -3850,36 +3917,13 @@ class MintosBot:
             await query.edit_message_text("⚠️ No registered users found.")
             return
         
-        sent_count = 0
-        total_messages = 0
-        
         await query.edit_message_text(
             f"📤 Sending {len(news_items)} news items to {len(users)} users...",
             parse_mode='HTML',
             disable_web_page_preview=True
         )
         
-        for user_id in users:
-            user_sent = 0
-            for item in news_items:
-                should_send = include_sent or not self.openai_news.is_item_sent(user_id, item.url)
-                
-                if should_send:
-                    try:
-                        message = self.openai_news.format_news_message(item)
-                        await self.send_message(user_id, message, disable_web_page_preview=True)
-                        
-                        if not include_sent:  # Only mark as sent if we're tracking
-                            self.openai_news.mark_item_sent(user_id, item.url)
-                        
-                        user_sent += 1
-                        await asyncio.sleep(0.5)
-                    except Exception as e:
-                        logger.error(f"Error sending news to user {user_id}: {e}")
-            
-            if user_sent > 0:
-                sent_count += 1
-                total_messages += user_sent
+        sent_count, total_messages = await self._broadcast_news_items(users, news_items, include_sent)
         
         status_text = "✅" if sent_count > 0 else "ℹ️"
         result_text = f"{status_text} <b>Send Complete</b>\n\n"
@@ -4343,6 +4387,7 @@ class MintosBot:
             new_items = await self.rss_reader.check_and_get_new_items()
             if not new_items:
                 logger.info("No new RSS items found")
+                self.rss_reader.commit_feed_validators()
                 return
 
             logger.info(f"Found {len(new_items)} new RSS items")
@@ -4369,26 +4414,24 @@ class MintosBot:
                 # Send each item to subscribed users
                 for item in items:
                     message = self.rss_reader.format_rss_message(item)
-                    
-                    for chat_id in feed_users:
-                        try:
-                            await self.send_message(
-                                chat_id,
-                                message,
-                                parse_mode='HTML',
-                                disable_web_page_preview=True
-                            )
-                            await asyncio.sleep(0.1)  # Rate limiting
-                        except Exception as e:
-                            logger.error(f"Error sending {feed_source} RSS notification to {chat_id}: {e}")
-                            if "bot was blocked" in str(e).lower():
-                                self.user_manager.remove_user(chat_id)
+                    await self.broadcaster.broadcast(
+                        feed_users, message,
+                        description=f"{feed_source} RSS item",
+                        parse_mode='HTML',
+                        disable_web_page_preview=True
+                    )
 
                     # Mark item as sent after sending to all subscribed users
                     self.rss_reader.mark_item_as_sent(item)
 
+            # Advance the feed validators only once every item is marked sent
+            self.rss_reader.save_sent_items()
+            self.rss_reader.commit_feed_validators()
+
         except Exception as e:
             logger.error(f"Error checking RSS updates: {e}", exc_info=True)
+        finally:
+            self.rss_reader.save_sent_items()
 
     async def should_check_rss(self) -> bool:
         """Check if RSS updates should be checked based on current time"""
@@ -4482,19 +4525,13 @@ class MintosBot:
                     self.data_manager.remove_pending_campaign(campaign_id)
                     continue
                     
-                # Send to non-admin users
+                # Send to non-admin users with campaign notifications enabled
                 message = self.format_campaign_message(campaign)
-                
-                for user_id in non_admin_users:
-                    # Check if user has campaign notifications enabled
-                    if self.user_manager.get_notification_preference(user_id, 'campaigns'):
-                        try:
-                            await self.send_message(user_id, message, disable_web_page_preview=True)
-                            logger.info(f"Sent delayed campaign {campaign_id} to user {user_id}")
-                        except Exception as e:
-                            logger.error(f"Failed to send delayed campaign to user {user_id}: {e}")
-                    else:
-                        logger.debug(f"Skipping campaign for user {user_id} - notifications disabled")
+                await self.broadcaster.broadcast(
+                    self._users_with_preference('campaigns', non_admin_users), message,
+                    description=f"delayed campaign {campaign_id}",
+                    disable_web_page_preview=True
+                )
                 
                 # Remove from pending list and mark as sent
                 self.data_manager.remove_pending_campaign(campaign_id)
@@ -4606,8 +4643,8 @@ class MintosBot:
     async def _show_rss_feed_selection(self, query) -> None:
         """Show RSS feed selection for admin"""
         try:
-            # Force fetch all RSS items and apply filtering
-            all_rss_items = await self.rss_reader.fetch_all_rss_feeds_force()
+            # Fresh fetch when the flow starts; the following steps reuse it so item indexes match
+            all_rss_items = await self.rss_reader.fetch_all_rss_feeds_force(refresh=True)
             
             if not all_rss_items:
                 await query.edit_message_text(
@@ -4864,21 +4901,13 @@ class MintosBot:
             users = self.user_manager.get_all_users()
             message = self.rss_reader.format_rss_message(selected_item)
             
-            successful_sends = 0
-            for user_id in users:
-                try:
-                    await self.send_message(
-                        chat_id=user_id,
-                        text=message,
-                        parse_mode='HTML',
-                        disable_web_page_preview=True
-                    )
-                    successful_sends += 1
-                    await asyncio.sleep(0.1)  # Rate limiting
-                except Exception as e:
-                    logger.error(f"Error sending RSS to user {user_id}: {e}")
-                    if "bot was blocked" in str(e).lower():
-                        self.user_manager.remove_user(user_id)
+            result = await self.broadcaster.broadcast(
+                users, message,
+                description="RSS item",
+                parse_mode='HTML',
+                disable_web_page_preview=True
+            )
+            successful_sends = len(result.sent)
             
             # Add back button
             keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
@@ -0,0 +1,139 @@
+"""
+Update Diff for the Mintos Telegram Bot
+Incrementally diffs recovery-update snapshots: lenders are compared by a
+content hash first and only lenders whose hash changed are expanded into
+typed, field-level changes.
+"""
+import hashlib
+import json
+import logging
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Key under which a lender entry's content hash is stored in the updates cache
+CONTENT_HASH_KEY = 'content_hash'
+
+# Change types
+NEW_ITEM = 'new_item'
+RECOVERED_AMOUNT_UP = 'recovered_amount_up'
+REMAINING_AMOUNT_DOWN = 'remaining_amount_down'
+STATUS_CHANGE = 'status_change'
+MODIFIED = 'modified'
+
+# Fields whose other changes (e.g. a corrected description) still count as modifications
+SIGNIFICANT_FIELDS = ['description', 'date', 'recoveredAmount', 'remainingAmount']
+
+def lender_hash(update: Dict[str, Any]) -> str:
+    """Hash the update items of a lender entry"""
+    payload = json.dumps(update.get('items') or [], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def stored_hash(update: Dict[str, Any]) -> str:
+    """Get a lender entry's content hash, computing and storing it if missing"""
+    content_hash = update.get(CONTENT_HASH_KEY)
+    if not content_hash:
+        content_hash = lender_hash(update)
+        update[CONTENT_HASH_KEY] = content_hash
+    return content_hash
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def _index_items(update: Dict[str, Any]) -> Dict[Tuple[Any, str], Dict[str, Any]]:
+    """Map (year, date) to a flattened item carrying its year's status fields"""
+    indexed = {}
+    for year_data in update.get('items') or []:
+        year = year_data.get('year')
+        for item in year_data.get('items') or []:
+            indexed[(year, item.get('date', ''))] = {
+                'year': year,
+                'status': year_data.get('status'),
+                'substatus': year_data.get('substatus'),
+                **item
+            }
+    return indexed
+
+def item_changes(new_item: Dict[str, Any], old_item: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Get typed field-level changes between two versions of an update item"""
+    if old_item is None:
+        return [{'type': NEW_ITEM}]
+
+    changes = []
+    handled = set()
+
+    old_recovered = _to_float(old_item.get('recoveredAmount'))
+    new_recovered = _to_float(new_item.get('recoveredAmount'))
+    if old_recovered is not None and new_recovered is not None and new_recovered > old_recovered:
+        changes.append({'type': RECOVERED_AMOUNT_UP, 'field': 'recoveredAmount',
+                        'old': old_item.get('recoveredAmount'), 'new': new_item.get('recoveredAmount')})
+        handled.add('recoveredAmount')
+
+    old_remaining = _to_float(old_item.get('remainingAmount'))
+    new_remaining = _to_float(new_item.get('remainingAmount'))
+    if old_remaining is not None and new_remaining is not None and new_remaining < old_remaining:
+        changes.append({'type': REMAINING_AMOUNT_DOWN, 'field': 'remainingAmount',
+                        'old': old_item.get('remainingAmount'), 'new': new_item.get('remainingAmount')})
+        handled.add('remainingAmount')
+
+    if old_item.get('status') != new_item.get('status'):
+        changes.append({'type': STATUS_CHANGE, 'field': 'status',
+                        'old': old_item.get('status'), 'new': new_item.get('status')})
+
+    for field in SIGNIFICANT_FIELDS:
+        if field not in handled and old_item.get(field) != new_item.get(field):
+            changes.append({'type': MODIFIED, 'field': field,
+                            'old': old_item.get(field), 'new': new_item.get(field)})
+    return changes
+
+def diff_updates(new_updates: List[Dict[str, Any]], previous_updates: List[Dict[str, Any]],
+                 company_name_resolver: Callable[[Any], str],
+                 unchanged_lenders: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+    """Find new or changed update items between two snapshots
+
+    Each returned item is flattened with its lender, year fields and company
+    name, plus a ``changes`` list of typed field-level changes. New entries
+    get their content hash stored so the next diff can skip them cheaply.
+    """
+    unchanged_lenders = unchanged_lenders or set()
+    previous_by_lender = {
+        str(update.get('lender_id')): update
+        for update in previous_updates
+        if isinstance(update, dict) and 'items' in update
+    }
+
+    added_updates = []
+    expanded = 0
+    for update in new_updates:
+        if 'items' not in update:
+            continue
+        lender_id = update.get('lender_id')
+        key = str(lender_id)
+        previous = previous_by_lender.get(key)
+        if key in unchanged_lenders:
+            if previous and previous.get(CONTENT_HASH_KEY):
+                update.setdefault(CONTENT_HASH_KEY, previous[CONTENT_HASH_KEY])
+            continue
+
+        update[CONTENT_HASH_KEY] = lender_hash(update)
+        if previous is not None and stored_hash(previous) == update[CONTENT_HASH_KEY]:
+            continue
+
+        expanded += 1
+        company_name = company_name_resolver(lender_id)
+        previous_items = _index_items(previous) if previous else {}
+        for item_key, item in _index_items(update).items():
+            changes = item_changes(item, previous_items.get(item_key))
+            if changes:
+                added_updates.append({
+                    'lender_id': lender_id,
+                    'company_name': company_name,
+                    **item,
+                    'changes': changes
+                })
+
+    logger.debug(f"Expanded {expanded} of {len(new_updates)} lenders with changed content")
+    return added_updates
@@ -0,0 +1,121 @@
+"""
+Update Index for the Mintos Telegram Bot
+Flattens the cached lender -> year -> items tree into update records with
+secondary indexes by date and by lender, so date and company views become
+lookups instead of full scans of the cache.
+"""
+import bisect
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class UpdateIndex:
+    """In-memory flattened view of the recovery-updates cache
+
+    Each record merges a year entry's fields (without its nested items) with
+    one update item, plus ``lender_id`` and ``company_name``, which is the
+    shape ``format_update_message`` expects.
+    """
+
+    def __init__(self, company_name_resolver: Optional[Callable[[Any], str]] = None):
+        """Initialize an empty index
+
+        Args:
+            company_name_resolver: Maps a lender ID to its display name
+        """
+        self.company_name_resolver = company_name_resolver or str
+        self.lenders: Dict[str, Dict[str, Any]] = {}
+        self.by_lender: Dict[str, List[Dict[str, Any]]] = {}
+        self.by_date: Dict[str, List[Dict[str, Any]]] = {}
+        self.dates: List[str] = []
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self.by_lender.values())
+
+    def _flatten(self, update: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Flatten one lender entry into records, newest first"""
+        lender_id = update.get('lender_id')
+        company_name = self.company_name_resolver(lender_id)
+        records = []
+        for year_data in update.get('items') or []:
+            if not isinstance(year_data, dict):
+                continue
+            year_fields = {key: value for key, value in year_data.items() if key != 'items'}
+            for item in year_data.get('items') or []:
+                if not isinstance(item, dict):
+                    continue
+                records.append({
+                    'lender_id': lender_id,
+                    'company_name': company_name,
+                    **year_fields,
+                    **item
+                })
+        records.sort(key=lambda record: (record.get('year') or 0, record.get('date') or ''), reverse=True)
+        return records
+
+    def _add_lender(self, update: Dict[str, Any]) -> None:
+        key = str(update.get('lender_id'))
+        records = self._flatten(update)
+        self.lenders[key] = update
+        self.by_lender[key] = records
+        for record in records:
+            date = record.get('date')
+            if not date:
+                continue
+            if date not in self.by_date:
+                self.by_date[date] = []
+                bisect.insort(self.dates, date)
+            self.by_date[date].append(record)
+
+    def _remove_lender(self, key: str) -> None:
+        self.lenders.pop(key, None)
+        for record in self.by_lender.pop(key, []):
+            date = record.get('date')
+            date_records = self.by_date.get(date)
+            if date_records is None:
+                continue
+            date_records[:] = [r for r in date_records if str(r.get('lender_id')) != key]
+            if not date_records:
+                del self.by_date[date]
+                self.dates.pop(bisect.bisect_left(self.dates, date))
+
+    def rebuild(self, updates: List[Dict[str, Any]]) -> None:
+        """Rebuild the index from the full updates cache"""
+        self.lenders = {}
+        self.by_lender = {}
+        self.by_date = {}
+        self.dates = []
+        for update in updates:
+            if isinstance(update, dict) and update.get('lender_id') is not None and 'items' in update:
+                self._add_lender(update)
+        logger.debug(f"Indexed {len(self)} updates for {len(self.lenders)} lenders across {len(self.dates)} dates")
+
+    def update_lender(self, update: Dict[str, Any]) -> None:
+        """Replace the indexed records of a single lender"""
+        self._remove_lender(str(update.get('lender_id')))
+        if 'items' in update:
+            self._add_lender(update)
+
+    def for_date(self, date: str) -> List[Dict[str, Any]]:
+        """Get all update records dated YYYY-MM-DD"""
+        return list(self.by_date.get(date, []))
+
+    def between(self, start: str, end: str) -> List[Dict[str, Any]]:
+        """Get all update records dated within [start, end], oldest date first"""
+        low = bisect.bisect_left(self.dates, start)
+        high = bisect.bisect_right(self.dates, end)
+        return [record for date in self.dates[low:high] for record in self.by_date[date]]
+
+    def for_lender(self, lender_id: Any) -> List[Dict[str, Any]]:
+        """Get all update records of a lender, newest first"""
+        return list(self.by_lender.get(str(lender_id), []))
+
+    def latest_for_lender(self, lender_id: Any) -> Optional[Dict[str, Any]]:
+        """Get the newest update record of a lender"""
+        records = self.by_lender.get(str(lender_id))
+        return records[0] if records else None
+
+    def lender_entry(self, lender_id: Any) -> Optional[Dict[str, Any]]:
+        """Get the raw cached entry of a lender"""
+        return self.lenders.get(str(lender_id))
@@ -0,0 +1,102 @@
+"""
+Update Validator Store for the Mintos Telegram Bot
+Persists per-lender HTTP validators (ETag, Last-Modified, body hash) so that
+recovery-update sweeps can use conditional requests and skip unchanged lenders.
+"""
+import hashlib
+import logging
+import time
+from typing import Any, Dict, List, Optional, Set, Union
+from .base_manager import BaseManager
+from .constants import UPDATE_VALIDATORS_FILE
+
+logger = logging.getLogger(__name__)
+
+class UpdateValidatorStore(BaseManager):
+    """Per-lender validator store used for conditional recovery-update requests"""
+
+    def __init__(self, data_file: str = UPDATE_VALIDATORS_FILE):
+        """Initialize the store and load persisted validators"""
+        super().__init__(data_file, backup_enabled=False)
+        data = self.load_data({})
+        self.validators: Dict[str, Dict[str, Any]] = data if isinstance(data, dict) else {}
+        # Validators fetched this sweep, applied by save() once the updates are stored
+        self.staged: Dict[str, Dict[str, Any]] = {}
+        self.cached_entries: Dict[str, Dict[str, Any]] = {}
+        self.unchanged: Set[str] = set()
+        logger.info(f"Loaded validators for {len(self.validators)} lenders")
+
+    @staticmethod
+    def body_hash(body: bytes) -> str:
+        """Hash a raw response body"""
+        return hashlib.sha256(body).hexdigest()
+
+    def begin_sweep(self, previous_updates: List[Dict[str, Any]]) -> None:
+        """Index the cached lender entries and reset the unchanged set for a new sweep"""
+        self.cached_entries = {
+            str(update.get('lender_id')): update
+            for update in previous_updates
+            if isinstance(update, dict) and update.get('lender_id') is not None
+        }
+        self.unchanged = set()
+        self.staged = {}
+
+    def cached_entry(self, lender_id: Union[int, str]) -> Optional[Dict[str, Any]]:
+        """Get the cached entry for a lender from the previous sweep"""
+        return self.cached_entries.get(str(lender_id))
+
+    def request_headers(self, lender_id: Union[int, str]) -> Dict[str, str]:
+        """Build conditional request headers for a lender
+
+        Validators are only sent when a cached entry exists to fall back on.
+        """
+        key = str(lender_id)
+        validator = self.validators.get(key)
+        if not validator or key not in self.cached_entries:
+            return {}
+        headers = {}
+        if validator.get('etag'):
+            headers['If-None-Match'] = validator['etag']
+        if validator.get('last_modified'):
+            headers['If-Modified-Since'] = validator['last_modified']
+        return headers
+
+    def matches_body(self, lender_id: Union[int, str], body_hash: str) -> bool:
+        """Check whether a body hash matches the stored hash for a lender"""
+        key = str(lender_id)
+        validator = self.validators.get(key)
+        return bool(validator) and key in self.cached_entries and validator.get('hash') == body_hash
+
+    def record(self, lender_id: Union[int, str], etag: Optional[str],
+               last_modified: Optional[str], body_hash: str) -> None:
+        """Stage fresh validators for a lender until save()"""
+        self.staged[str(lender_id)] = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'hash': body_hash,
+            'checked_at': time.time()
+        }
+
+    def mark_unchanged(self, lender_id: Union[int, str]) -> None:
+        """Record that a lender was unchanged during the current sweep"""
+        key = str(lender_id)
+        self.unchanged.add(key)
+        if key in self.validators:
+            self.validators[key]['checked_at'] = time.time()
+
+    def discard(self) -> None:
+        """Drop the staged validators, e.g. when the fetched updates could not be stored"""
+        if self.staged:
+            logger.warning(f"Discarding validators for {len(self.staged)} lenders")
+        self.staged = {}
+
+    def save(self) -> None:
+        """Apply the staged validators and persist them to disk
+
+        Call only after the fetched updates are stored, otherwise the next
+        sweep would get 304s for changes that were never saved.
+        """
+        self.validators.update(self.staged)
+        self.staged = {}
+        if not self.save_data(self.validators):
+            logger.error("Failed to save update validators")
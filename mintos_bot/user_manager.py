@@ -1,16 +1,18 @@
-import json
 import os
 from .logger import setup_logger
-from .config import USERS_FILE, DATA_DIR
+from .config import DATA_DIR
+from .storage import get_storage
 
 logger = setup_logger(__name__)
 
 class UserManager:
     def __init__(self):
+        self.storage = get_storage()
         self.users = {}  # Changed from set to dict to store username with chat_id
-        self.rss_preferences_file = os.path.join(DATA_DIR, 'rss_user_preferences.json')
-        self.notification_preferences_file = os.path.join(DATA_DIR, 'notification_preferences.json')
-        self.user_states_file = os.path.join(DATA_DIR, 'user_states.json')
+        self.users_namespace = 'users'
+        self.rss_preferences_namespace = 'rss_user_preferences'
+        self.notification_preferences_namespace = 'notification_preferences'
+        self.user_states_namespace = 'user_states'
         self.rss_preferences = {}  # Store RSS notification preferences
         self.notification_preferences = {}  # Store other notification preferences
         self.user_states = {}  # Store user states for interactive commands
@@ -23,42 +25,22 @@ class UserManager:
     def _ensure_data_directory(self):
         """Ensure the data directory exists"""
         os.makedirs(DATA_DIR, exist_ok=True)
-        if not os.path.exists(USERS_FILE):
-            self.save_users()  # Create an empty users file if it doesn't exist
         logger.info(f"Data directory checked: {DATA_DIR}")
 
     def load_users(self):
         try:
-            if os.path.exists(USERS_FILE):
-                with open(USERS_FILE, 'r') as f:
-                    data = json.load(f)
-                    # Handle both old format (list of chat_ids) and new format (dict with usernames)
-                    if isinstance(data, list):
-                        # Convert old format to new format
-                        self.users = {chat_id: None for chat_id in data}
-                        logger.info(f"Converted {len(data)} users from old format to new format")
-                    else:
-                        self.users = data
-                logger.info(f"Loaded {len(self.users)} users")
-            else:
-                self.users = {}
+            # Old-format user lists (plain chat_ids) are loaded with empty usernames
+            self.users = self.storage.load_namespace(self.users_namespace)
+            logger.info(f"Loaded {len(self.users)} users")
         except Exception as e:
             logger.error(f"Error loading users: {e}")
             self.users = {}  # Reset to empty dict on error
 
     def save_users(self):
+        """Persist the full users collection"""
         try:
-            with open(USERS_FILE, 'w') as f:
-                json.dump(self.users, f)
+            self.storage.replace_namespace(self.users_namespace, self.users)
             logger.info(f"Users saved successfully: {self.users}")
-            
-            # Verify the file was written correctly
-            if os.path.exists(USERS_FILE):
-                with open(USERS_FILE, 'r') as f:
-                    saved_data = f.read().strip()
-                    logger.info(f"Verification - users.json contains: {saved_data}")
-            else:
-                logger.error(f"Verification failed - {USERS_FILE} does not exist after save")
         except Exception as e:
             logger.error(f"Error saving users: {e}", exc_info=True)
 
@@ -66,7 +48,10 @@ class UserManager:
         """Add or update a user with optional username"""
         chat_id = str(chat_id)
         self.users[chat_id] = username
-        self.save_users()
+        try:
+            self.storage.put(self.users_namespace, chat_id, username)
+        except Exception as e:
+            logger.error(f"Error saving user {chat_id}: {e}", exc_info=True)
         if username:
             logger.info(f"Added/updated user: {chat_id} (username: {username})")
         else:
@@ -77,7 +62,10 @@ class UserManager:
         chat_id = str(chat_id)
         if chat_id in self.users:
             username = self.users.pop(chat_id)
-            self.save_users()
+            try:
+                self.storage.delete(self.users_namespace, chat_id)
+            except Exception as e:
+                logger.error(f"Error removing user {chat_id}: {e}", exc_info=True)
             if username:
                 logger.info(f"Removed user: {chat_id} (username: {username})")
             else:
@@ -99,22 +87,17 @@ class UserManager:
     def _load_rss_preferences(self):
         """Load RSS notification preferences"""
         try:
-            if os.path.exists(self.rss_preferences_file):
-                with open(self.rss_preferences_file, 'r') as f:
-                    self.rss_preferences = json.load(f)
-                logger.info(f"Loaded RSS preferences for {len(self.rss_preferences)} users")
-            else:
-                self.rss_preferences = {}
+            self.rss_preferences = self.storage.load_namespace(self.rss_preferences_namespace)
+            logger.info(f"Loaded RSS preferences for {len(self.rss_preferences)} users")
         except Exception as e:
             logger.error(f"Error loading RSS preferences: {e}")
             self.rss_preferences = {}
 
-    def _save_rss_preferences(self):
-        """Save RSS notification preferences"""
+    def _save_rss_preferences(self, chat_id):
+        """Save RSS notification preferences for one user"""
         try:
-            with open(self.rss_preferences_file, 'w') as f:
-                json.dump(self.rss_preferences, f, indent=2)
-            logger.info(f"Saved RSS preferences for {len(self.rss_preferences)} users")
+            self.storage.put(self.rss_preferences_namespace, chat_id, self.rss_preferences[chat_id])
+            logger.info(f"Saved RSS preferences for user {chat_id}")
         except Exception as e:
             logger.error(f"Error saving RSS preferences: {e}")
 
@@ -129,7 +112,7 @@ class UserManager:
         for feed in feeds:
             self.rss_preferences[chat_id][feed] = enabled
         
-        self._save_rss_preferences()
+        self._save_rss_preferences(chat_id)
         logger.info(f"RSS notifications {'enabled' if enabled else 'disabled'} for all feeds for user {chat_id}")
 
     def set_feed_preference(self, chat_id, feed_source, enabled):
@@ -150,7 +133,7 @@ class UserManager:
             self.rss_preferences[chat_id] = {}
         
         self.rss_preferences[chat_id][feed_source] = enabled
-        self._save_rss_preferences()
+        self._save_rss_preferences(chat_id)
         logger.info(f"{feed_source} RSS notifications {'enabled' if enabled else 'disabled'} for user {chat_id}")
 
     def get_rss_preference(self, chat_id):
@@ -208,25 +191,19 @@ class UserManager:
         return enabled_users
 
     def _load_notification_preferences(self):
-        """Load notification preferences from file"""
+        """Load notification preferences from storage"""
         try:
-            if os.path.exists(self.notification_preferences_file):
-                with open(self.notification_preferences_file, 'r') as f:
-                    self.notification_preferences = json.load(f)
-                logger.info(f"Loaded notification preferences for {len(self.notification_preferences)} users")
-            else:
-                self.notification_preferences = {}
+            self.notification_preferences = self.storage.load_namespace(self.notification_preferences_namespace)
+            logger.info(f"Loaded notification preferences for {len(self.notification_preferences)} users")
         except Exception as e:
             logger.error(f"Error loading notification preferences: {e}")
             self.notification_preferences = {}
 
-    def _save_notification_preferences(self):
-        """Save notification preferences to file"""
+    def _save_notification_preferences(self, chat_id):
+        """Save notification preferences for one user"""
         try:
-            os.makedirs(os.path.dirname(self.notification_preferences_file), exist_ok=True)
-            with open(self.notification_preferences_file, 'w') as f:
-                json.dump(self.notification_preferences, f, indent=2)
-            logger.info(f"Saved notification preferences for {len(self.notification_preferences)} users")
+            self.storage.put(self.notification_preferences_namespace, chat_id, self.notification_preferences[chat_id])
+            logger.info(f"Saved notification preferences for user {chat_id}")
         except Exception as e:
             logger.error(f"Error saving notification preferences: {e}")
 
@@ -241,7 +218,7 @@ class UserManager:
             }
         
         self.notification_preferences[chat_id][notification_type] = enabled
-        self._save_notification_preferences()
+        self._save_notification_preferences(chat_id)
         logger.info(f"{notification_type} notifications {'enabled' if enabled else 'disabled'} for user {chat_id}")
 
     def get_notification_preference(self, chat_id, notification_type):
@@ -270,25 +247,22 @@ class UserManager:
         return list(set(enabled_users))  # Remove duplicates
 
     def _load_user_states(self):
-        """Load user states from file"""
+        """Load user states from storage"""
         try:
-            if os.path.exists(self.user_states_file):
-                with open(self.user_states_file, 'r') as f:
-                    self.user_states = json.load(f)
-                logger.info(f"Loaded user states for {len(self.user_states)} users")
-            else:
-                self.user_states = {}
+            self.user_states = self.storage.load_namespace(self.user_states_namespace)
+            logger.info(f"Loaded user states for {len(self.user_states)} users")
         except Exception as e:
             logger.error(f"Error loading user states: {e}")
             self.user_states = {}
 
-    def _save_user_states(self):
-        """Save user states to file"""
+    def _save_user_state(self, chat_id):
+        """Save the state of one user, deleting it when cleared"""
         try:
-            os.makedirs(os.path.dirname(self.user_states_file), exist_ok=True)
-            with open(self.user_states_file, 'w') as f:
-                json.dump(self.user_states, f, indent=2)
-            logger.info(f"Saved user states for {len(self.user_states)} users")
+            if chat_id in self.user_states:
+                self.storage.put(self.user_states_namespace, chat_id, self.user_states[chat_id])
+            else:
+                self.storage.delete(self.user_states_namespace, chat_id)
+            logger.info(f"Saved user state for {chat_id}")
         except Exception as e:
             logger.error(f"Error saving user states: {e}")
 
@@ -296,7 +270,7 @@ class UserManager:
         """Set user state for interactive commands"""
         chat_id = str(chat_id)
         self.user_states[chat_id] = state
-        self._save_user_states()
+        self._save_user_state(chat_id)
         logger.info(f"Set user state for {chat_id}: {state}")
 
     def get_user_state(self, chat_id):
@@ -309,7 +283,7 @@ class UserManager:
         chat_id = str(chat_id)
         if chat_id in self.user_states:
             del self.user_states[chat_id]
-            self._save_user_states()
+            self._save_user_state(chat_id)
             logger.info(f"Cleared user state for {chat_id}")
 
     def has_user_state(self, chat_id, state=None):
@@ -332,7 +306,7 @@ class UserManager:
             self.user_states[chat_id] = {}
         
         self.user_states[chat_id][context_key] = value
-        self._save_user_states()
+        self._save_user_state(chat_id)
         logger.info(f"Set user context for {chat_id}: {key} = {value}")
 
     def get_user_context(self, chat_id, key):
@@ -355,5 +329,5 @@ class UserManager:
             context_key = f"context_{key}"
             if context_key in user_data:
                 del user_data[context_key]
-                self._save_user_states()
+                self._save_user_state(chat_id)
                 logger.info(f"Cleared user context for {chat_id}: {key}")
\ No newline at end of file
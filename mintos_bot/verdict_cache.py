@@ -0,0 +1,57 @@
+"""
+Verdict Cache for the Mintos Telegram Bot
+Persists the last LLM analysis per company together with a hash of the
+candidate results it was made for, so unchanged result sets are not sent
+to the model again.
+"""
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Iterable, Optional, Tuple
+from .storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+def candidate_digest(candidates: Iterable[Tuple[str, str, str]]) -> str:
+    """Hash an ordered set of (certainty, url, title) candidates
+
+    Order is kept because verdicts refer to candidates by position.
+    """
+    canonical = json.dumps([[certainty, url.strip(), title.strip()] for certainty, url, title in candidates],
+                           ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+class VerdictCache:
+    """Per-company verdict store, invalidated when the candidate set changes"""
+
+    def __init__(self, namespace: str = 'openai_verdicts', storage: Any = None):
+        """Initialize the cache and load persisted verdicts
+
+        Args:
+            namespace: Storage namespace holding ``company -> {'digest', 'analysis'}`` rows
+            storage: Storage backend, the process-wide backend by default
+        """
+        self.namespace = namespace
+        self.storage = storage or get_storage()
+        self.verdicts: Dict[str, Dict[str, Any]] = {}
+        try:
+            self.verdicts = self.storage.load_namespace(namespace)
+            logger.info(f"Loaded {len(self.verdicts)} cached verdicts from {namespace}")
+        except Exception as e:
+            logger.error(f"Error loading {namespace}: {e}", exc_info=True)
+
+    def get(self, company: str, digest: str) -> Optional[Dict[str, Any]]:
+        """Get the cached analysis for a company if it was made for the same candidates"""
+        row = self.verdicts.get(company)
+        if row and row.get('digest') == digest:
+            return row.get('analysis')
+        return None
+
+    def put(self, company: str, digest: str, analysis: Dict[str, Any]) -> None:
+        """Store the analysis made for a company's candidates"""
+        row = {'digest': digest, 'analysis': analysis}
+        self.verdicts[company] = row
+        try:
+            self.storage.put(self.namespace, company, row)
+        except Exception as e:
+            logger.error(f"Error saving verdict for {company}: {e}", exc_info=True)
@@ -0,0 +1,126 @@
+"""
+Local stub of the OpenAI and Brave APIs used by the news reader tests
+Serves chat completions, the files and batches endpoints of the Batch API
+and the Brave news search from an aiohttp app on a free local port.
+"""
+import json
+import re
+from typing import Any, Dict, List, Optional
+from aiohttp import web
+
+COMPANY_ID_RE = re.compile(r'=== Company (C\d+)')
+
+class APIStub:
+    """OpenAI and Brave API stub recording the requests it serves
+
+    Every company in a prompt is answered as relevant with its first
+    candidate selected. Brave searches return one article naming the
+    company for quoted queries and one unrelated article otherwise.
+    """
+
+    def __init__(self):
+        self.chat_requests: List[int] = []
+        self.search_requests: List[str] = []
+        self.files: Dict[str, str] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        # Set to False to complete batches without an output file
+        self.batch_output = True
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url = ''
+
+    @property
+    def openai_base(self) -> str:
+        return f"{self.base_url}/v1"
+
+    @property
+    def brave_url(self) -> str:
+        return f"{self.base_url}/res/v1/news/search"
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.add_routes([
+            web.post('/v1/chat/completions', self._chat),
+            web.post('/v1/files', self._upload),
+            web.get('/v1/files/{file_id}/content', self._file_content),
+            web.post('/v1/batches', self._create_batch),
+            web.get('/v1/batches/{batch_id}', self._get_batch),
+            web.get('/res/v1/news/search', self._search),
+        ])
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    async def close(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @staticmethod
+    def answer(prompt: str) -> str:
+        """Build the JSON verdict content for a single or batched prompt"""
+        company_ids = COMPANY_ID_RE.findall(prompt)
+        if company_ids:
+            return json.dumps({'companies': [
+                {'company_id': company_id, 'selected_index': 1, 'is_relevant': True,
+                 'content_summary': f'Summary for {company_id}', 'title': f'Selected {company_id}'}
+                for company_id in company_ids
+            ]})
+        return json.dumps({'selected_index': 1, 'is_relevant': True,
+                           'content_summary': 'Summary', 'title': 'Selected'})
+
+    @staticmethod
+    def _completion(content: str) -> Dict[str, Any]:
+        return {'choices': [{'message': {'role': 'assistant', 'content': content}}]}
+
+    async def _chat(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        prompt = body['messages'][-1]['content']
+        self.chat_requests.append(len(COMPANY_ID_RE.findall(prompt)) or 1)
+        return web.json_response(self._completion(self.answer(prompt)))
+
+    async def _upload(self, request: web.Request) -> web.Response:
+        data = await request.post()
+        file_id = f"file-{len(self.files) + 1}"
+        self.files[file_id] = data['file'].file.read().decode('utf-8')
+        return web.json_response({'id': file_id, 'purpose': data.get('purpose')})
+
+    async def _file_content(self, request: web.Request) -> web.Response:
+        lines = []
+        for line in self.files[request.match_info['file_id']].splitlines():
+            entry = json.loads(line)
+            prompt = entry['body']['messages'][-1]['content']
+            lines.append(json.dumps({
+                'custom_id': entry['custom_id'],
+                'response': {'status_code': 200, 'body': self._completion(self.answer(prompt))}
+            }))
+        return web.Response(text='\n'.join(lines))
+
+    async def _create_batch(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        batch_id = f"batch-{len(self.batches) + 1}"
+        output_file_id = None
+        if self.batch_output:
+            # Batch output is answered from the uploaded input file
+            output_file_id = body['input_file_id']
+        self.batches[batch_id] = {'id': batch_id, 'status': 'completed', 'output_file_id': output_file_id}
+        return web.json_response(self.batches[batch_id])
+
+    async def _get_batch(self, request: web.Request) -> web.Response:
+        return web.json_response(self.batches[request.match_info['batch_id']])
+
+    async def _search(self, request: web.Request) -> web.Response:
+        query = request.query['q']
+        self.search_requests.append(query)
+        name = query.split(',')[0]
+        if name.startswith('"'):
+            name = name.strip('"')
+            result = {'title': f'{name} reports quarterly results', 'description': f'{name} update'}
+        else:
+            result = {'title': 'Markets close higher', 'description': 'General market news'}
+        slug = re.sub(r'\W+', '-', query.lower()).strip('-')
+        result.update({'type': 'news_result', 'url': f'https://news.example.com/{slug}',
+                       'age': '1 day ago', 'page_age': '2024-01-01T00:00:00', 'meta_url': {}})
+        return web.json_response({'results': [result]})
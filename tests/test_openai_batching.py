@@ -0,0 +1,94 @@
+"""
+Tests for batched OpenAI news classification against the local API stub
+"""
+import asyncio
+import pytest
+
+from mintos_bot import openai_news, search_cache, storage
+from mintos_bot.http_client import get_http_client
+from mintos_bot.openai_news import BATCH_JOB_NAMESPACE, OpenAINewsReader
+from mintos_bot.rate_limiter import TokenBucket
+from mintos_bot.storage import JSONFileBackend
+from openai_stub import APIStub
+
+COMPANY_NAMES = [
+    'Alpha Lending', 'Beta Finance', 'Gamma Credit', 'Delta Loans', 'Epsilon Capital', 'Zeta Money',
+    'Eta Funding', 'Theta Credit', 'Iota Finance', 'Kappa Lending', 'Lambda Loans', 'Mu Capital'
+]
+
+@pytest.fixture
+def reader(tmp_path, monkeypatch):
+    """News reader for twelve companies with all state kept under tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    monkeypatch.setattr(storage, '_storage', JSONFileBackend(str(tmp_path / 'state')))
+    monkeypatch.setattr(search_cache, '_search_cache', None)
+    monkeypatch.setattr(openai_news, 'NEWS_BATCH_MAX_WAIT_SECONDS', 0.2)
+    news_reader = OpenAINewsReader()
+    news_reader.openai_api_key = 'test-openai-key'
+    news_reader.brave_reader.api_key = 'test-brave-key'
+    news_reader.brave_reader.limiter = TokenBucket(1000, capacity=100)
+    news_reader.companies = [
+        {'company_name': name, 'brief_description': '', 'country': 'DE'} for name in COMPANY_NAMES
+    ]
+    return news_reader
+
+def run_with_stub(monkeypatch, reader, scenario):
+    """Run scenario(stub) with the reader pointed at a fresh API stub"""
+    async def main():
+        stub = APIStub()
+        await stub.start()
+        monkeypatch.setattr(openai_news, 'OPENAI_API_BASE', stub.openai_base)
+        reader.brave_reader.base_url = stub.brave_url
+        try:
+            return await scenario(stub)
+        finally:
+            await get_http_client().close()
+            await stub.close()
+    return asyncio.run(main())
+
+def test_fetch_news_packs_companies_into_batched_requests(monkeypatch, reader):
+    async def scenario(stub):
+        items = await reader.fetch_news_by_days(7)
+        first_requests = list(stub.chat_requests)
+        stub.chat_requests.clear()
+        await reader.fetch_news_by_days(7)
+        return items, first_requests, list(stub.chat_requests)
+
+    items, first_requests, repeat_requests = run_with_stub(monkeypatch, reader, scenario)
+
+    assert [item.company_name for item in items] == COMPANY_NAMES
+    assert sum(first_requests) == len(COMPANY_NAMES)
+    assert len(first_requests) < len(COMPANY_NAMES)
+    assert max(first_requests) <= openai_news.NEWS_BATCH_SIZE
+    # Unchanged candidates are answered from the verdict cache
+    assert repeat_requests == []
+
+def test_batch_job_fills_verdict_cache(monkeypatch, reader):
+    async def scenario(stub):
+        batch_id = await reader.submit_batch_job(7)
+        stored = await reader.collect_batch_job()
+        items = await reader.fetch_news_by_days(7)
+        return batch_id, stored, items, list(stub.chat_requests), stub
+
+    batch_id, stored, items, chat_requests, stub = run_with_stub(monkeypatch, reader, scenario)
+
+    assert batch_id in stub.batches
+    assert stored == len(COMPANY_NAMES)
+    assert storage.get_storage().load_document(BATCH_JOB_NAMESPACE) == {}
+    assert [item.company_name for item in items] == COMPANY_NAMES
+    assert chat_requests == []
+
+def test_batch_without_output_is_discarded(monkeypatch, reader):
+    async def scenario(stub):
+        stub.batch_output = False
+        first_batch = await reader.submit_batch_job(7)
+        stored = await reader.collect_batch_job()
+        second_batch = await reader.submit_batch_job(7)
+        return first_batch, stored, second_batch
+
+    first_batch, stored, second_batch = run_with_stub(monkeypatch, reader, scenario)
+
+    assert stored == 0
+    # The discarded job no longer blocks the next submission
+    assert second_batch is not None and second_batch != first_batch
@@ -0,0 +1,20 @@
+"""
+Tests for the token bucket rate limiter
+"""
+import pytest
+
+from mintos_bot.rate_limiter import TokenBucket
+
+def test_overlapping_pauses_do_not_add_up():
+    bucket = TokenBucket(30)
+    for _ in range(30):
+        bucket.pause(10)
+    # Empty for 10 seconds, not 30 pauses back to back
+    assert bucket._tokens == pytest.approx(-10 * 30, abs=1)
+
+def test_longer_pause_extends_the_deadline():
+    bucket = TokenBucket(30)
+    bucket.pause(10)
+    bucket.pause(20)
+    bucket.pause(5)
+    assert bucket._tokens == pytest.approx(-20 * 30, abs=1)